@@ -0,0 +1,35 @@
+"""
+backend/alembic/versions/0002_oracle_state_version.py
+Add oracle_states.version for optimistic concurrency control.
+
+Revision ID: 0002_oracle_state_version
+Revises: 0001_game_state_version
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_oracle_state_version"
+down_revision = "0001_game_state_version"
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    if table not in inspector.get_table_names():
+        # Fresh database: init_db() creates the table with the column
+        return True
+    return column in {c["name"] for c in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    if not _has_column("oracle_states", "version"):
+        op.add_column(
+            "oracle_states",
+            sa.Column("version", sa.Integer(), nullable=False, server_default="1")
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("oracle_states", "version")
@@ -0,0 +1,46 @@
+"""
+backend/alembic/versions/0003_battle_log_entries.py
+Create the append-only battle_log_entries table.
+
+Revision ID: 0003_battle_log_entries
+Revises: 0002_oracle_state_version
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_battle_log_entries"
+down_revision = "0002_oracle_state_version"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "battle_log_entries" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "battle_log_entries",
+        sa.Column("id", sa.BigInteger(), primary_key=True),
+        sa.Column(
+            "oracle_state_id",
+            sa.Integer(),
+            sa.ForeignKey("oracle_states.id", ondelete="CASCADE"),
+            nullable=False
+        ),
+        sa.Column("battle_no", sa.Integer(), nullable=False),
+        sa.Column("turn", sa.SmallInteger(), nullable=False),
+        sa.Column("event", sa.SmallInteger(), nullable=False),
+        sa.Column("value", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index(
+        "ix_battle_log_battle",
+        "battle_log_entries",
+        ["oracle_state_id", "battle_no", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_battle_log_battle", table_name="battle_log_entries")
+    op.drop_table("battle_log_entries")
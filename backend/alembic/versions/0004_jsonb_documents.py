@@ -0,0 +1,58 @@
+"""
+backend/alembic/versions/0004_jsonb_documents.py
+Convert frequently patched JSON documents to JSONB so they can be updated with
+jsonb_set / || instead of full rewrites.
+
+Revision ID: 0004_jsonb_documents
+Revises: 0003_battle_log_entries
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0004_jsonb_documents"
+down_revision = "0003_battle_log_entries"
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ("game_states", "weapons"),
+    ("game_states", "potions"),
+    ("game_states", "world_state"),
+    ("oracle_states", "puzzle_state"),
+]
+
+
+def _column_type(table: str, column: str):
+    inspector = sa.inspect(op.get_bind())
+    if table not in inspector.get_table_names():
+        return None
+    for c in inspector.get_columns(table):
+        if c["name"] == column:
+            return c["type"]
+    return None
+
+
+def upgrade() -> None:
+    for table, column in COLUMNS:
+        current = _column_type(table, column)
+        if current is None or isinstance(current, postgresql.JSONB):
+            continue
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb"
+        )
+
+
+def downgrade() -> None:
+    for table, column in COLUMNS:
+        if isinstance(_column_type(table, column), postgresql.JSONB):
+            op.alter_column(
+                table,
+                column,
+                type_=sa.JSON(),
+                postgresql_using=f"{column}::json"
+            )
@@ -0,0 +1,43 @@
+"""
+backend/alembic/versions/0005_archived_games.py
+Create the archived_games index of games moved to object storage.
+
+Revision ID: 0005_archived_games
+Revises: 0004_jsonb_documents
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005_archived_games"
+down_revision = "0004_jsonb_documents"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "archived_games" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "archived_games",
+        sa.Column("game_id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "player_id",
+            sa.Integer(),
+            sa.ForeignKey("players.id", ondelete="CASCADE"),
+            nullable=False
+        ),
+        sa.Column("object_key", sa.String(255), nullable=False),
+        sa.Column("schema_version", sa.SmallInteger(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("is_completed", sa.Boolean(), server_default=sa.false()),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_archived_games_player_id", "archived_games", ["player_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_archived_games_player_id", table_name="archived_games")
+    op.drop_table("archived_games")
@@ -0,0 +1,52 @@
+"""
+backend/alembic/versions/0006_game_event_log.py
+Create the game_events log and game_snapshots tables.
+
+Revision ID: 0006_game_event_log
+Revises: 0005_archived_games
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0006_game_event_log"
+down_revision = "0005_archived_games"
+branch_labels = None
+depends_on = None
+
+
+def _game_fk():
+    return sa.ForeignKey("game_states.id", ondelete="CASCADE")
+
+
+def upgrade() -> None:
+    tables = sa.inspect(op.get_bind()).get_table_names()
+
+    if "game_events" not in tables:
+        op.create_table(
+            "game_events",
+            sa.Column("id", sa.BigInteger(), primary_key=True),
+            sa.Column("game_state_id", sa.Integer(), _game_fk(), nullable=False),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.Column("event_type", sa.SmallInteger(), nullable=False),
+            sa.Column("payload", postgresql.JSONB(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.UniqueConstraint("game_state_id", "version", name="uq_game_events_version"),
+        )
+
+    if "game_snapshots" not in tables:
+        op.create_table(
+            "game_snapshots",
+            sa.Column("id", sa.BigInteger(), primary_key=True),
+            sa.Column("game_state_id", sa.Integer(), _game_fk(), nullable=False),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.Column("payload", sa.LargeBinary(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.UniqueConstraint("game_state_id", "version", name="uq_game_snapshots_version"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("game_snapshots")
+    op.drop_table("game_events")
@@ -0,0 +1,56 @@
+"""
+backend/alembic/versions/0007_puzzle_bank.py
+Create the puzzle_bank table and the per-player puzzle_bank_seen bitmaps.
+
+Revision ID: 0007_puzzle_bank
+Revises: 0006_game_event_log
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0007_puzzle_bank"
+down_revision = "0006_game_event_log"
+branch_labels = None
+depends_on = None
+
+
+def _oracle_fk():
+    return sa.ForeignKey("oracles.id", ondelete="CASCADE")
+
+
+def upgrade() -> None:
+    tables = sa.inspect(op.get_bind()).get_table_names()
+
+    if "puzzle_bank" not in tables:
+        op.create_table(
+            "puzzle_bank",
+            sa.Column("id", sa.BigInteger(), primary_key=True),
+            sa.Column("oracle_id", sa.Integer(), _oracle_fk(), nullable=False),
+            sa.Column("puzzle_type", sa.String(50), nullable=False),
+            sa.Column("difficulty", sa.SmallInteger(), nullable=False),
+            sa.Column("slot", sa.Integer(), nullable=False),
+            sa.Column("content_hash", sa.LargeBinary(16), nullable=False),
+            sa.Column("puzzle", postgresql.JSONB(), nullable=False),
+            sa.Column("uses", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("solves", sa.Integer(), nullable=False, server_default="0"),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.UniqueConstraint("oracle_id", "puzzle_type", "difficulty", "slot", name="uq_puzzle_bank_slot"),
+            sa.UniqueConstraint("oracle_id", "puzzle_type", "difficulty", "content_hash", name="uq_puzzle_bank_content"),
+        )
+
+    if "puzzle_bank_seen" not in tables:
+        op.create_table(
+            "puzzle_bank_seen",
+            sa.Column("player_id", sa.Integer(), sa.ForeignKey("players.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("oracle_id", sa.Integer(), _oracle_fk(), primary_key=True),
+            sa.Column("puzzle_type", sa.String(50), primary_key=True),
+            sa.Column("difficulty", sa.SmallInteger(), primary_key=True),
+            sa.Column("bitmap", sa.LargeBinary(), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("puzzle_bank_seen")
+    op.drop_table("puzzle_bank")
@@ -12,6 +12,8 @@ from app.agents.base_oracle import BaseOracle
 class AresionAgent(BaseOracle):
     """Oracle of War and Conflict"""
     
+    puzzle_type = "tactical_combat"
+    
     async def generate_puzzle(self, difficulty: int, player_context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate combat-focused puzzle"""
         prompt = f"""Generate a tactical combat puzzle for Aresion.
@@ -15,6 +15,8 @@ from app.llm.prompts import PromptTemplates
 class AthenaiaAgent(BaseOracle):
     """Oracle of Wisdom and Strategy - master tactician"""
     
+    puzzle_type = "strategic_positioning"
+    
     async def generate_puzzle(
         self,
         difficulty: int,
@@ -22,28 +24,10 @@ class AthenaiaAgent(BaseOracle):
     ) -> Dict[str, Any]:
         """
         Generate strategic puzzle.
-        STEP: Creates chess-like tactical challenges.
+        STEP: Procedural positioning board (one banner per row and column, blocked
+        cells, a unique placement).
         """
-        prompt = f"""Generate a strategic puzzle for Athenaia, Oracle of Wisdom.
-
-Difficulty: {difficulty}/13
-Player has defeated: {player_context.get('oracles_defeated', 0)} oracles
-
-Create a tactical positioning puzzle where the player must optimize resource placement.
-
-Return JSON:
-{{
-    "puzzle_type": "strategic_positioning",
-    "description": "puzzle description",
-    "board_size": "grid dimensions",
-    "pieces": ["list of pieces"],
-    "solution": "optimal configuration",
-    "hints": ["tactical hints"],
-    "difficulty": {difficulty}
-}}"""
-        
-        puzzle_json = await self.llm.generate(prompt, json_mode=True)
-        puzzle = json.loads(puzzle_json)
+        puzzle = await self.procedural_puzzle(self.puzzle_type, difficulty)
         
         # Add Athenaia-specific mechanics
         puzzle["strategic_depth"] = difficulty
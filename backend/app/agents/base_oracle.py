@@ -7,10 +7,17 @@ Abstract base class defining oracle agent interface and common functionality.
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import asyncio
 
+from app.config import settings
 from app.llm.adapter import LLMAdapter
 from app.memory.vector_store import VectorMemory
 from app.llm.prompts import PromptTemplates
+from app.simulation.predictor import battle_predictor
+from app.agents.tactical_policy import TacticalPolicy
+from app.puzzles.generators import generate_puzzle
+from app.cache.puzzle_flavor import puzzle_flavor_cache
+from app.utils.metrics import PUZZLES_GENERATED
 
 
 class BaseOracle(ABC):
@@ -19,6 +26,9 @@ class BaseOracle(ABC):
     STEP: Defines common oracle behavior, memory access, LLM integration.
     """
     
+    # Puzzle type (and bank bucket key); each oracle sets its own, procedural types are never banked
+    puzzle_type = "riddle"
+    
     def __init__(
         self,
         name: str,
@@ -32,6 +42,7 @@ class BaseOracle(ABC):
         self.personality = personality_config
         self.llm = llm_adapter
         self.memory = vector_memory
+        self.tactics = TacticalPolicy(personality_config)
         
         # Agent state
         self.current_phase = "inactive"
@@ -61,6 +72,42 @@ class BaseOracle(ABC):
         """
         pass
     
+    async def procedural_puzzle(
+        self,
+        puzzle_type: str,
+        difficulty: int,
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Build a structured puzzle without an LLM round trip.
+        STEP: Seeded procedural generator tuned by difficulty; with PUZZLE_FLAVOR_TEXT
+        the oracle's in-character introduction is added from the flavor cache (written
+        by the LLM on the first miss, bounded by PUZZLE_FLAVOR_TIMEOUT_SECONDS).
+        """
+        puzzle = generate_puzzle(puzzle_type, difficulty, seed)
+        PUZZLES_GENERATED.labels(puzzle_type=puzzle_type).inc()
+        if not settings.PUZZLE_FLAVOR_TEXT:
+            return puzzle
+        
+        difficulty = puzzle["difficulty"]
+        flavor = await puzzle_flavor_cache.get(self.name, puzzle_type, difficulty)
+        if flavor is None:
+            prompt = PromptTemplates.puzzle_flavor_prompt(self.name, self.domain, puzzle_type, difficulty)
+            try:
+                flavor = (await asyncio.wait_for(
+                    self.llm.generate(prompt, temperature=0.8),
+                    timeout=settings.PUZZLE_FLAVOR_TIMEOUT_SECONDS
+                )).strip()
+            except Exception as e:
+                print(f"Puzzle flavor text failed for {self.name}: {e}")
+                return puzzle
+            if flavor:
+                await puzzle_flavor_cache.put(self.name, puzzle_type, difficulty, flavor)
+        
+        if flavor:
+            puzzle["flavor"] = flavor
+        return puzzle
+    
     async def respond_to_player(
         self,
         player_message: str,
@@ -70,12 +117,20 @@ class BaseOracle(ABC):
         Generate response to player interaction.
         STEP: Uses LLM to create personality-driven dialogue.
         """
-        # Retrieve relevant memories
-        relevant_memories = await self.memory.retrieve_relevant_memories(
+        # Retrieve memories relevant to the message, topped up with the challenge
+        # memories warmed by the prefetcher (deduplicated, message matches first)
+        relevant_memories = await self.memory.retrieve_ranked_memories(
             self.name,
             player_message,
             limit=3
         )
+        seen = {mem["content"] for mem in relevant_memories}
+        for mem in game_context.get("prefetched_memories") or []:
+            if len(relevant_memories) >= 5:
+                break
+            if mem["content"] not in seen:
+                seen.add(mem["content"])
+                relevant_memories.append(mem)
         
         memory_context = "\n".join([
             f"- {mem['content']}" for mem in relevant_memories
@@ -87,6 +142,13 @@ Previous interactions: {self.interaction_count}
 Relevant memories:
 {memory_context}"""
         
+        player_patterns = game_context.get("player_patterns")
+        if player_patterns:
+            pattern_context = "\n".join([
+                f"- {p['pattern_type']}: {p['description']}" for p in player_patterns
+            ])
+            situation += f"\nKnown player tendencies:\n{pattern_context}"
+        
         prompt = PromptTemplates.oracle_personality_prompt(
             self.name,
             self.domain,
@@ -114,23 +176,49 @@ Relevant memories:
     ) -> str:
         """
         Decide combat action.
-        STEP: Uses LLM for strategic battle decisions.
+        STEP: Local expectimax search over the combat engine within the tactical time
+        budget, run in a worker thread; no LLM call.
         """
-        available_actions = ["attack", "defend", "special_ability", "tactical_retreat"]
-        
-        prompt = PromptTemplates.tactical_decision_prompt(
-            self.name,
-            battle_state,
-            available_actions
-        )
-        
-        decision = await self.llm.generate(prompt, temperature=0.3)
-        decision = decision.strip().lower()
+        if not battle_state.get("player_units"):
+            return "attack"
         
-        if decision not in available_actions:
-            decision = "attack"  # Default fallback
+        try:
+            return await asyncio.to_thread(self.tactics.decide, battle_state)
+        except Exception as e:
+            print(f"Tactical search failed for {self.name}: {e}")
+            return "attack"  # Default fallback
+    
+    async def describe_tactical_decision(
+        self,
+        battle_state: Dict[str, Any],
+        action: str,
+        prediction: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Optional in-character line announcing a decided action.
+        STEP: LLM flavor text bounded by TACTICAL_FLAVOR_TIMEOUT_SECONDS, informed by
+        a Monte Carlo outlook of the battle; None on timeout or failure.
+        """
+        if prediction is None and battle_state.get("player_units"):
+            try:
+                prediction = await asyncio.to_thread(
+                    battle_predictor.predict_battle_state,
+                    battle_state,
+                    settings.BATTLE_PREDICTION_TACTICAL_SIMULATIONS
+                )
+            except Exception as e:
+                print(f"Battle prediction failed for {self.name}: {e}")
         
-        return decision
+        prompt = PromptTemplates.tactical_flavor_prompt(self.name, battle_state, action, prediction)
+        try:
+            line = await asyncio.wait_for(
+                self.llm.generate(prompt, temperature=0.8),
+                timeout=settings.TACTICAL_FLAVOR_TIMEOUT_SECONDS
+            )
+        except Exception as e:
+            print(f"Tactical flavor text failed for {self.name}: {e}")
+            return None
+        return line.strip() or None
     
     async def propose_rule_change(
         self,
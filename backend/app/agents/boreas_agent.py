@@ -12,6 +12,8 @@ from app.agents.base_oracle import BaseOracle
 class BoreasAgent(BaseOracle):
     """Oracle of Winter Storms"""
     
+    puzzle_type = "frozen_sequence"
+    
     async def generate_puzzle(self, difficulty: int, player_context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate ice puzzle"""
         prompt = f"""Generate a winter puzzle for Boreas.
@@ -4,16 +4,16 @@ backend/app/agents/chronos_agent.py
 STEP: Chronos (Time) Oracle Agent
 Specializes in time manipulation, rewinds, temporal paradoxes.
 """
-from typing import Dict, Any
-import json
+from typing import Dict, Any, Awaitable, Callable, Optional
 
 from app.agents.base_oracle import BaseOracle
-from app.llm.prompts import PromptTemplates
 
 
 class ChronosAgent(BaseOracle):
     """Oracle of Time and Fate - manipulates temporal mechanics"""
     
+    puzzle_type = "temporal_sequence"
+    
     async def generate_puzzle(
         self,
         difficulty: int,
@@ -21,17 +21,9 @@ class ChronosAgent(BaseOracle):
     ) -> Dict[str, Any]:
         """
         Generate time-based puzzle.
-        STEP: Creates sequence/causality puzzles with LLM assistance.
+        STEP: Procedural temporal sequence (drifting clock readings).
         """
-        prompt = PromptTemplates.puzzle_generation_prompt(
-            self.name,
-            difficulty,
-            "temporal_sequence",
-            player_context
-        )
-        
-        puzzle_json = await self.llm.generate(prompt, json_mode=True)
-        puzzle = json.loads(puzzle_json)
+        puzzle = await self.procedural_puzzle(self.puzzle_type, difficulty)
         
         # Add Chronos-specific mechanics
         puzzle["time_limit"] = max(60, 300 - (difficulty * 20))  # Decreasing time
@@ -73,23 +65,45 @@ class ChronosAgent(BaseOracle):
     
     async def special_ability_rewind(
         self,
-        game_state: Dict[str, Any]
+        game_state: Dict[str, Any],
+        rewind: Optional[Callable[[int], Awaitable[int]]] = None
     ) -> Dict[str, Any]:
         """
         Chronos special: Rewind last player action.
-        STEP: Cancels player's most recent reward or progress.
+        STEP: `rewind(steps)` applies the rewind and returns the new game version
+        (bind it to GameEventService.rewind for the game); the player is only told
+        their action was undone once it has been.
         """
+        version = game_state.get("version")
+        new_version = None
+        if rewind is not None and version and version > 1:
+            try:
+                new_version = await rewind(1)
+            except ValueError as e:
+                print(f"Temporal rewind failed: {e}")
+        
+        if new_version is None:
+            return {
+                "ability": "temporal_rewind",
+                "message": f"{self.name} reaches for the threads of time, but they slip away.",
+                "effect": None,
+                "rewound": False
+            }
+        
         result = {
             "ability": "temporal_rewind",
             "message": f"{self.name} manipulates time! Your last action is undone.",
-            "effect": "last_reward_cancelled"
+            "effect": "last_action_undone",
+            "rewound": True,
+            "rewound_from_version": version,
+            "version": new_version
         }
         
         await self.memory.store_memory(
             self.name,
             "special_ability",
             "Used Temporal Rewind",
-            f"Cancelled player progress",
+            f"Undid the player's action at game version {version}",
             importance=0.8
         )
         
@@ -6,21 +6,16 @@ STEP: DelphiX (Prophecy) Oracle Agent
 Predicts moves, precognition, foresight.
 """
 from typing import Dict, Any
-import json
 from app.agents.base_oracle import BaseOracle
 
 class DelphiXAgent(BaseOracle):
     """Oracle of Prophecy and Foresight"""
     
+    puzzle_type = "pattern"
+    
     async def generate_puzzle(self, difficulty: int, player_context: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate prophecy puzzle"""
-        prompt = f"""Generate a prophecy puzzle for DelphiX.
-Difficulty: {difficulty}/13
-Player must predict future states or sequences.
-Return JSON with: puzzle_type, description, timeline, prophecy_clues, solution"""
-        
-        puzzle_json = await self.llm.generate(prompt, json_mode=True)
-        puzzle = json.loads(puzzle_json)
+        """Generate prophecy puzzle (procedural pattern: predict the next value)"""
+        puzzle = await self.procedural_puzzle(self.puzzle_type, difficulty)
         puzzle["prophecy_active"] = True
         return puzzle
     
@@ -12,6 +12,8 @@ from app.agents.base_oracle import BaseOracle
 class EchoAgent(BaseOracle):
     """Oracle of Sound and Voice"""
     
+    puzzle_type = "sound_pattern"
+    
     async def generate_puzzle(self, difficulty: int, player_context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate audio puzzle"""
         prompt = f"""Generate a sound-based puzzle for Echo.
@@ -12,6 +12,8 @@ from app.agents.base_oracle import BaseOracle
 class GaiaAgent(BaseOracle):
     """Oracle of Earth and Growth"""
     
+    puzzle_type = "growth_pattern"
+    
     async def generate_puzzle(self, difficulty: int, player_context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate earth-based puzzle"""
         prompt = f"""Generate a living earth puzzle for Gaia.
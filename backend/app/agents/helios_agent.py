@@ -12,6 +12,8 @@ from app.agents.base_oracle import BaseOracle
 class HeliosAgent(BaseOracle):
     """Oracle of Solar Fire"""
     
+    puzzle_type = "light_and_shadow"
+    
     async def generate_puzzle(self, difficulty: int, player_context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate light-based puzzle"""
         prompt = f"""Generate a solar puzzle for Helios.
@@ -3,16 +3,16 @@
 #Specializes in deception, lies 50% of the time, hides critical information.
 
 from typing import Dict, Any
-import json
 import random
 
 from app.agents.base_oracle import BaseOracle
-from app.llm.prompts import PromptTemplates
 
 
 class NyxAgent(BaseOracle):
     """Oracle of Night and Shadows - master of deception"""
     
+    puzzle_type = "shadow_maze"
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.lie_probability = 0.5
@@ -25,17 +25,10 @@ class NyxAgent(BaseOracle):
     ) -> Dict[str, Any]:
         """
         Generate shadow/deception puzzle with false clues.
-        STEP: Creates puzzles with hidden truths and misleading information.
+        STEP: Procedural shadow maze (always solvable, dead-end false paths), with
+        misleading information on top.
         """
-        prompt = PromptTemplates.puzzle_generation_prompt(
-            self.name,
-            difficulty,
-            "shadow_maze",
-            player_context
-        )
-        
-        puzzle_json = await self.llm.generate(prompt, json_mode=True)
-        puzzle = json.loads(puzzle_json)
+        puzzle = await self.procedural_puzzle(self.puzzle_type, difficulty)
         
         # Add Nyx-specific deception mechanics
         puzzle["false_clues"] = [
@@ -9,12 +9,25 @@ from typing import Dict, Any, List, Optional
 import asyncio
 from datetime import datetime
 
+from app.config import settings
 from app.llm.adapter import LLMAdapter
 from app.memory.vector_store import VectorMemory
+from app.agents.base_oracle import BaseOracle
 from app.agents.chronos_agent import ChronosAgent
 from app.agents.nyx_agent import NyxAgent
 from app.agents.athenaia_agent import AthenaiaAgent
-# Import other agents...
+from app.agents.aresion_agent import AresionAgent
+from app.agents.boreas_agent import BoreasAgent
+from app.agents.delphix_agent import DelphiXAgent
+from app.agents.echo_agent import EchoAgent
+from app.agents.gaia_agent import GaiaAgent
+from app.agents.helios_agent import HeliosAgent
+from app.agents.proteus_agent import ProteusAgent
+from app.agents.selene_agent import SeleneAgent
+from app.agents.themis_agent import ThemisAgent
+from app.agents.typhon_agent import TyphonAgent
+from app.cache.prefetch import phase_prefetcher
+from app.cache.catalog import catalog_cache
 
 
 class AgentOrchestrator:
@@ -66,7 +79,106 @@ class AgentOrchestrator:
                 },
                 "class": AthenaiaAgent
             },
-            # Add other agents with BaseOracle as default
+            "Proteus": {
+                "domain": "Illusion and Transformation",
+                "personality": {
+                    "cunning": 8,
+                    "deception": 9,
+                    "honor": 4,
+                    "wisdom": 6
+                },
+                "class": ProteusAgent
+            },
+            "Aresion": {
+                "domain": "War and Conflict",
+                "personality": {
+                    "cunning": 6,
+                    "deception": 4,
+                    "honor": 7,
+                    "wisdom": 5
+                },
+                "class": AresionAgent
+            },
+            "Helios": {
+                "domain": "Solar Fire",
+                "personality": {
+                    "cunning": 5,
+                    "deception": 3,
+                    "honor": 8,
+                    "wisdom": 7
+                },
+                "class": HeliosAgent
+            },
+            "Boreas": {
+                "domain": "Winter Storms",
+                "personality": {
+                    "cunning": 6,
+                    "deception": 5,
+                    "honor": 6,
+                    "wisdom": 7
+                },
+                "class": BoreasAgent
+            },
+            "Gaia": {
+                "domain": "Earth and Growth",
+                "personality": {
+                    "cunning": 5,
+                    "deception": 4,
+                    "honor": 8,
+                    "wisdom": 8
+                },
+                "class": GaiaAgent
+            },
+            "Themis": {
+                "domain": "Law and Balance",
+                "personality": {
+                    "cunning": 7,
+                    "deception": 2,
+                    "honor": 10,
+                    "wisdom": 9
+                },
+                "class": ThemisAgent
+            },
+            "Echo": {
+                "domain": "Sound and Voice",
+                "personality": {
+                    "cunning": 7,
+                    "deception": 8,
+                    "honor": 5,
+                    "wisdom": 6
+                },
+                "class": EchoAgent
+            },
+            "Selene": {
+                "domain": "Moon and Dreams",
+                "personality": {
+                    "cunning": 8,
+                    "deception": 7,
+                    "honor": 6,
+                    "wisdom": 8
+                },
+                "class": SeleneAgent
+            },
+            "DelphiX": {
+                "domain": "Prophecy and AI",
+                "personality": {
+                    "cunning": 9,
+                    "deception": 6,
+                    "honor": 5,
+                    "wisdom": 10
+                },
+                "class": DelphiXAgent
+            },
+            "Typhon": {
+                "domain": "Chaos and Destruction",
+                "personality": {
+                    "cunning": 10,
+                    "deception": 10,
+                    "honor": 1,
+                    "wisdom": 8
+                },
+                "class": TyphonAgent
+            }
         }
         
         for name, config in agent_configs.items():
@@ -118,27 +230,48 @@ class AgentOrchestrator:
         STEP: Initiates puzzle generation, sets up battle, manages phases.
         """
         phase = challenge_data.get("phase", "exploration")
+        game_id = challenge_data.get("game_id")
         
         if phase == "puzzle":
-            puzzle = await agent.generate_puzzle(
-                challenge_data.get("difficulty", 5),
-                challenge_data.get("player_context", {})
-            )
+            # Same source as the prefetch key (the oracle's catalog difficulty)
+            oracle = catalog_cache.current.oracle_by_name(agent.name)
+            difficulty = oracle.difficulty_level if oracle else challenge_data.get("difficulty", 5)
+            puzzle = await phase_prefetcher.consume(game_id, agent.name, f"puzzle:{difficulty}")
+            if puzzle is None:
+                puzzle = await agent.generate_puzzle(
+                    difficulty,
+                    challenge_data.get("player_context", {})
+                )
             return {"type": "puzzle", "data": puzzle}
         
         elif phase == "diplomacy":
             player_message = challenge_data.get("message", "")
+            game_context = dict(challenge_data.get("game_context", {}))
+            
+            memories = await phase_prefetcher.consume(game_id, agent.name, "memories")
+            if memories is not None:
+                game_context["prefetched_memories"] = memories
+            patterns = await phase_prefetcher.consume(game_id, agent.name, "player_patterns")
+            if patterns:
+                game_context["player_patterns"] = patterns
+            
             response = await agent.respond_to_player(
                 player_message,
-                challenge_data.get("game_context", {})
+                game_context
             )
             return {"type": "dialogue", "response": response}
         
         elif phase == "battle":
-            decision = await agent.make_tactical_decision(
-                challenge_data.get("battle_state", {})
-            )
-            return {"type": "tactical_decision", "action": decision}
+            battle_state = challenge_data.get("battle_state", {})
+            decision = await agent.make_tactical_decision(battle_state)
+            result = {"type": "tactical_decision", "action": decision}
+            if settings.TACTICAL_FLAVOR_TEXT and challenge_data.get("flavor"):
+                result["flavor"] = await agent.describe_tactical_decision(
+                    battle_state,
+                    decision,
+                    challenge_data.get("prediction")
+                )
+            return result
         
         return {"type": "unknown_phase"}
     
@@ -15,6 +15,8 @@ from app.agents.base_oracle import BaseOracle
 class ProteusAgent(BaseOracle):
     """Oracle of Illusion and Transformation"""
     
+    puzzle_type = "shifting_rules"
+    
     async def generate_puzzle(self, difficulty: int, player_context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate shape-shifting puzzle"""
         prompt = f"""Generate a transformation puzzle for Proteus.
@@ -12,6 +12,8 @@ from app.agents.base_oracle import BaseOracle
 class SeleneAgent(BaseOracle):
     """Oracle of Moon and Dreams"""
     
+    puzzle_type = "dream_layers"
+    
     async def generate_puzzle(self, difficulty: int, player_context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate dream sequence puzzle"""
         prompt = f"""Generate a dream puzzle for Selene.
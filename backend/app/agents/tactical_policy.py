@@ -0,0 +1,120 @@
+"""
+backend/app/agents/tactical_policy.py
+STEP: Oracle Tactical Search
+Local battle decisions for oracle agents: a one-ply expectimax over the
+oracle's stance, with the player's stance as a chance node and sampled damage
+rolls, each branch played out a few turns on the vectorized combat engine.
+Runs within a fixed time budget and needs no LLM call.
+"""
+from typing import Any, Dict, Mapping, Optional
+import time
+
+import numpy as np
+
+from app.config import settings
+from app.simulation.combat_engine import (
+    CombatEngine,
+    battle_state_armies,
+    stack_armies,
+    STANCE_ATTACK,
+    STANCE_DEFEND,
+    STANCE_SPECIAL,
+    STATUS_VICTORY,
+    STATUS_DEFEAT,
+)
+from app.simulation.policies import player_stances, oracle_stances
+
+STANCES = (STANCE_ATTACK, STANCE_DEFEND, STANCE_SPECIAL)
+STANCE_ACTIONS = {STANCE_ATTACK: "attack", STANCE_DEFEND: "defend", STANCE_SPECIAL: "special_ability"}
+
+
+class TacticalPolicy:
+    """
+    Personality-parameterized stance search for one oracle.
+    STEP: Aggression weighs damage dealt against damage taken, cunning moves the
+    player model from uniform play towards its best reply, honor favours the
+    plain attack and rules out tactical retreats.
+    """
+
+    def __init__(
+        self,
+        personality: Mapping[str, Any],
+        budget_ms: Optional[float] = None,
+        rollouts: Optional[int] = None,
+        horizon: Optional[int] = None
+    ):
+        self.personality = personality
+        self.aggression = min(max(float(personality.get("aggression", 5)), 0.0), 10.0) / 10
+        self.cunning = min(max(float(personality.get("cunning", 5)), 0.0), 10.0) / 10
+        self.honor = min(max(float(personality.get("honor", 5)), 0.0), 10.0) / 10
+        self.budget_ms = budget_ms or settings.TACTICAL_SEARCH_BUDGET_MS
+        self.rollouts = rollouts or settings.TACTICAL_SEARCH_ROLLOUTS
+        self.horizon = horizon or settings.TACTICAL_SEARCH_HORIZON
+
+    def evaluate(self, battle_state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Expected value of each oracle stance (CPU-bound; call from a worker thread).
+        STEP: Every batch covers all 3 x 3 (oracle, player) stance pairs with
+        `rollouts` sampled battles each; batches repeat until the time budget is
+        spent (at least one, at most TACTICAL_SEARCH_MAX_BATCHES).
+        """
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        player, enemy = battle_state_armies(battle_state)
+        player, enemy = stack_armies([player]), stack_armies([enemy])
+        rng = np.random.default_rng([battle_state.get("seed", 0), battle_state.get("turn", 1)])
+
+        n = self.rollouts
+        pairs = len(STANCES) ** 2
+        oracle_stance = np.repeat(np.array(STANCES, dtype=np.int8), len(STANCES) * n)
+        player_stance = np.tile(np.repeat(np.array(STANCES, dtype=np.int8), n), len(STANCES))
+
+        totals = np.zeros((len(STANCES), len(STANCES)))
+        batches = 0
+        while True:
+            engine = CombatEngine(
+                np.repeat(player, pairs * n, axis=0),
+                np.repeat(enemy, pairs * n, axis=0),
+                rng=rng
+            )
+            start = engine.strength()
+            engine.step(player_stance, oracle_stance)
+            for _ in range(self.horizon - 1):
+                if not engine.active.any():
+                    break
+                engine.step(player_stances("balanced", engine), oracle_stances(self.personality, engine))
+
+            totals += self._value(engine, start).reshape(len(STANCES), len(STANCES), n).sum(axis=2)
+            batches += 1
+            if batches >= settings.TACTICAL_SEARCH_MAX_BATCHES or time.perf_counter() >= deadline:
+                break
+
+        q = totals / (batches * n)  # q[oracle stance, player stance]
+        # Chance node over the player's reply: uniform for naive oracles, worst case for cunning ones
+        expected = (1 - self.cunning) * q.mean(axis=1) + self.cunning * q.min(axis=1)
+        expected[STANCES.index(STANCE_ATTACK)] += 0.02 * self.honor
+        return {
+            "values": expected,
+            "rollouts": batches * n * pairs,
+            "strength": (float(start[0][0]), float(start[1][0])),
+        }
+
+    def _value(self, engine: CombatEngine, start) -> np.ndarray:
+        """Oracle-side score per battle: weighted damage race plus a terminal bonus"""
+        player, enemy = engine.strength()
+        dealt = start[0] - player
+        taken = start[1] - enemy
+        value = (0.5 + self.aggression) * dealt - (1.5 - self.aggression) * taken
+        value[engine.status == STATUS_DEFEAT] += 1.0
+        value[engine.status == STATUS_VICTORY] -= 1.0
+        return value
+
+    def decide(self, battle_state: Dict[str, Any]) -> str:
+        """Best action name for the oracle's next turn"""
+        evaluation = self.evaluate(battle_state)
+        stance = STANCES[int(np.argmax(evaluation["values"]))]
+        if stance == STANCE_DEFEND and self.honor < 0.5:
+            # Dishonourable oracles fall back rather than hold when they are losing
+            player, enemy = evaluation["strength"]
+            if enemy < player * 0.5:
+                return "tactical_retreat"
+        return STANCE_ACTIONS[stance]
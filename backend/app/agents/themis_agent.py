@@ -12,6 +12,8 @@ from app.agents.base_oracle import BaseOracle
 class ThemisAgent(BaseOracle):
     """Oracle of Law and Balance"""
     
+    puzzle_type = "moral_dilemma"
+    
     async def generate_puzzle(self, difficulty: int, player_context: Dict[str, Any]) -> Dict[str, Any]:
         """Generate moral dilemma puzzle"""
         prompt = f"""Generate a justice puzzle for Themis.
@@ -24,6 +26,12 @@ Return JSON with: puzzle_type, description, choices, consequences, just_solution
         puzzle["moral_tracking"] = True
         return puzzle
     
+    async def modify_puzzle_rules(self, base_puzzle: Dict[str, Any]) -> Dict[str, Any]:
+        """Bind the player to their earlier verdicts"""
+        modified = base_puzzle.copy()
+        modified["contradictions_punished"] = True
+        return modified
+    
     async def judge_player_actions(self, player_history: list) -> Dict[str, Any]:
         """Analyze for moral contradictions"""
         contradictions = []
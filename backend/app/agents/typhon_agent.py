@@ -13,6 +13,8 @@ from app.agents.base_oracle import BaseOracle
 class TyphonAgent(BaseOracle):
     """Oracle of Chaos - The Final Trial"""
     
+    puzzle_type = "chaos_phases"
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.phase = 1
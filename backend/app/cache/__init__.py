@@ -0,0 +1,4 @@
+"""
+backend/app/cache/__init__.py
+Caching package
+"""
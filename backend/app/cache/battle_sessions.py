@@ -0,0 +1,356 @@
+"""
+backend/app/cache/battle_sessions.py
+STEP: Live Battle Sessions
+Redis-resident state of battles in progress. Each turn is one atomic Lua update of
+a session hash (CAS on the turn number); Postgres only sees the battle at
+checkpoints and at its end (CombatService.flush_battle_session).
+"""
+from typing import Dict, Any, List, Optional, Tuple
+import json
+import time
+
+from app.config import settings
+from app.cache.redis_client import get_redis
+from app.database import ConcurrencyConflict
+from app.utils.metrics import BATTLE_SESSION_WRITE_SECONDS
+
+# (turn, BattleLogEntry event code, value)
+LogEntry = Tuple[int, int, int]
+
+# KEYS: session hash, log list
+# ARGV: expected turn, state JSON, next turn, stance codes, ttl ms, log entries...
+# Returns 1 on success, 0 when another turn got there first, -1 when the session is gone
+TURN_SCRIPT = """
+local turn = redis.call('HGET', KEYS[1], 'turn')
+if not turn then return -1 end
+if turn ~= ARGV[1] then return 0 end
+local stances = redis.call('HGET', KEYS[1], 'stances') or ''
+redis.call('HSET', KEYS[1], 'state', ARGV[2], 'turn', ARGV[3], 'stances', stances .. ARGV[4])
+for i = 6, #ARGV do redis.call('RPUSH', KEYS[2], ARGV[i]) end
+redis.call('PEXPIRE', KEYS[1], ARGV[5])
+redis.call('PEXPIRE', KEYS[2], ARGV[5])
+return 1
+"""
+
+# KEYS: session hash
+# ARGV: checkpoint turn, checkpoint time, log entries flushed (absolute), stance codes flushed
+CHECKPOINT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+local stances = redis.call('HGET', KEYS[1], 'stances') or ''
+redis.call('HSET', KEYS[1], 'checkpoint_turn', ARGV[1], 'checkpoint_at', ARGV[2],
+           'flushed', ARGV[3], 'stances', string.sub(stances, tonumber(ARGV[4]) + 1))
+return 1
+"""
+
+# KEYS: session hash, log list
+# ARGV: expected turn, state JSON, rewound turn, log entries dropped, stance codes dropped, ttl ms
+REWIND_SCRIPT = """
+local turn = redis.call('HGET', KEYS[1], 'turn')
+if not turn then return -1 end
+if turn ~= ARGV[1] then return 0 end
+local stances = redis.call('HGET', KEYS[1], 'stances') or ''
+redis.call('HSET', KEYS[1], 'state', ARGV[2], 'turn', ARGV[3],
+           'stances', string.sub(stances, 1, string.len(stances) - tonumber(ARGV[5])))
+if tonumber(ARGV[4]) > 0 then redis.call('LTRIM', KEYS[2], 0, -1 - tonumber(ARGV[4])) end
+redis.call('PEXPIRE', KEYS[1], ARGV[6])
+redis.call('PEXPIRE', KEYS[2], ARGV[6])
+return 1
+"""
+
+
+class BattleSession:
+    """
+    One battle in progress as last read from (or written to) Redis.
+    `log` holds every entry since the session was opened; the first `flushed`
+    are already in battle_log_entries. `stances` are the compact stance codes of
+    the turns since `checkpoint_turn`.
+    """
+
+    __slots__ = ("game_id", "oracle_id", "oracle_state_id", "battle_state",
+                 "checkpoint_turn", "checkpoint_at", "log", "flushed", "stances", "stored")
+
+    def __init__(
+        self,
+        game_id: int,
+        oracle_id: int,
+        oracle_state_id: int,
+        battle_state: Dict[str, Any],
+        checkpoint_turn: int,
+        checkpoint_at: float,
+        log: List[LogEntry],
+        flushed: int,
+        stances: str = "",
+        stored: bool = True
+    ):
+        self.game_id = game_id
+        self.oracle_id = oracle_id
+        self.oracle_state_id = oracle_state_id
+        self.battle_state = battle_state
+        self.checkpoint_turn = checkpoint_turn
+        self.checkpoint_at = checkpoint_at
+        self.log = log
+        self.flushed = flushed
+        self.stances = stances
+        self.stored = stored  # False when Redis was unreachable (Postgres every turn)
+
+    @property
+    def pending(self) -> List[LogEntry]:
+        """Log entries not yet written to Postgres"""
+        return self.log[self.flushed:]
+
+
+class BattleSessionStore:
+    """
+    Session hash `battle:{game}:{oracle}` (state, turn, checkpoint bookkeeping) plus
+    log list `battle:{game}:{oracle}:log`, both expiring after BATTLE_SESSION_TTL_SECONDS
+    of inactivity. A lost session is rebuilt from the last Postgres checkpoint.
+    """
+
+    def __init__(self, ttl_seconds: int = None):
+        self.ttl_seconds = ttl_seconds or settings.BATTLE_SESSION_TTL_SECONDS
+        self._client = None
+        self._turn_script = None
+        self._checkpoint_script = None
+        self._rewind_script = None
+
+    @staticmethod
+    def _key(game_id: int, oracle_id: int) -> str:
+        return f"battle:{game_id}:{oracle_id}"
+
+    @staticmethod
+    def _log_key(game_id: int, oracle_id: int) -> str:
+        return f"battle:{game_id}:{oracle_id}:log"
+
+    @staticmethod
+    def _encode_entry(entry: LogEntry) -> str:
+        return "%d,%d,%d" % entry
+
+    @staticmethod
+    def _decode_entry(raw: bytes) -> LogEntry:
+        turn, event, value = raw.split(b",")
+        return int(turn), int(event), int(value)
+
+    def _scripts(self):
+        """Lua scripts registered on the current shared client (EVALSHA with reload)"""
+        client = get_redis()
+        if self._client is not client:
+            self._client = client
+            self._turn_script = client.register_script(TURN_SCRIPT)
+            self._checkpoint_script = client.register_script(CHECKPOINT_SCRIPT)
+            self._rewind_script = client.register_script(REWIND_SCRIPT)
+        return self._turn_script, self._checkpoint_script, self._rewind_script
+
+    async def load(self, game_id: int, oracle_id: int) -> Optional[BattleSession]:
+        """Live session of a battle, or None on a miss (or when Redis is unreachable)"""
+        try:
+            async with get_redis().pipeline(transaction=True) as pipe:
+                pipe.hgetall(self._key(game_id, oracle_id))
+                pipe.lrange(self._log_key(game_id, oracle_id), 0, -1)
+                fields, log = await pipe.execute()
+        except Exception as e:
+            print(f"Battle session read failed: {e}")
+            return None
+
+        if not fields or b"state" not in fields:
+            return None
+
+        return BattleSession(
+            game_id=game_id,
+            oracle_id=oracle_id,
+            oracle_state_id=int(fields[b"oracle_state_id"]),
+            battle_state=json.loads(fields[b"state"]),
+            checkpoint_turn=int(fields[b"checkpoint_turn"]),
+            checkpoint_at=float(fields[b"checkpoint_at"]),
+            log=[self._decode_entry(raw) for raw in log],
+            flushed=int(fields[b"flushed"]),
+            stances=fields.get(b"stances", b"").decode()
+        )
+
+    async def open(
+        self,
+        game_id: int,
+        oracle_id: int,
+        oracle_state_id: int,
+        battle_state: Dict[str, Any],
+        history: Optional[List[LogEntry]] = None
+    ) -> BattleSession:
+        """
+        Start a session from battle state that is already in Postgres.
+        STEP: Replaces any previous session of the pair; `history` seeds the recent-log
+        window with entries already flushed. Returns a detached session when Redis is
+        unreachable, so callers fall back to writing every turn to Postgres.
+        """
+        history = list(history or [])
+        session = BattleSession(
+            game_id=game_id,
+            oracle_id=oracle_id,
+            oracle_state_id=oracle_state_id,
+            battle_state=battle_state,
+            checkpoint_turn=battle_state["turn"],
+            checkpoint_at=time.time(),
+            log=history,
+            flushed=len(history)
+        )
+
+        key, log_key = self._key(game_id, oracle_id), self._log_key(game_id, oracle_id)
+        try:
+            async with get_redis().pipeline(transaction=True) as pipe:
+                pipe.delete(key, log_key)
+                pipe.hset(key, mapping={
+                    "state": json.dumps(battle_state, separators=(",", ":")),
+                    "turn": battle_state["turn"],
+                    "oracle_state_id": oracle_state_id,
+                    "checkpoint_turn": session.checkpoint_turn,
+                    "checkpoint_at": session.checkpoint_at,
+                    "flushed": session.flushed,
+                    "stances": "",
+                })
+                if history:
+                    pipe.rpush(log_key, *[self._encode_entry(entry) for entry in history])
+                    pipe.expire(log_key, self.ttl_seconds)
+                pipe.expire(key, self.ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            print(f"Battle session open failed: {e}")
+            session.stored = False
+        return session
+
+    async def record_turn(
+        self,
+        session: BattleSession,
+        expected_turn: int,
+        battle_state: Dict[str, Any],
+        stances: str,
+        entries: List[LogEntry]
+    ) -> bool:
+        """
+        Atomically store the state after one or more turns played from `expected_turn`.
+        STEP: Updates the session object in place. Raises ConcurrencyConflict when
+        another request already advanced the battle; returns False when the turns
+        could not be stored in Redis and must go straight to Postgres.
+        """
+        session.battle_state = battle_state
+        session.log.extend(entries)
+        session.stances += stances
+        if not session.stored:
+            return False
+
+        turn_script, _, _ = self._scripts()
+        started = time.perf_counter()
+        try:
+            result = await turn_script(
+                keys=[self._key(session.game_id, session.oracle_id),
+                      self._log_key(session.game_id, session.oracle_id)],
+                args=[
+                    expected_turn,
+                    json.dumps(battle_state, separators=(",", ":")),
+                    battle_state["turn"],
+                    stances,
+                    self.ttl_seconds * 1000,
+                    *[self._encode_entry(entry) for entry in entries],
+                ]
+            )
+        except Exception as e:
+            print(f"Battle session write failed: {e}")
+            session.stored = False
+            return False
+        BATTLE_SESSION_WRITE_SECONDS.observe(time.perf_counter() - started)
+
+        if result == 0:
+            raise ConcurrencyConflict(
+                f"Battle {session.game_id}/{session.oracle_id} advanced past turn {expected_turn}"
+            )
+        if result == -1:
+            # Expired between load and write: the caller writes everything to Postgres
+            session.stored = False
+            return False
+        return True
+
+    async def rewind(
+        self,
+        session: BattleSession,
+        expected_turn: int,
+        battle_state: Dict[str, Any],
+        dropped_entries: int,
+        dropped_stances: int
+    ) -> bool:
+        """
+        Atomically replace the live state with an earlier one, dropping the undone
+        turns' pending log entries and stance codes.
+        STEP: Same CAS on the turn as record_turn; returns False when the session
+        is not stored in Redis (nothing to rewind).
+        """
+        if not session.stored:
+            return False
+
+        _, _, rewind_script = self._scripts()
+        try:
+            result = await rewind_script(
+                keys=[self._key(session.game_id, session.oracle_id),
+                      self._log_key(session.game_id, session.oracle_id)],
+                args=[
+                    expected_turn,
+                    json.dumps(battle_state, separators=(",", ":")),
+                    battle_state["turn"],
+                    dropped_entries,
+                    dropped_stances,
+                    self.ttl_seconds * 1000,
+                ]
+            )
+        except Exception as e:
+            print(f"Battle session rewind failed: {e}")
+            return False
+
+        if result == 0:
+            raise ConcurrencyConflict(
+                f"Battle {session.game_id}/{session.oracle_id} advanced past turn {expected_turn}"
+            )
+        if result == -1:
+            return False
+
+        session.battle_state = battle_state
+        if dropped_entries:
+            del session.log[-dropped_entries:]
+        if dropped_stances:
+            session.stances = session.stances[:-dropped_stances]
+        return True
+
+    def flush_reason(self, session: BattleSession) -> Optional[str]:
+        """Why the session must be written to Postgres now, or None"""
+        if session.battle_state.get("status") != "in_progress":
+            return "end"
+        if session.battle_state["turn"] - session.checkpoint_turn >= settings.BATTLE_CHECKPOINT_TURNS:
+            return "turns"
+        if time.time() - session.checkpoint_at >= settings.BATTLE_CHECKPOINT_SECONDS:
+            return "interval"
+        return None
+
+    async def checkpoint(self, session: BattleSession):
+        """Mark everything the session holds as written to Postgres"""
+        session.checkpoint_turn = session.battle_state["turn"]
+        session.checkpoint_at = time.time()
+        flushed_stances = len(session.stances)
+        session.flushed = len(session.log)
+        session.stances = ""
+        if not session.stored:
+            return
+
+        _, checkpoint_script, _ = self._scripts()
+        try:
+            await checkpoint_script(
+                keys=[self._key(session.game_id, session.oracle_id)],
+                args=[session.checkpoint_turn, session.checkpoint_at, session.flushed, flushed_stances]
+            )
+        except Exception as e:
+            print(f"Battle session checkpoint failed: {e}")
+
+    async def close(self, game_id: int, oracle_id: int):
+        """Drop a session once its battle is fully in Postgres"""
+        try:
+            await get_redis().delete(self._key(game_id, oracle_id), self._log_key(game_id, oracle_id))
+        except Exception as e:
+            print(f"Battle session close failed: {e}")
+
+
+# Process-wide session store
+battle_sessions = BattleSessionStore()
@@ -0,0 +1,158 @@
+"""
+backend/app/cache/catalog.py
+STEP: Static Catalog Cache
+Process-level immutable copy of the seeded `oracles` and `army_units` tables.
+"""
+from dataclasses import dataclass
+import uuid
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, Mapping
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.oracle import Oracle
+from app.models.army import ArmyUnit
+
+# Redis channel used to tell every backend process to reload the catalog
+CATALOG_INVALIDATION_CHANNEL = "catalog:invalidate"
+
+# Identifies this process so it can ignore its own invalidation broadcasts
+PROCESS_ID = uuid.uuid4().hex
+
+
+@dataclass(frozen=True, slots=True)
+class OracleEntry:
+    """Immutable snapshot of an Oracle row"""
+    id: int
+    name: str
+    domain: str
+    title: Optional[str]
+    description: Optional[str]
+    difficulty_level: int
+    unlock_order: Optional[int]
+    army_unit_reward: Optional[str]
+    weapon_reward: Optional[str]
+    special_ability: Optional[str]
+    personality_config: Mapping[str, Any]
+
+    @classmethod
+    def from_row(cls, oracle: Oracle) -> "OracleEntry":
+        return cls(
+            id=oracle.id,
+            name=oracle.name,
+            domain=oracle.domain,
+            title=oracle.title,
+            description=oracle.description,
+            difficulty_level=oracle.difficulty_level or 1,
+            unlock_order=oracle.unlock_order,
+            army_unit_reward=oracle.army_unit_reward,
+            weapon_reward=oracle.weapon_reward,
+            special_ability=oracle.special_ability,
+            personality_config=MappingProxyType(dict(oracle.personality_config or {}))
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ArmyUnitEntry:
+    """Immutable snapshot of an ArmyUnit row"""
+    id: int
+    name: str
+    unit_type: str
+    origin_oracle: Optional[str]
+    attack: int
+    defense: int
+    health: int
+    speed: int
+    special_abilities: Tuple[str, ...]
+    element_affinity: Optional[str]
+    recruitment_cost: int
+    rarity: str
+
+    @classmethod
+    def from_row(cls, unit: ArmyUnit) -> "ArmyUnitEntry":
+        return cls(
+            id=unit.id,
+            name=unit.name,
+            unit_type=unit.unit_type,
+            origin_oracle=unit.origin_oracle,
+            attack=unit.attack,
+            defense=unit.defense,
+            health=unit.health,
+            speed=unit.speed,
+            special_abilities=tuple(unit.special_abilities or ()),
+            element_affinity=unit.element_affinity,
+            recruitment_cost=unit.recruitment_cost,
+            rarity=unit.rarity
+        )
+
+
+class GameCatalog:
+    """Immutable oracle and army unit catalog with id and name indexes"""
+
+    __slots__ = ("oracles", "army_units", "_oracles_by_id", "_oracles_by_name",
+                 "_units_by_id", "_units_by_name")
+
+    def __init__(self, oracles: Tuple[OracleEntry, ...], army_units: Tuple[ArmyUnitEntry, ...]):
+        self.oracles = oracles
+        self.army_units = army_units
+        self._oracles_by_id: Dict[int, OracleEntry] = {o.id: o for o in oracles}
+        self._oracles_by_name: Dict[str, OracleEntry] = {o.name: o for o in oracles}
+        self._units_by_id: Dict[int, ArmyUnitEntry] = {u.id: u for u in army_units}
+        self._units_by_name: Dict[str, ArmyUnitEntry] = {u.name: u for u in army_units}
+
+    def oracle_by_id(self, oracle_id: int) -> Optional[OracleEntry]:
+        return self._oracles_by_id.get(oracle_id)
+
+    def oracle_by_name(self, name: str) -> Optional[OracleEntry]:
+        return self._oracles_by_name.get(name)
+
+    def unit_by_id(self, unit_id: int) -> Optional[ArmyUnitEntry]:
+        return self._units_by_id.get(unit_id)
+
+    def unit_by_name(self, name: str) -> Optional[ArmyUnitEntry]:
+        return self._units_by_name.get(name)
+
+
+class CatalogCache:
+    """
+    Holder for the current GameCatalog.
+    STEP: Loaded once at startup; reloaded on admin request or Redis invalidation.
+    """
+
+    def __init__(self):
+        self._catalog = GameCatalog((), ())
+
+    @property
+    def current(self) -> GameCatalog:
+        """The catalog in effect (swapped atomically on reload)"""
+        return self._catalog
+
+    async def load(self, db: AsyncSession) -> GameCatalog:
+        """Read both catalog tables and swap in a fresh immutable catalog"""
+        result = await db.execute(select(Oracle).order_by(Oracle.id))
+        oracles = tuple(OracleEntry.from_row(o) for o in result.scalars().all())
+
+        result = await db.execute(select(ArmyUnit).order_by(ArmyUnit.id))
+        army_units = tuple(ArmyUnitEntry.from_row(u) for u in result.scalars().all())
+
+        self._catalog = GameCatalog(oracles, army_units)
+        return self._catalog
+
+    async def reload(self) -> GameCatalog:
+        """Reload using a dedicated session"""
+        from app.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as db:
+            catalog = await self.load(db)
+        print(f"Catalog loaded: {len(catalog.oracles)} oracles, {len(catalog.army_units)} army units")
+        return catalog
+
+    async def handle_invalidation(self, message: Dict[str, Any]):
+        """Redis pub/sub callback for CATALOG_INVALIDATION_CHANNEL"""
+        if message.get("origin") == PROCESS_ID:
+            return
+        await self.reload()
+
+
+# Process-wide catalog, loaded during application startup
+catalog_cache = CatalogCache()
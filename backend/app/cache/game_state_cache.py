@@ -0,0 +1,124 @@
+"""
+backend/app/cache/game_state_cache.py
+STEP: Versioned Game State Cache
+Read-through cache of serialized game-state snapshots keyed by (game_id, version),
+with an in-process LRU in front of a shared Redis tier.
+"""
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+import json
+
+from app.config import settings
+from app.cache.redis_client import get_redis
+from app.utils.metrics import GAME_STATE_CACHE_READS
+
+
+class GameStateCache:
+    """
+    Two-tier snapshot cache.
+    STEP: `game:{id}:version` in Redis points at the current version; snapshots are
+    immutable per version, so a stale version can never be served once it is bumped.
+    """
+
+    def __init__(self, max_entries: int = None, ttl_seconds: int = None):
+        self.max_entries = max_entries or settings.GAME_STATE_CACHE_SIZE
+        self.ttl_seconds = ttl_seconds or settings.GAME_STATE_CACHE_TTL_SECONDS
+        self._local: "OrderedDict[Tuple[int, int], Dict[str, Any]]" = OrderedDict()
+        # Fallback version pointers when Redis is unreachable (single-process correctness)
+        self._versions: Dict[int, int] = {}
+
+    @staticmethod
+    def _version_key(game_id: int) -> str:
+        return f"game:{game_id}:version"
+
+    @staticmethod
+    def _snapshot_key(game_id: int, version: int) -> str:
+        return f"game:{game_id}:snapshot:{version}"
+
+    async def current_version(self, game_id: int) -> Optional[int]:
+        """Current version pointer for a game, or None if unknown"""
+        try:
+            value = await get_redis().get(self._version_key(game_id))
+            return int(value) if value is not None else None
+        except Exception as e:
+            print(f"Game state cache version read failed: {e}")
+            return self._versions.get(game_id)
+
+    async def get(self, game_id: int) -> Optional[Dict[str, Any]]:
+        """Return the snapshot for the game's current version, or None on a miss"""
+        version = await self.current_version(game_id)
+        if version is None:
+            return None
+
+        key = (game_id, version)
+        snapshot = self._local.get(key)
+        if snapshot is not None:
+            self._local.move_to_end(key)
+            GAME_STATE_CACHE_READS.labels(tier="local").inc()
+            return snapshot
+
+        try:
+            payload = await get_redis().get(self._snapshot_key(game_id, version))
+        except Exception as e:
+            print(f"Game state cache read failed: {e}")
+            payload = None
+
+        if payload is None:
+            return None
+
+        snapshot = json.loads(payload)
+        self._remember(key, snapshot)
+        GAME_STATE_CACHE_READS.labels(tier="redis").inc()
+        return snapshot
+
+    async def put(self, snapshot: Dict[str, Any]):
+        """
+        Store a snapshot freshly loaded from Postgres.
+        The version pointer is only initialized, never moved backwards.
+        """
+        game_id, version = snapshot["id"], snapshot["version"]
+        self._remember((game_id, version), snapshot)
+        self._versions.setdefault(game_id, version)
+        GAME_STATE_CACHE_READS.labels(tier="database").inc()
+
+        try:
+            redis = get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(
+                    self._snapshot_key(game_id, version),
+                    json.dumps(snapshot, default=str),
+                    ex=self.ttl_seconds
+                )
+                pipe.set(self._version_key(game_id), version, ex=self.ttl_seconds, nx=True)
+                await pipe.execute()
+        except Exception as e:
+            print(f"Game state cache write failed: {e}")
+
+    async def set_version(self, game_id: int, version: int):
+        """Advance the version pointer after a committed mutation"""
+        self._versions[game_id] = version
+        try:
+            await get_redis().set(self._version_key(game_id), version, ex=self.ttl_seconds)
+        except Exception as e:
+            print(f"Game state cache version write failed: {e}")
+
+    async def invalidate(self, game_id: int):
+        """Explicitly drop every cached version of a game"""
+        self._versions.pop(game_id, None)
+        for key in [k for k in self._local if k[0] == game_id]:
+            del self._local[key]
+        try:
+            await get_redis().delete(self._version_key(game_id))
+        except Exception as e:
+            print(f"Game state cache invalidation failed: {e}")
+
+    def _remember(self, key: Tuple[int, int], snapshot: Dict[str, Any]):
+        """Insert into the in-process LRU, evicting the least recently used entry"""
+        self._local[key] = snapshot
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+
+# Process-wide snapshot cache
+game_state_cache = GameStateCache()
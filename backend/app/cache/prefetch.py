@@ -0,0 +1,139 @@
+"""
+backend/app/cache/prefetch.py
+STEP: Phase-Transition Prefetcher
+Warms puzzle, diplomacy and battle inputs in the background when an oracle challenge begins.
+"""
+from typing import Dict, Any, Optional, Tuple
+import asyncio
+import time
+
+from app.utils.metrics import PREFETCH_HITS, PREFETCH_MISSES, PREFETCH_WASTED
+
+
+class PrefetchEntry:
+    """Background tasks warmed for one (game, oracle) challenge"""
+
+    __slots__ = ("tasks", "expires_at")
+
+    def __init__(self, tasks: Dict[str, asyncio.Task], expires_at: float):
+        self.tasks = tasks
+        self.expires_at = expires_at
+
+
+class PhasePrefetcher:
+    """
+    Short-lived per-(game, oracle) cache of phase inputs.
+    STEP: Starts memory retrieval, player pattern fetch and the first puzzle LLM
+    call concurrently; later phases consume the results once. (Enemy armies are a
+    precomputed table lookup and need no warming.)
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.orchestrator = None
+        self._entries: Dict[Tuple[int, str], PrefetchEntry] = {}
+
+    def bind(self, orchestrator):
+        """Attach the agent orchestrator whose agents, LLM and memory are warmed"""
+        self.orchestrator = orchestrator
+
+    def agent(self, oracle_name: str):
+        """The bound orchestrator's agent for an oracle, or None (unknown oracle or nothing bound)"""
+        return self.orchestrator.agents.get(oracle_name) if self.orchestrator else None
+
+    def start(
+        self,
+        game_id: int,
+        player_id: int,
+        oracle_name: str,
+        difficulty: int,
+        player_context: Dict[str, Any],
+        puzzle: bool = True
+    ) -> bool:
+        """
+        Launch prefetch tasks for a challenge that just entered exploration.
+        `puzzle=False` skips the puzzle LLM call (e.g. the puzzle bank can serve one).
+        Returns False when no orchestrator is bound (nothing to warm).
+        """
+        if not self.orchestrator:
+            return False
+
+        self._evict_expired()
+        self.discard(game_id, oracle_name)
+        if len(self._entries) >= self.max_entries:
+            oldest = min(self._entries, key=lambda k: self._entries[k].expires_at)
+            self._drop(oldest)
+
+        memory = self.orchestrator.memory
+        agent = self.agent(oracle_name)
+
+        coroutines = {
+            "memories": memory.retrieve_ranked_memories(
+                oracle_name,
+                f"Player {player_id} challenges {oracle_name}",
+                limit=3
+            ),
+            "player_patterns": memory.get_player_patterns(str(player_id)),
+        }
+        if agent and puzzle:
+            coroutines[f"puzzle:{difficulty}"] = agent.generate_puzzle(difficulty, player_context)
+
+        tasks = {key: asyncio.create_task(coro) for key, coro in coroutines.items()}
+        self._entries[(game_id, oracle_name)] = PrefetchEntry(
+            tasks,
+            time.monotonic() + self.ttl_seconds
+        )
+        return True
+
+    async def consume(self, game_id: int, oracle_name: str, key: str) -> Optional[Any]:
+        """
+        Take a prefetched result, waiting for it if still in flight.
+        Returns None on a miss (never started, expired, consumed or failed).
+        """
+        kind = key.split(":", 1)[0]
+        entry = self._entries.get((game_id, oracle_name))
+
+        if entry and entry.expires_at <= time.monotonic():
+            self._drop((game_id, oracle_name))
+            entry = None
+
+        task = entry.tasks.pop(key, None) if entry else None
+        if entry and not entry.tasks:
+            del self._entries[(game_id, oracle_name)]
+
+        if task is None:
+            PREFETCH_MISSES.labels(kind=kind).inc()
+            return None
+
+        try:
+            result = await task
+        except Exception as e:
+            print(f"Prefetch {key} failed for game {game_id}: {e}")
+            PREFETCH_MISSES.labels(kind=kind).inc()
+            return None
+
+        PREFETCH_HITS.labels(kind=kind).inc()
+        return result
+
+    def discard(self, game_id: int, oracle_name: str):
+        """Drop any prefetched results for a challenge (e.g. oracle defeated)"""
+        if (game_id, oracle_name) in self._entries:
+            self._drop((game_id, oracle_name))
+
+    def _drop(self, key: Tuple[int, str]):
+        """Cancel and count every unconsumed task of an entry as wasted"""
+        entry = self._entries.pop(key)
+        for task_key, task in entry.tasks.items():
+            task.cancel()
+            PREFETCH_WASTED.labels(kind=task_key.split(":", 1)[0]).inc()
+
+    def _evict_expired(self):
+        """Remove entries past their TTL"""
+        now = time.monotonic()
+        for key in [k for k, e in self._entries.items() if e.expires_at <= now]:
+            self._drop(key)
+
+
+# Process-wide prefetcher, bound to the orchestrator at startup
+phase_prefetcher = PhasePrefetcher()
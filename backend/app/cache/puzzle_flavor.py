@@ -0,0 +1,43 @@
+"""
+backend/app/cache/puzzle_flavor.py
+STEP: Puzzle Flavor Text Cache
+In-character descriptions for procedural puzzles, written once by the LLM per
+(oracle, puzzle type, difficulty) and shared through Redis by every puzzle of
+that kind.
+"""
+from typing import Optional
+
+from app.config import settings
+from app.cache.redis_client import get_redis
+from app.utils.metrics import PUZZLE_FLAVOR_READS
+
+
+class PuzzleFlavorCache:
+    """Redis strings `puzzle:flavor:{oracle}:{type}:{difficulty}` expiring after PUZZLE_FLAVOR_TTL_SECONDS"""
+
+    def __init__(self, ttl_seconds: int = None):
+        self.ttl_seconds = ttl_seconds or settings.PUZZLE_FLAVOR_TTL_SECONDS
+
+    @staticmethod
+    def _key(oracle_name: str, puzzle_type: str, difficulty: int) -> str:
+        return f"puzzle:flavor:{oracle_name}:{puzzle_type}:{difficulty}"
+
+    async def get(self, oracle_name: str, puzzle_type: str, difficulty: int) -> Optional[str]:
+        """Cached flavor text, or None on a miss (or when Redis is unreachable)"""
+        try:
+            value = await get_redis().get(self._key(oracle_name, puzzle_type, difficulty))
+        except Exception as e:
+            print(f"Puzzle flavor read failed: {e}")
+            value = None
+        PUZZLE_FLAVOR_READS.labels(result="hit" if value is not None else "miss").inc()
+        return value.decode() if value is not None else None
+
+    async def put(self, oracle_name: str, puzzle_type: str, difficulty: int, text: str):
+        try:
+            await get_redis().set(self._key(oracle_name, puzzle_type, difficulty), text, ex=self.ttl_seconds)
+        except Exception as e:
+            print(f"Puzzle flavor write failed: {e}")
+
+
+# Process-wide flavor cache
+puzzle_flavor_cache = PuzzleFlavorCache()
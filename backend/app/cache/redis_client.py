@@ -0,0 +1,26 @@
+"""
+backend/app/cache/redis_client.py
+STEP: Shared Redis Connection
+Lazily created binary-safe Redis client used by the cache tiers.
+"""
+import redis.asyncio as redis
+
+from app.config import settings
+
+_client = None
+
+
+def get_redis() -> redis.Redis:
+    """Return the process-wide Redis client (bytes in, bytes out)"""
+    global _client
+    if _client is None:
+        _client = redis.from_url(settings.REDIS_URL, decode_responses=False)
+    return _client
+
+
+async def close_redis():
+    """Close the shared client on shutdown"""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
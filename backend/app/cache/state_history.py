@@ -0,0 +1,128 @@
+"""
+backend/app/cache/state_history.py
+STEP: Recent State History
+Per-key ring buffers of the last few versions of a state (game replay state,
+live battle state). Consecutive versions share every part they did not change
+(copy-on-write at the second level), so a version costs roughly its delta.
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from app.config import settings
+from app.utils.metrics import STATE_HISTORY_READS
+
+
+class VersionRing:
+    """
+    Fixed-capacity ring of (contiguous version -> state).
+    STEP: Push, truncate and lookup by version or by steps back are all O(1).
+    """
+
+    __slots__ = ("states", "head", "size", "head_version")
+
+    def __init__(self, capacity: int):
+        self.states = [None] * capacity
+        self.head = -1
+        self.size = 0
+        self.head_version = None
+
+    @property
+    def capacity(self) -> int:
+        return len(self.states)
+
+    def push(self, version: int, state: Dict[str, Any]):
+        """
+        Record `state` as `version`. A version at or below the head (a rewind)
+        drops everything from it onwards first; a gap restarts the ring.
+        """
+        if self.head_version is not None and self.head_version - self.size < version <= self.head_version:
+            dropped = self.head_version - version + 1
+            for _ in range(dropped):
+                self.states[self.head] = None
+                self.head = (self.head - 1) % self.capacity
+            self.size -= dropped
+            self.head_version = version - 1
+        elif self.head_version is None or version != self.head_version + 1:
+            self.states = [None] * self.capacity
+            self.head, self.size = -1, 0
+
+        self.head = (self.head + 1) % self.capacity
+        self.states[self.head] = state
+        self.size = min(self.size + 1, self.capacity)
+        self.head_version = version
+
+    def at(self, version: int) -> Optional[Dict[str, Any]]:
+        """State recorded for `version`, or None once it has left the ring"""
+        if self.head_version is None:
+            return None
+        return self.back(self.head_version - version)
+
+    def back(self, steps: int) -> Optional[Dict[str, Any]]:
+        """State `steps` versions before the head (0 = head)"""
+        if not 0 <= steps < self.size:
+            return None
+        return self.states[(self.head - steps) % self.capacity]
+
+
+class StateHistory:
+    """
+    Rings keyed by game (or battle), least recently used keys evicted.
+    STEP: Memory is bounded by depth x keys; only the process that applied a
+    version can record it, so gaps (other workers, version bumps without a
+    replayable event) restart a key's ring.
+    """
+
+    def __init__(self, kind: str, depth: int = None, max_keys: int = None):
+        self.kind = kind
+        self.depth = depth or settings.STATE_HISTORY_DEPTH
+        self.max_keys = max_keys or settings.STATE_HISTORY_MAX_KEYS
+        self._rings: "OrderedDict[Hashable, VersionRing]" = OrderedDict()
+
+    def head(self, key: Hashable) -> Optional[VersionRing]:
+        """The key's ring if it holds anything"""
+        ring = self._rings.get(key)
+        return ring if ring is not None and ring.size else None
+
+    def push(self, key: Hashable, version: int, state: Dict[str, Any]):
+        """Record one version of a key's state (already copied by the caller)"""
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = self._rings[key] = VersionRing(self.depth)
+        self._rings.move_to_end(key)
+        ring.push(version, state)
+        while len(self._rings) > self.max_keys:
+            self._rings.popitem(last=False)
+
+    def at(self, key: Hashable, version: int) -> Optional[Dict[str, Any]]:
+        """A recorded version of a key's state, or None on a miss"""
+        ring = self._rings.get(key)
+        state = ring.at(version) if ring is not None else None
+        STATE_HISTORY_READS.labels(kind=self.kind, result="hit" if state is not None else "miss").inc()
+        return state
+
+    def discard(self, key: Hashable):
+        self._rings.pop(key, None)
+
+
+def copy_on_write(state: Dict[str, Any], oracle_id: Any = None, oracle_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Next-version copy of a game replay state for one event.
+    STEP: Reducers only mutate second-level dicts (game, one oracle, one dominion)
+    and the armies list; nested values are replaced, never edited, so copying
+    those containers is enough and everything else stays shared.
+    """
+    new = dict(state)
+    new["game"] = dict(state["game"])
+    new["oracles"] = dict(state["oracles"])
+    if oracle_id in new["oracles"]:
+        new["oracles"][oracle_id] = dict(new["oracles"][oracle_id])
+    new["dominions"] = dict(state["dominions"])
+    if oracle_name in new["dominions"]:
+        new["dominions"][oracle_name] = dict(new["dominions"][oracle_name])
+    new["armies"] = list(state["armies"])
+    return new
+
+
+# Process-wide histories: game replay states by game id, battle states by (game id, oracle id)
+game_history = StateHistory("game")
+battle_history = StateHistory("battle")
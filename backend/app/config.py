@@ -34,6 +34,18 @@ class Settings(BaseSettings):
     def SYNC_DATABASE_URL(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
     
+    # Read replica (empty host = reads use a separate pool on the primary)
+    POSTGRES_REPLICA_HOST: str = ""
+    POSTGRES_REPLICA_PORT: int = 5432
+    REPLICA_MAX_LAG_SECONDS: float = 5.0  # fall back to the primary beyond this
+    REPLICA_LAG_CHECK_SECONDS: float = 2.0  # how long a lag probe result is reused
+    
+    @property
+    def REPLICA_DATABASE_URL(self) -> str:
+        if not self.POSTGRES_REPLICA_HOST:
+            return self.DATABASE_URL
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_REPLICA_HOST}:{self.POSTGRES_REPLICA_PORT}/{self.POSTGRES_DB}"
+    
     # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
@@ -45,6 +57,10 @@ class Settings(BaseSettings):
             return f"redis://:{self.REDIS_PASSWORD}@{self.REDIS_HOST}:{self.REDIS_PORT}/0"
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/0"
     
+    # Game state snapshot cache
+    GAME_STATE_CACHE_SIZE: int = 2048  # in-process LRU entries
+    GAME_STATE_CACHE_TTL_SECONDS: int = 3600  # Redis tier expiry
+    
     # Kafka
     KAFKA_BOOTSTRAP_SERVERS: str = "localhost:9092"
     KAFKA_TOPIC_GAME_EVENTS: str = "game-events"
@@ -57,6 +73,68 @@ class Settings(BaseSettings):
     MINIO_BUCKET: str = "astraeum-assets"
     MINIO_USE_SSL: bool = False
     
+    # Cold archival of completed / idle games
+    ARCHIVE_IDLE_DAYS: int = 30  # days since the last move, save or creation
+    ARCHIVE_BATCH_SIZE: int = 100
+    ARCHIVE_INTERVAL_SECONDS: int = 3600  # 0 disables the background job
+    SNAPSHOT_MAX_BYTES: int = 64 * 1024 * 1024  # decompressed size cap for imports
+    
+    # Event-sourced game history
+    EVENT_SNAPSHOT_INTERVAL: int = 50  # state snapshot every N game versions
+    
+    # Recent state history (copy-on-write rings for rewinds)
+    STATE_HISTORY_DEPTH: int = 16  # versions (or battle turns) kept per key
+    STATE_HISTORY_MAX_KEYS: int = 4096  # games / battles with a ring, LRU evicted
+    
+    # Monte Carlo battle prediction
+    BATTLE_PREDICTION_SIMULATIONS: int = 2000
+    BATTLE_PREDICTION_MAX_SIMULATIONS: int = 20000
+    BATTLE_PREDICTION_TACTICAL_SIMULATIONS: int = 256  # per oracle tactical decision
+    BATTLE_PREDICTION_CACHE_SIZE: int = 1024
+    
+    # Oracle tactical search (local expectimax; the LLM only adds optional flavor text)
+    TACTICAL_SEARCH_BUDGET_MS: float = 20.0
+    TACTICAL_SEARCH_ROLLOUTS: int = 32  # per (oracle stance, player stance) pair and batch
+    TACTICAL_SEARCH_MAX_BATCHES: int = 8
+    TACTICAL_SEARCH_HORIZON: int = 4  # turns played out per rollout
+    TACTICAL_FLAVOR_TEXT: bool = False
+    TACTICAL_FLAVOR_TIMEOUT_SECONDS: float = 2.0
+    
+    # Procedural puzzles (the LLM only writes optional, separately cached flavor text)
+    PUZZLE_FLAVOR_TEXT: bool = False
+    PUZZLE_FLAVOR_TIMEOUT_SECONDS: float = 3.0
+    PUZZLE_FLAVOR_TTL_SECONDS: int = 7 * 24 * 3600
+    PUZZLE_FALLBACK_TYPE: str = "pattern"  # served for oracles without a registered agent
+    
+    # Local answer verification (free-form puzzle answers, no LLM judge)
+    PUZZLE_ANSWER_TOKEN_THRESHOLD: float = 0.8  # words matched in order (any order for list answers)
+    PUZZLE_ANSWER_EDIT_RATIO: float = 0.85  # 1 - edit distance / length
+    PUZZLE_ANSWER_MAX_TYPOS: int = 1  # edits always allowed in answers of TYPO_MIN_LENGTH or more
+    PUZZLE_ANSWER_TYPO_MIN_LENGTH: int = 5  # shorter answers ("fire", "man") need the ratio alone
+    PUZZLE_ANSWER_ESCALATE_THRESHOLD: float = 0.5  # rejected near misses above this get the embedding check
+    PUZZLE_ANSWER_EMBEDDINGS: bool = False
+    PUZZLE_ANSWER_EMBEDDING_THRESHOLD: float = 0.88  # cosine similarity
+    PUZZLE_ANSWER_EMBEDDING_CACHE_SIZE: int = 4096  # cached answer vectors
+    
+    # Puzzle bank (generated puzzles reused across players, one bitmap of seen slots per player)
+    PUZZLE_BANK_ENABLED: bool = True
+    PUZZLE_BANK_INSERT_RETRIES: int = 3  # concurrent inserts racing for the next slot
+    
+    # JSON schemas (compiled once at startup)
+    PUZZLE_SCHEMAS_CONFIG: str = ""  # empty = backend/configs/puzzles/puzzle_schemas.json
+    
+    # Enemy armies (precomputed per oracle and difficulty at startup)
+    ENEMY_ARMIES_CONFIG: str = ""  # empty = backend/configs/game/enemy_armies.yaml
+    
+    # Server-side battle auto-resolve
+    AUTO_RESOLVE_MAX_TURNS: int = 100
+    AUTO_RESOLVE_SUMMARY_LINES: int = 8
+    
+    # Live battle sessions (Redis-resident, checkpointed to Postgres)
+    BATTLE_SESSION_TTL_SECONDS: int = 3600  # idle sessions expire; resumed from the last checkpoint
+    BATTLE_CHECKPOINT_TURNS: int = 5  # flush to Postgres every N turns...
+    BATTLE_CHECKPOINT_SECONDS: int = 60  # ...or when the last flush is older than this
+    
     # Ollama/vLLM
     OLLAMA_BASE_URL: str = "http://localhost:11434"
     DEFAULT_LLM_MODEL: str = "llama3"
@@ -66,7 +144,15 @@ class Settings(BaseSettings):
     # Weaviate
     WEAVIATE_URL: str = "http://localhost:8080"
     WEAVIATE_API_KEY: str = ""
-    
+
+    # Memory retrieval (hybrid search + re-ranking)
+    MEMORY_CANDIDATE_POOL: int = 25
+    MEMORY_HYBRID_ALPHA: float = 0.5  # 0 = pure BM25, 1 = pure vector
+    MEMORY_HALF_LIFE_HOURS: float = 72.0
+    MEMORY_SIMILARITY_WEIGHT: float = 0.6
+    MEMORY_IMPORTANCE_WEIGHT: float = 0.25
+    MEMORY_RECENCY_WEIGHT: float = 0.15
+
     # Monitoring
     PROMETHEUS_PORT: int = 9090
     GRAFANA_PORT: int = 3001
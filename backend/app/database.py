@@ -5,11 +5,21 @@ backend/app/database.py
 STEP: Database Connection Setup
 Configures async PostgreSQL connection using SQLAlchemy and provides session management.
 """
+import asyncio
+import random
+import time
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
 
 from app.config import settings
+from app.utils.metrics import CONCURRENCY_CONFLICTS, CONCURRENCY_RETRIES_EXHAUSTED, REPLICA_FALLBACKS
+
+T = TypeVar("T")
 
 # Async engine for PostgreSQL
 engine = create_async_engine(
@@ -29,6 +39,25 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Read engine: the replica when configured, otherwise a separate pool on the primary
+# so read traffic cannot exhaust the write pool
+REPLICA_CONFIGURED = bool(settings.POSTGRES_REPLICA_HOST)
+read_engine = create_async_engine(
+    settings.REPLICA_DATABASE_URL,
+    echo=settings.DEBUG,
+    poolclass=NullPool if settings.ENVIRONMENT == "test" else None,
+    pool_size=20,
+    max_overflow=40,
+)
+
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 # Base class for models
 Base = declarative_base()
 
@@ -46,6 +75,118 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+class ReplicaLagMonitor:
+    """
+    Cached replica lag probe.
+    STEP: Lag is 0 while the replica has replayed everything it received; otherwise
+    seconds since the last replayed transaction. Probed at most every
+    REPLICA_LAG_CHECK_SECONDS.
+    """
+    
+    LAG_QUERY = text(
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    )
+    
+    def __init__(self):
+        self._healthy = True
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def replica_usable(self) -> bool:
+        """Whether reads may go to the replica right now"""
+        if not REPLICA_CONFIGURED:
+            return False
+        if time.monotonic() - self._checked_at < settings.REPLICA_LAG_CHECK_SECONDS:
+            return self._healthy
+        
+        async with self._lock:
+            if time.monotonic() - self._checked_at >= settings.REPLICA_LAG_CHECK_SECONDS:
+                self._healthy = await self._probe()
+                self._checked_at = time.monotonic()
+        return self._healthy
+    
+    async def _probe(self) -> bool:
+        try:
+            async with read_engine.connect() as conn:
+                lag = float((await conn.execute(self.LAG_QUERY)).scalar() or 0)
+        except Exception as e:
+            print(f"Replica lag probe failed: {e}")
+            REPLICA_FALLBACKS.labels(reason="probe_failed").inc()
+            return False
+        
+        if lag > settings.REPLICA_MAX_LAG_SECONDS:
+            print(f"Replica lag {lag:.1f}s exceeds {settings.REPLICA_MAX_LAG_SECONDS}s, reading from primary")
+            REPLICA_FALLBACKS.labels(reason="lag").inc()
+            return False
+        return True
+
+
+replica_lag_monitor = ReplicaLagMonitor()
+
+
+async def get_read_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency for read-only endpoints.
+    STEP: Routes to the replica (primary when lagging or unconfigured), opens a
+    READ ONLY transaction and never commits.
+    """
+    use_replica = await replica_lag_monitor.replica_usable()
+    if use_replica or not REPLICA_CONFIGURED:
+        session_factory = ReadSessionLocal
+    else:
+        session_factory = AsyncSessionLocal
+    
+    async with session_factory() as session:
+        session.info["read_only"] = True
+        session.info["replica"] = use_replica
+        try:
+            # REPEATABLE READ: multi-query reads (eager loads, snapshot export) see one snapshot
+            await session.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"))
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
+
+
+def is_replica_session(db: AsyncSession) -> bool:
+    """True when the session reads from a (possibly lagging) replica"""
+    return bool(db.info.get("replica"))
+
+
+class ConcurrencyConflict(Exception):
+    """Optimistic concurrency check failed: the row changed after it was read"""
+
+
+async def retry_on_conflict(
+    db: AsyncSession,
+    operation: Callable[[], Awaitable[T]],
+    name: str,
+    max_attempts: int = 3,
+    base_delay: float = 0.05
+) -> T:
+    """
+    Run a mutating service call, retrying on optimistic concurrency conflicts.
+    STEP: Rolls back, waits with jittered exponential backoff, and re-runs the
+    operation against fresh state; gives up with HTTP 409 after max_attempts.
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await operation()
+        except ConcurrencyConflict:
+            CONCURRENCY_CONFLICTS.labels(operation=name).inc()
+            await db.rollback()
+            if attempt == max_attempts:
+                break
+            await asyncio.sleep(base_delay * (2 ** (attempt - 1)) * (1 + random.random()))
+    
+    CONCURRENCY_RETRIES_EXHAUSTED.labels(operation=name).inc()
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Game was modified by another request, please retry"
+    )
+
+
 async def init_db():
     """Initialize database tables"""
     async with engine.begin() as conn:
@@ -5,7 +5,7 @@ backend/app/llm/prompts.py
 STEP: Structured Prompt Templates
 Defines prompts for different agent types and actions.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 
 class PromptTemplates:
@@ -69,6 +69,28 @@ Return ONLY valid JSON with this structure:
     "difficulty": {difficulty}
 }}"""
     
+    @staticmethod
+    def puzzle_flavor_prompt(
+        oracle_name: str,
+        domain: str,
+        puzzle_type: str,
+        difficulty: int
+    ) -> str:
+        """
+        Generate flavor text for a procedural puzzle.
+        STEP: Shared by every puzzle of the same type and difficulty, so it must not
+        mention any concrete values or the solution.
+        """
+        return f"""You are {oracle_name}, Oracle of {domain}.
+
+A mortal challenger faces one of your {puzzle_type.replace('_', ' ')} trials (difficulty {difficulty}/13).
+The trial itself is already written; introduce it in character in 2-3 sentences.
+Do not mention any numbers, positions, moves or answers.
+
+Return ONLY the introduction.
+
+Introduction:"""
+    
     @staticmethod
     def diplomatic_response_prompt(
         oracle_name: str,
@@ -98,28 +120,38 @@ Keep response under 100 words. Be strategic and stay in character.
 Response:"""
     
     @staticmethod
-    def tactical_decision_prompt(
+    def tactical_flavor_prompt(
         oracle_name: str,
         battle_state: Dict[str, Any],
-        available_actions: List[str]
+        action: str,
+        prediction: Optional[Dict[str, Any]] = None
     ) -> str:
         """
-        Generate tactical combat decision.
-        STEP: Instructs agent to choose optimal battle action.
+        Generate an in-character battle line.
+        STEP: Announces an action already chosen by the tactical search.
         """
+        outlook = ""
+        if prediction:
+            outlook = (
+                f"- Simulated Outlook ({prediction['simulations']} battles): "
+                f"you win {prediction['loss_probability']:.0%}, "
+                f"the player wins {prediction['win_probability']:.0%}, "
+                f"about {prediction['expected_turns']:.0f} more turns\n"
+            )
+        
         return f"""You are {oracle_name} commanding your army in battle.
 
 Battle State:
 - Your Health: {battle_state.get('enemy_health', 0)}
 - Player Health: {battle_state.get('player_health', 0)}
 - Turn: {battle_state.get('turn', 1)}
+{outlook}
+Your army's next move: {action.replace('_', ' ')}
 
-Available Actions: {', '.join(available_actions)}
-
-Choose the best tactical action based on current situation.
-Return ONLY the action name, nothing else.
+Announce this move to the player in one short sentence, in character.
+Return ONLY the sentence.
 
-Action:"""
+Line:"""
     
     @staticmethod
     def insight_hint_prompt(
@@ -25,6 +25,13 @@ from app.events.redis_pubsub import RedisPubSub
 from app.agents.orchestrator import AgentOrchestrator
 from app.llm.adapter import LLMAdapter
 from app.memory.vector_store import VectorMemory
+from app.cache.prefetch import phase_prefetcher
+from app.cache.catalog import catalog_cache, CATALOG_INVALIDATION_CHANNEL
+from app.cache.redis_client import close_redis
+from app.simulation.enemy_armies import enemy_armies
+from app.utils.validators import schema_registry
+from app.puzzles.verifier import answer_verifier
+from app.services.archive_service import ArchiveService
 
 # Initialize Sentry for error tracking
 if settings.SENTRY_DSN:
@@ -41,6 +48,7 @@ llm_adapter = None
 vector_memory = None
 kafka_producer = None
 redis_pubsub = None
+archive_task = None
 
 
 @asynccontextmanager
@@ -49,7 +57,7 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
     STEP: Handles startup and shutdown of all services.
     """
-    global orchestrator, llm_adapter, vector_memory, kafka_producer, redis_pubsub
+    global orchestrator, llm_adapter, vector_memory, kafka_producer, redis_pubsub, archive_task
     
     # Startup
     print("Starting Thirteen Oracles of Astraeum backend...")
@@ -58,6 +66,17 @@ async def lifespan(app: FastAPI):
     await init_db()
     print("Database initialized")
     
+    # Load static oracle / army unit catalog
+    await catalog_cache.reload()
+    
+    # Compile every JSON schema once
+    schemas = schema_registry.load()
+    print(f"Schema registry compiled: {len(schemas)} schemas")
+    
+    # Precompute enemy armies for every oracle and difficulty
+    table = enemy_armies.load()
+    print(f"Enemy army table precomputed: {len(table)} entries")
+    
     # Initialize LLM adapter
     llm_adapter = LLMAdapter()
     print("LLM adapter initialized")
@@ -68,6 +87,8 @@ async def lifespan(app: FastAPI):
     
     # Initialize agent orchestrator
     orchestrator = AgentOrchestrator(llm_adapter, vector_memory)
+    phase_prefetcher.bind(orchestrator)
+    answer_verifier.bind(llm_adapter)
     print("Agent orchestrator initialized with 13 oracles")
     
     # Initialize Kafka producer
@@ -78,12 +99,19 @@ async def lifespan(app: FastAPI):
     # Initialize Redis pub/sub
     redis_pubsub = RedisPubSub()
     await redis_pubsub.connect()
+    await redis_pubsub.subscribe(CATALOG_INVALIDATION_CHANNEL, catalog_cache.handle_invalidation)
+    asyncio.create_task(redis_pubsub.listen())
     print("Redis pub/sub connected")
     
     # Start Kafka consumer
     await start_kafka_consumer(orchestrator)
     print("Kafka consumer started")
     
+    # Start cold archival of completed / idle games
+    if settings.ARCHIVE_INTERVAL_SECONDS > 0:
+        archive_task = asyncio.create_task(ArchiveService.run_periodically())
+        print("Game archival scheduled")
+    
     print("Backend ready on port", settings.API_PORT)
     
     yield
@@ -91,12 +119,17 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("Shutting down...")
     
+    if archive_task:
+        archive_task.cancel()
+    
     if kafka_producer:
         await kafka_producer.stop()
     
     if redis_pubsub:
         await redis_pubsub.close()
     
+    await close_redis()
+    
     if orchestrator:
         await orchestrator.shutdown()
     
@@ -6,8 +6,9 @@ STEP: Weaviate Vector Memory Integration
 Stores agent memories, player patterns, and context for semantic retrieval.
 """
 import weaviate
+import numpy as np
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.config import settings
 
@@ -199,6 +200,134 @@ class VectorMemory:
             print(f"Error retrieving memories: {e}")
             return []
     
+    async def retrieve_ranked_memories(
+        self,
+        oracle_name: str,
+        query: str,
+        limit: int = 3,
+        candidate_pool: Optional[int] = None,
+        min_importance: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve memories re-ranked by relevance, importance and recency.
+        STEP: Fetches a wide candidate set in one hybrid (BM25 + vector) query,
+        falling back to near-text, then scores it in-process and keeps the top `limit`.
+        """
+        candidate_pool = max(limit, candidate_pool or settings.MEMORY_CANDIDATE_POOL)
+        properties = ["oracle_name", "memory_type", "content", "context", "importance", "timestamp"]
+        where_filter = {
+            "operator": "And",
+            "operands": [
+                {
+                    "path": ["oracle_name"],
+                    "operator": "Equal",
+                    "valueString": oracle_name
+                },
+                {
+                    "path": ["importance"],
+                    "operator": "GreaterThanEqual",
+                    "valueNumber": min_importance
+                }
+            ]
+        }
+        
+        try:
+            try:
+                result = (
+                    self.client.query
+                    .get("AgentMemory", properties)
+                    .with_hybrid(query=query, alpha=settings.MEMORY_HYBRID_ALPHA)
+                    .with_where(where_filter)
+                    .with_additional(["score"])
+                    .with_limit(candidate_pool)
+                    .do()
+                )
+                if "errors" in result:
+                    raise RuntimeError(result["errors"])
+            except Exception:
+                # Hybrid search unavailable on this Weaviate version - use vector only
+                result = (
+                    self.client.query
+                    .get("AgentMemory", properties)
+                    .with_near_text({"concepts": [query]})
+                    .with_where(where_filter)
+                    .with_additional(["distance"])
+                    .with_limit(candidate_pool)
+                    .do()
+                )
+            
+            candidates = []
+            if "data" in result and "Get" in result["data"]:
+                candidates = result["data"]["Get"]["AgentMemory"] or []
+            return self.rank_memories(candidates, limit)
+        except Exception as e:
+            print(f"Error retrieving ranked memories: {e}")
+            return []
+    
+    @staticmethod
+    def rank_memories(
+        candidates: List[Dict[str, Any]],
+        limit: int,
+        now: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Score candidate memories and return the best `limit` of them.
+        STEP: Vectorized blend of normalized similarity, importance and exponential time decay.
+        """
+        if not candidates:
+            return []
+        
+        now = now or datetime.now(timezone.utc)
+        similarity = np.empty(len(candidates))
+        importance = np.empty(len(candidates))
+        age_hours = np.empty(len(candidates))
+        
+        for i, memory in enumerate(candidates):
+            additional = memory.get("_additional") or {}
+            if additional.get("score") is not None:
+                similarity[i] = float(additional["score"])
+            elif additional.get("distance") is not None:
+                # Cosine distance is in [0, 2]
+                similarity[i] = 1.0 - float(additional["distance"]) / 2.0
+            else:
+                similarity[i] = 0.0
+            importance[i] = float(memory.get("importance") or 0.0)
+            age_hours[i] = VectorMemory._age_hours(memory.get("timestamp"), now)
+        
+        # Hybrid scores are unbounded, so normalize into [0, 1] per query
+        peak = similarity.max()
+        if peak > 0:
+            similarity = similarity / peak
+        
+        recency = np.exp(-np.log(2) * age_hours / settings.MEMORY_HALF_LIFE_HOURS)
+        scores = (
+            settings.MEMORY_SIMILARITY_WEIGHT * np.clip(similarity, 0.0, 1.0)
+            + settings.MEMORY_IMPORTANCE_WEIGHT * np.clip(importance, 0.0, 1.0)
+            + settings.MEMORY_RECENCY_WEIGHT * recency
+        )
+        
+        top = np.argsort(-scores, kind="stable")[:limit]
+        ranked = []
+        for i in top:
+            memory = dict(candidates[i])
+            memory.pop("_additional", None)
+            memory["score"] = float(scores[i])
+            ranked.append(memory)
+        return ranked
+    
+    @staticmethod
+    def _age_hours(timestamp: Optional[str], now: datetime) -> float:
+        """Hours elapsed since an RFC3339 timestamp (unknown timestamps count as very old)"""
+        if not timestamp:
+            return float("inf")
+        try:
+            created = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return float("inf")
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)
+        return max(0.0, (now - created).total_seconds() / 3600.0)
+    
     async def store_player_pattern(
         self,
         player_id: str,
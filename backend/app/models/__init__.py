@@ -8,6 +8,10 @@ from app.models.player import Player, PlayerSession
 from app.models.oracle import Oracle, OracleState
 from app.models.game_state import GameState, DominionState
 from app.models.army import ArmyUnit, PlayerArmy
+from app.models.battle_log import BattleLogEntry
+from app.models.archive import ArchivedGame
+from app.models.game_event import GameEvent, GameSnapshot
+from app.models.puzzle_bank import PuzzleBankEntry, PuzzleSeen
 
 __all__ = [
     "Player",
@@ -18,4 +22,10 @@ __all__ = [
     "DominionState",
     "ArmyUnit",
     "PlayerArmy",
+    "BattleLogEntry",
+    "ArchivedGame",
+    "GameEvent",
+    "GameSnapshot",
+    "PuzzleBankEntry",
+    "PuzzleSeen",
 ]
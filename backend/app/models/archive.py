@@ -0,0 +1,25 @@
+"""
+backend/app/models/archive.py
+STEP: Archived Game Index
+One row per game moved out of the hot tables into object storage.
+"""
+from sqlalchemy import Column, Integer, SmallInteger, String, Boolean, ForeignKey, DateTime
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class ArchivedGame(Base):
+    """Pointer to a cold game snapshot in MinIO"""
+    __tablename__ = "archived_games"
+    
+    game_id = Column(Integer, primary_key=True)  # Original game_states.id, reused on restore
+    player_id = Column(Integer, ForeignKey("players.id", ondelete="CASCADE"), nullable=False, index=True)
+    
+    # Snapshot object
+    object_key = Column(String(255), nullable=False)
+    schema_version = Column(SmallInteger, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    
+    is_completed = Column(Boolean, default=False)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -5,7 +5,7 @@ backend/app/models/army.py
 STEP: Army and Unit Models
 Defines army units, player's military forces, and combat capabilities.
 """
-from sqlalchemy import Column, Integer, String, Float, JSON, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, Float, Boolean, JSON, ForeignKey, DateTime, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -0,0 +1,31 @@
+"""
+backend/app/models/battle_log.py
+STEP: Battle Log Model
+Append-only, numerically encoded combat events (one row per event, never rewritten).
+"""
+from sqlalchemy import Column, BigInteger, Integer, SmallInteger, ForeignKey, Index
+
+from app.database import Base
+
+
+class BattleLogEntry(Base):
+    """Single compact battle event: (battle, turn, event code, value)"""
+    __tablename__ = "battle_log_entries"
+    
+    # Event codes
+    PLAYER_DAMAGE = 1
+    ENEMY_DAMAGE = 2
+    VICTORY = 3
+    DEFEAT = 4
+    
+    id = Column(BigInteger, primary_key=True)
+    oracle_state_id = Column(Integer, ForeignKey("oracle_states.id", ondelete="CASCADE"), nullable=False)
+    battle_no = Column(Integer, nullable=False)  # Nth battle fought against this oracle in the game
+    turn = Column(SmallInteger, nullable=False)
+    event = Column(SmallInteger, nullable=False)
+    value = Column(Integer, nullable=False, default=0)  # Damage dealt, 0 for outcome events
+    
+    __table_args__ = (
+        # Serves "last N events of this battle" as an index range scan
+        Index("ix_battle_log_battle", "oracle_state_id", "battle_no", "id"),
+    )
@@ -0,0 +1,42 @@
+"""
+backend/app/models/game_event.py
+STEP: Game Event Log Models
+Append-only typed events (one per committed game version) plus periodic state snapshots.
+"""
+from sqlalchemy import Column, BigInteger, Integer, SmallInteger, LargeBinary, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class GameEvent(Base):
+    """One game mutation: the event that produced `version`"""
+    __tablename__ = "game_events"
+    
+    id = Column(BigInteger, primary_key=True)
+    game_state_id = Column(Integer, ForeignKey("game_states.id", ondelete="CASCADE"), nullable=False)
+    version = Column(Integer, nullable=False)  # Game version after this event
+    event_type = Column(SmallInteger, nullable=False)  # app.services.event_service.EventType
+    payload = Column(JSONB, nullable=False, default=dict)  # Resolved outcome, never inputs to re-roll
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        # One event per version; also serves "events after version N" range reads
+        UniqueConstraint("game_state_id", "version", name="uq_game_events_version"),
+    )
+
+
+class GameSnapshot(Base):
+    """Full replay state of a game at a version (msgpack + zstd)"""
+    __tablename__ = "game_snapshots"
+    
+    id = Column(BigInteger, primary_key=True)
+    game_state_id = Column(Integer, ForeignKey("game_states.id", ondelete="CASCADE"), nullable=False)
+    version = Column(Integer, nullable=False)
+    payload = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint("game_state_id", "version", name="uq_game_snapshots_version"),
+    )
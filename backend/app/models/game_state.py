@@ -6,6 +6,7 @@ STEP: Game State Models
 Tracks overall game progress, dominion control, and world state.
 """
 from sqlalchemy import Column, Integer, String, Boolean, JSON, ForeignKey, DateTime, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -29,10 +30,10 @@ class GameState(Base):
     insight_tokens = Column(Integer, default=1)
     healing_draughts = Column(Integer, default=1)
     
-    # Inventory
-    weapons = Column(JSON, default=list)  # ["Mortal Spear", ...]
+    # Inventory (JSONB: mutated in place via app.utils.jsonb)
+    weapons = Column(JSONB, default=list)  # ["Mortal Spear", ...]
     special_items = Column(JSON, default=list)
-    potions = Column(JSON, default=list)
+    potions = Column(JSONB, default=list)
     
     # Game status
     is_active = Column(Boolean, default=True)
@@ -40,9 +41,12 @@ class GameState(Base):
     difficulty_level = Column(String(20), default="normal")  # easy, normal, hard
     
     # World state
-    world_state = Column(JSON)  # Global rule changes, alliances, etc.
+    world_state = Column(JSONB)  # Global rule changes, alliances, etc.
     active_events = Column(JSON, default=list)
     
+    # Row version: bumped explicitly on every mutating service call (cache key + optimistic lock)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -54,6 +58,11 @@ class GameState(Base):
     oracle_states = relationship("OracleState", back_populates="game_state", cascade="all, delete-orphan")
     dominion_states = relationship("DominionState", back_populates="game_state", cascade="all, delete-orphan")
     player_armies = relationship("PlayerArmy", back_populates="game_state", cascade="all, delete-orphan")
+    
+    __mapper_args__ = {
+        "version_id_col": version,
+        "version_id_generator": False,  # GameService.commit_game_mutation sets the next version
+    }
 
 
 class DominionState(Base):
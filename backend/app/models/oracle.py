@@ -6,6 +6,7 @@ STEP: Oracle Agent Models
 Defines Oracle metadata, state tracking, and interaction history.
 """
 from sqlalchemy import Column, Integer, String, Boolean, JSON, Float, Text, ForeignKey, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -64,7 +65,7 @@ class OracleState(Base):
     
     # Dynamic state
     current_phase = Column(String(50))  # exploration, puzzle, battle, confrontation
-    puzzle_state = Column(JSON)
+    puzzle_state = Column(JSONB)  # Patched in place via app.utils.jsonb
     battle_state = Column(JSON)
     diplomatic_stance = Column(Float, default=0.0)  # -1.0 to 1.0
     
@@ -72,6 +73,9 @@ class OracleState(Base):
     deception_activated = Column(Boolean, default=False)
     special_rules_active = Column(JSON)  # Oracle-specific rule changes
     
+    # Optimistic lock: incremented by the ORM on every UPDATE
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -80,3 +84,5 @@ class OracleState(Base):
     # Relationships
     oracle = relationship("Oracle", back_populates="states")
     game_state = relationship("GameState", back_populates="oracle_states")
+    
+    __mapper_args__ = {"version_id_col": version}
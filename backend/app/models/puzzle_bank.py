@@ -0,0 +1,48 @@
+"""
+backend/app/models/puzzle_bank.py
+STEP: Puzzle Bank Models
+Generated puzzles kept for reuse across players, indexed by (oracle, puzzle type,
+difficulty, slot), plus a per-player bitmap of the slots already served.
+"""
+from sqlalchemy import Column, BigInteger, Integer, SmallInteger, String, LargeBinary, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class PuzzleBankEntry(Base):
+    """One banked puzzle: slot N of its (oracle, type, difficulty) bucket"""
+    __tablename__ = "puzzle_bank"
+    
+    id = Column(BigInteger, primary_key=True)
+    oracle_id = Column(Integer, ForeignKey("oracles.id", ondelete="CASCADE"), nullable=False)
+    puzzle_type = Column(String(50), nullable=False)
+    difficulty = Column(SmallInteger, nullable=False)
+    slot = Column(Integer, nullable=False)  # Dense 0..N-1 within the bucket (bit index in seen bitmaps)
+    content_hash = Column(LargeBinary(16), nullable=False)  # blake2b of the normalized puzzle text
+    puzzle = Column(JSONB, nullable=False)
+    
+    # Usage statistics (solve rate = solves / uses)
+    uses = Column(Integer, nullable=False, default=0, server_default="0")
+    solves = Column(Integer, nullable=False, default=0, server_default="0")
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        # Serves "slot N of this bucket" and "bucket size" from the index
+        UniqueConstraint("oracle_id", "puzzle_type", "difficulty", "slot", name="uq_puzzle_bank_slot"),
+        # The same puzzle is banked once per bucket
+        UniqueConstraint("oracle_id", "puzzle_type", "difficulty", "content_hash", name="uq_puzzle_bank_content"),
+    )
+
+
+class PuzzleSeen(Base):
+    """Bank slots a player has been served in one bucket (bit N = slot N, LSB first)"""
+    __tablename__ = "puzzle_bank_seen"
+    
+    player_id = Column(Integer, ForeignKey("players.id", ondelete="CASCADE"), primary_key=True)
+    oracle_id = Column(Integer, ForeignKey("oracles.id", ondelete="CASCADE"), primary_key=True)
+    puzzle_type = Column(String(50), primary_key=True)
+    difficulty = Column(SmallInteger, primary_key=True)
+    bitmap = Column(LargeBinary, nullable=False, default=b"")
@@ -0,0 +1,4 @@
+"""
+backend/app/puzzles/__init__.py
+Procedural puzzle package
+"""
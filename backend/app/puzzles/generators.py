@@ -0,0 +1,325 @@
+"""
+backend/app/puzzles/generators.py
+STEP: Procedural Puzzle Generators
+Seeded, difficulty-tuned generators for the structured puzzle types (pattern,
+temporal_sequence, shadow_maze, strategic_positioning). Every puzzle has exactly
+one solution and is built in about a millisecond or less; the LLM only adds
+optional flavor text (BaseOracle.procedural_puzzle).
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import random
+
+MAX_DIFFICULTY = 13
+
+# (name, minimum difficulty) of each sequence rule family
+SEQUENCE_RULES = (
+    ("arithmetic", 1),
+    ("geometric", 3),
+    ("quadratic", 5),
+    ("fibonacci", 6),
+    ("affine", 8),
+    ("interleaved", 10),
+)
+
+# Maze moves: (row delta, column delta) per letter
+MOVES = {"U": (-1, 0), "D": (1, 0), "L": (0, -1), "R": (0, 1)}
+
+COLUMNS = "abcdefgh"
+
+
+def _sequence(rule: str, length: int, difficulty: int, rng: random.Random) -> Tuple[List[int], str]:
+    """`length` + 1 terms of a rule family (the last one is the answer) and its description"""
+    if rule == "arithmetic":
+        start, step = rng.randint(1, 20), rng.choice([-1, 1]) * rng.randint(2, 3 + difficulty)
+        return [start + n * step for n in range(length + 1)], f"add {step}"
+    if rule == "geometric":
+        start, ratio = rng.randint(1, 5), rng.randint(2, 3 if difficulty < 7 else 4)
+        return [start * ratio ** n for n in range(length + 1)], f"multiply by {ratio}"
+    if rule == "quadratic":
+        a, b, c = rng.randint(1, 3), rng.randint(-3, 5), rng.randint(0, 9)
+        return [a * n * n + b * n + c for n in range(1, length + 2)], f"{a}n^2 + {b}n + {c}"
+    if rule == "fibonacci":
+        terms = [rng.randint(1, 5), rng.randint(2, 8)]
+        while len(terms) < length + 1:
+            terms.append(terms[-1] + terms[-2])
+        return terms, "each term is the sum of the two before it"
+    if rule == "affine":
+        multiplier, offset = rng.randint(2, 3), rng.randint(-4, 6)
+        terms = [rng.randint(1, 6)]
+        while len(terms) < length + 1:
+            terms.append(terms[-1] * multiplier + offset)
+        return terms, f"multiply by {multiplier}, then add {offset}"
+    # interleaved: two arithmetic progressions taking turns
+    first, second = rng.randint(1, 15), rng.randint(20, 40)
+    step_a, step_b = rng.randint(2, 6), -rng.randint(1, 4)
+    terms = [first + (n // 2) * step_a if n % 2 == 0 else second + (n // 2) * step_b for n in range(length + 1)]
+    return terms, f"two interleaved sequences: add {step_a} / add {step_b}"
+
+
+def pattern_puzzle(difficulty: int, rng: random.Random) -> Dict[str, Any]:
+    """
+    Next value of a number sequence.
+    STEP: Harder puzzles draw from more rule families and show fewer terms.
+    """
+    rule = rng.choice([name for name, minimum in SEQUENCE_RULES if minimum <= difficulty])
+    length = max(4, 7 - difficulty // 4) + (2 if rule == "interleaved" else 0)
+    terms, description = _sequence(rule, length, difficulty, rng)
+    answer = str(terms[-1])
+    return {
+        "description": "What number comes next? " + ", ".join(map(str, terms[:-1])) + ", ...",
+        "sequence": terms[:-1],
+        "next_value": answer,
+        "pattern_rule": description,
+        "solution": answer,
+        "hints": [
+            "Compare each term with the one before it.",
+            f"The rule is of the {rule} kind.",
+            f"The rule: {description}.",
+        ],
+    }
+
+
+def temporal_sequence_puzzle(difficulty: int, rng: random.Random) -> Dict[str, Any]:
+    """
+    Next reading of a drifting clock.
+    STEP: Times wrap around midnight; from difficulty 5 the interval grows every
+    tick, from difficulty 9 it grows by a growing amount.
+    """
+    start = rng.randrange(0, 24 * 60, 5)
+    interval = rng.randrange(15, 60 + difficulty * 30, 5)
+    growth = rng.randrange(5, 30, 5) if difficulty >= 5 else 0
+    acceleration = 5 if difficulty >= 9 else 0
+    length = max(4, 6 - difficulty // 5)
+
+    minutes = [start]
+    for n in range(length):
+        minutes.append(minutes[-1] + interval + n * growth + n * (n - 1) // 2 * acceleration)
+    times = ["%02d:%02d" % divmod(m % (24 * 60), 60) for m in minutes]
+
+    rule = f"{interval} minutes"
+    if growth:
+        rule += f", growing by {growth} minutes each tick"
+    if acceleration:
+        rule += f", the growth itself rising by {acceleration}"
+    return {
+        "description": "The temporal clock chimes at " + ", ".join(times[:-1]) + ". When does it chime next?",
+        "sequence": times[:-1],
+        "solution": times[-1],
+        "pattern_rule": rule,
+        "hints": [
+            "Measure the minutes between chimes, across midnight if needed.",
+            "The gaps are not all equal." if growth else "The gaps are all equal.",
+            f"The gap: {rule}.",
+        ],
+    }
+
+
+def _carve_maze(rows: int, cols: int, rng: random.Random) -> List[List[str]]:
+    """Open moves per cell of a perfect maze (one path between any two cells), by randomized depth-first search"""
+    links = [["" for _ in range(cols)] for _ in range(rows)]
+    visited = [[False] * cols for _ in range(rows)]
+    visited[0][0] = True
+    stack = [(0, 0)]
+    while stack:
+        r, c = stack[-1]
+        options = [
+            (move, r + dr, c + dc) for move, (dr, dc) in MOVES.items()
+            if 0 <= r + dr < rows and 0 <= c + dc < cols and not visited[r + dr][c + dc]
+        ]
+        if not options:
+            stack.pop()
+            continue
+        move, nr, nc = rng.choice(options)
+        links[r][c] += move
+        links[nr][nc] += {"U": "D", "D": "U", "L": "R", "R": "L"}[move]
+        visited[nr][nc] = True
+        stack.append((nr, nc))
+    return links
+
+
+def _walk(links: List[List[str]], start: Tuple[int, int], goal: Optional[Tuple[int, int]], blocked: Tuple[int, int] = None) -> Tuple[str, List[Tuple[int, int]]]:
+    """
+    Moves and cells from `start` to `goal` (or, without a goal, to the farthest
+    dead end) never stepping onto `blocked`.
+    """
+    parents = {start: (None, None)}
+    order = [start]
+    for cell in order:
+        if cell == goal:
+            break
+        r, c = cell
+        for move in links[r][c]:
+            dr, dc = MOVES[move]
+            nxt = (r + dr, c + dc)
+            if nxt != blocked and nxt not in parents:
+                parents[nxt] = (cell, move)
+                order.append(nxt)
+
+    cell = goal if goal is not None else order[-1]
+    moves, cells = [], [cell]
+    while parents[cell][0] is not None:
+        cell, move = parents[cell]
+        moves.append(move)
+        cells.append(cell)
+    return "".join(reversed(moves)), cells[::-1]
+
+
+def shadow_maze_puzzle(difficulty: int, rng: random.Random) -> Dict[str, Any]:
+    """
+    Way through a maze, given as U/D/L/R moves from S to E.
+    STEP: A perfect maze is always solvable with exactly one route; the longest
+    dead-end branches off that route are listed as false paths, and fewer truth
+    markers (cells on the route) are revealed as difficulty rises.
+    """
+    size = 4 + difficulty // 2
+    links = _carve_maze(size, size, rng)
+    start, goal = (0, 0), (size - 1, size - 1)
+    solution, route = _walk(links, start, goal)
+    on_route = set(route)
+
+    # Branches leaving the route, longest first
+    branches = []
+    for index, (r, c) in enumerate(route):
+        for move in links[r][c]:
+            dr, dc = MOVES[move]
+            entry = (r + dr, c + dc)
+            if entry not in on_route:
+                moves, _ = _walk(links, entry, None, blocked=(r, c))
+                branches.append({"from_step": index, "moves": move + moves})
+    branches.sort(key=lambda branch: -len(branch["moves"]))
+    false_paths = branches[:1 + difficulty // 3]
+
+    layout = [["#"] * (2 * size + 1) for _ in range(2 * size + 1)]
+    for r in range(size):
+        for c in range(size):
+            layout[2 * r + 1][2 * c + 1] = "."
+            if "R" in links[r][c]:
+                layout[2 * r + 1][2 * c + 2] = "."
+            if "D" in links[r][c]:
+                layout[2 * r + 2][2 * c + 1] = "."
+    layout[1][1], layout[2 * size - 1][2 * size - 1] = "S", "E"
+
+    marker_count = max(1, (len(route) - 2) // (2 + difficulty // 2))
+    markers = sorted(rng.sample(route[1:-1], min(marker_count, len(route) - 2)))
+    return {
+        "description": f"Find the way from S to E through the {size}x{size} shadow maze. Answer with moves (U, D, L, R), one per cell.",
+        "maze_layout": ["".join(row) for row in layout],
+        "false_paths": false_paths,
+        "truth_markers": [list(cell) for cell in markers],
+        "solution": solution,
+        "hints": [
+            "Truth markers (row, column) lie on the only way through.",
+            f"The way is {len(solution)} moves long.",
+            f"It begins {solution[:max(2, len(solution) // 4)]}.",
+        ],
+    }
+
+
+def _other_placement(allowed: List[int], secret: List[int]) -> Optional[List[int]]:
+    """
+    A one-per-row-and-column placement within `allowed` (column bitmask per row)
+    other than `secret`. Depth-first, most constrained row first, pruning as soon
+    as a row or column runs out of open cells.
+    """
+    n = len(allowed)
+    columns = [0] * n
+
+    def search(rows: List[int], used: int, differs: bool) -> bool:
+        if not rows:
+            return differs
+        free = ~used
+        best, best_count, reachable = None, n + 1, 0
+        for row in rows:
+            mask = allowed[row] & free
+            count = bin(mask).count("1")
+            if count == 0:
+                return False
+            reachable |= mask
+            if count < best_count:
+                best, best_count = row, count
+        if bin(reachable).count("1") < len(rows):
+            return False
+
+        rest = [row for row in rows if row != best]
+        mask = allowed[best] & free
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            columns[best] = bit.bit_length() - 1
+            if search(rest, used | bit, differs or columns[best] != secret[best]):
+                return True
+        return False
+
+    return list(columns) if search(list(range(n)), 0, False) else None
+
+
+def _cell(row: int, column: int) -> str:
+    return f"{COLUMNS[column]}{row + 1}"
+
+
+def strategic_positioning_puzzle(difficulty: int, rng: random.Random) -> Dict[str, Any]:
+    """
+    Place one banner in every row and column of a board with blocked cells.
+    STEP: A hidden placement is drawn first; cells are then blocked, each ruling
+    out the alternative the solver just found, until the hidden placement is the
+    only one left. Harder boards are larger with fewer banners pre-placed.
+    """
+    n = min(4 + difficulty // 3, len(COLUMNS))
+    secret = list(range(n))
+    rng.shuffle(secret)
+
+    fixed = sorted(rng.sample(range(n), max(0, n // 2 - difficulty // 4)))
+    full = (1 << n) - 1
+    allowed = [1 << secret[row] if row in fixed else full for row in range(n)]
+
+    blocked = []
+    while True:
+        other = _other_placement(allowed, secret)
+        if other is None:
+            break
+        row = rng.choice([row for row in range(n) if other[row] != secret[row]])
+        allowed[row] &= ~(1 << other[row])
+        blocked.append((row, other[row]))
+
+    return {
+        "description": f"Place one banner in every row and every column of the {n}x{n} field. "
+                       "Blocked cells cannot hold a banner. Answer with the banner cells, row by row.",
+        "board_size": f"{n}x{n}",
+        "pieces": [{"piece": "banner", "cell": _cell(row, secret[row])} for row in fixed],
+        "constraints": [
+            {"rule": "one_per_row_and_column", "count": n},
+            {"rule": "blocked", "cells": sorted(_cell(row, column) for row, column in blocked)},
+        ],
+        "solution": " ".join(_cell(row, secret[row]) for row in range(n)),
+        "hints": [
+            "Start with rows or columns that have a single open cell.",
+            f"{len(blocked)} cells are blocked.",
+            f"Row 1 holds its banner at {_cell(0, secret[0])}.",
+        ],
+    }
+
+
+PUZZLE_GENERATORS: Dict[str, Callable[[int, random.Random], Dict[str, Any]]] = {
+    "pattern": pattern_puzzle,
+    "temporal_sequence": temporal_sequence_puzzle,
+    "shadow_maze": shadow_maze_puzzle,
+    "strategic_positioning": strategic_positioning_puzzle,
+}
+
+
+def generate_puzzle(puzzle_type: str, difficulty: int, seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    One procedural puzzle of a structured type.
+    STEP: The same (type, difficulty, seed) always yields the same puzzle; the seed
+    is returned with it so a puzzle can be regenerated instead of stored.
+    """
+    generator = PUZZLE_GENERATORS.get(puzzle_type)
+    if generator is None:
+        raise ValueError(f"No procedural generator for puzzle type '{puzzle_type}'")
+
+    difficulty = min(max(int(difficulty or 1), 1), MAX_DIFFICULTY)
+    if seed is None:
+        seed = random.getrandbits(31)
+    puzzle = generator(difficulty, random.Random(seed))
+    puzzle.update(puzzle_type=puzzle_type, difficulty=difficulty, seed=seed)
+    return puzzle
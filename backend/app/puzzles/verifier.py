@@ -0,0 +1,274 @@
+"""
+backend/app/puzzles/verifier.py
+STEP: Local Answer Verification
+Judges puzzle answers without an LLM: normalization (case, accents, punctuation,
+filler words, number words), alias sets, word-order-aware token overlap and edit
+distance. Near
+misses above an escalation threshold can be settled by embedding similarity
+against cached answer vectors.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Tuple
+import re
+import unicodedata
+
+import numpy as np
+
+from app.config import settings
+from app.puzzles.generators import PUZZLE_GENERATORS
+from app.utils.metrics import PUZZLE_ANSWER_VERDICTS
+
+# Words dropped before comparing ("the sound of echoes" == "echoes sound")
+FILLER_WORDS = frozenset({"a", "an", "the", "of"})
+
+NUMBER_WORDS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6,
+    "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+    "thirteen": 13, "fourteen": 14, "fifteen": 15, "sixteen": 16, "seventeen": 17,
+    "eighteen": 18, "nineteen": 19, "twenty": 20, "thirty": 30, "forty": 40,
+    "fifty": 50, "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+SCALE_WORDS = {"hundred": 100, "thousand": 1000, "million": 1000000}
+
+# Puzzle keys holding accepted answers, in order of preference
+ANSWER_KEYS = ("solution", "answer", "just_solution", "next_value")
+ALIAS_KEYS = ("alternative_answers", "aliases")
+# Puzzle keys that give the answer away: the generator seed (regenerates the
+# puzzle), the rule of a sequence and Nyx's lie markers
+SECRET_KEYS = ("seed", "pattern_rule", "lie_indices")
+
+# Puzzle types answered with a string of single-letter moves ("D, D, R" == "DDR")
+MOVE_PUZZLES = frozenset({"shadow_maze"})
+MOVE_WORDS = {"up": "u", "down": "d", "left": "l", "right": "r"}
+
+_POSSESSIVE = re.compile(r"'s\b")
+_NON_WORD = re.compile(r"[^\w\s-]|_")
+# Whitespace and hyphens, except a minus sign starting a number ("-7", "twenty-one")
+_SEPARATORS = re.compile(r"\s+|(?<=[^\s-])-+|-+(?!\d)")
+_INTEGER = re.compile(r"-?\d+")
+
+
+def _numerals(tokens: List[str]) -> List[str]:
+    """Number words to digits ("twenty one" -> "21"); integer tokens lose leading zeros, keep their sign"""
+    out: List[str] = []
+    total = current = None
+    for i, token in enumerate(tokens):
+        if token in NUMBER_WORDS or token in SCALE_WORDS:
+            total, current = total or 0, current or 0
+            if token in NUMBER_WORDS:
+                current += NUMBER_WORDS[token]
+            elif SCALE_WORDS[token] == 100:
+                current = (current or 1) * 100
+            else:
+                total, current = total + (current or 1) * SCALE_WORDS[token], 0
+            continue
+        if token == "and" and current is not None and i + 1 < len(tokens) and tokens[i + 1] in NUMBER_WORDS:
+            continue
+        if current is not None:
+            out.append(str(total + current))
+            total = current = None
+        out.append(str(int(token)) if _INTEGER.fullmatch(token) else token)
+    if current is not None:
+        out.append(str(total + current))
+    return out
+
+
+@lru_cache(maxsize=8192)
+def normalize_answer(text: str) -> str:
+    """Canonical form of an answer: lowercase ASCII words, no punctuation or filler words, digits for numbers"""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower()
+    tokens = _SEPARATORS.split(_NON_WORD.sub(" ", _POSSESSIVE.sub("", text)).strip())
+    return " ".join(_numerals([token for token in tokens if token and token not in FILLER_WORDS]))
+
+
+def compact_moves(text: str) -> str:
+    """Normalized move list as one move string ("d d r" / "down down right" -> "ddr")"""
+    tokens = [MOVE_WORDS.get(token, token) for token in text.split()]
+    return "".join(tokens) if all(len(token) == 1 for token in tokens) else text
+
+
+def token_set_similarity(a: str, b: str) -> float:
+    """Shared words over the larger word set (1.0 = same words in any order)"""
+    left, right = set(a.split()), set(b.split())
+    if not left or not right:
+        return 0.0
+    return len(left & right) / max(len(left), len(right))
+
+
+def token_sequence_similarity(a: str, b: str) -> float:
+    """Words matched in order, over both word counts (1.0 = same words, same order)"""
+    left, right = a.split(), b.split()
+    if not left or not right:
+        return 0.0
+    return SequenceMatcher(None, left, right, autojunk=False).ratio()
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, or `limit` + 1 as soon as it must exceed `limit`"""
+    if len(a) < len(b):
+        a, b = b, a
+    if len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def public_puzzle(puzzle: Mapping[str, Any]) -> Dict[str, Any]:
+    """Puzzle as shown to the player: answers and secrets withheld, one hint unlocked per failed attempt"""
+    hidden = set(ANSWER_KEYS + ALIAS_KEYS + SECRET_KEYS)
+    view = {key: value for key, value in puzzle.items() if key not in hidden}
+    if isinstance(view.get("hints"), list):
+        view["hints"] = view["hints"][:puzzle.get("attempts") or 0]
+    return view
+
+
+@dataclass(frozen=True, slots=True)
+class Verdict:
+    """Outcome of one answer check"""
+    correct: bool
+    method: str  # exact | alias | token_sequence | token_set | edit_distance | embedding | rejected
+    score: float
+    escalated: bool = False
+
+
+class AnswerVerifier:
+    """
+    Answer judge for stored puzzles.
+    STEP: Structured (procedural) puzzles and numeric answers must match exactly
+    after normalization; free-form answers also accept small wording changes and
+    typos, but keep their word order unless stored as a list of words (a bag). Anything scoring above PUZZLE_ANSWER_ESCALATE_THRESHOLD without being
+    accepted is escalated to the embedding check when an embedder is bound.
+    """
+
+    def __init__(self, cache_size: int = None):
+        self.cache_size = cache_size or settings.PUZZLE_ANSWER_EMBEDDING_CACHE_SIZE
+        self.llm = None
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def bind(self, llm_adapter):
+        """Attach the LLM adapter whose embedding endpoint settles near misses"""
+        self.llm = llm_adapter
+
+    @staticmethod
+    def accepted_answers(puzzle: Mapping[str, Any]) -> Tuple[List[str], List[str]]:
+        """Normalized (primary answers, aliases) of a stored puzzle"""
+        primary = [normalize_answer(str(puzzle[key])) for key in ANSWER_KEYS if puzzle.get(key) not in (None, "")]
+        aliases = [
+            normalize_answer(str(alias))
+            for key in ALIAS_KEYS for alias in (puzzle.get(key) or [])
+            if alias not in (None, "")
+        ]
+        return primary, aliases
+
+    @staticmethod
+    def unordered_answers(puzzle: Mapping[str, Any]) -> List[str]:
+        """Normalized answers stored as lists, whose words may come in any order"""
+        values = [puzzle.get(key) for key in ANSWER_KEYS] + [
+            alias for key in ALIAS_KEYS for alias in (puzzle.get(key) or [])
+        ]
+        return [normalize_answer(str(value)) for value in values if isinstance(value, (list, tuple)) and value]
+
+    def judge(self, answer: str, puzzle: Mapping[str, Any]) -> Verdict:
+        """
+        Local verdict (no I/O).
+        STEP: exact / alias match, then token (in order, or as a set for list
+        answers) and edit-distance scores against every accepted answer; the best
+        score is kept for escalation.
+        """
+        primary, aliases = self.accepted_answers(puzzle)
+        unordered = self.unordered_answers(puzzle)
+        candidate = normalize_answer(str(answer))
+        if puzzle.get("puzzle_type") in MOVE_PUZZLES:
+            candidate = compact_moves(candidate)
+            primary = [compact_moves(accepted) for accepted in primary]
+            aliases = [compact_moves(accepted) for accepted in aliases]
+        if not candidate or not (primary or aliases):
+            return Verdict(False, "rejected", 0.0)
+        if candidate in primary:
+            return Verdict(True, "exact", 1.0)
+        if candidate in aliases:
+            return Verdict(True, "alias", 1.0)
+
+        structured = puzzle.get("puzzle_type") in PUZZLE_GENERATORS
+        best = 0.0
+        for accepted in primary + aliases:
+            if structured or _INTEGER.fullmatch(accepted) or _INTEGER.fullmatch(candidate):
+                continue
+            # Reordered words can flip a sentence's meaning; only list answers are bags
+            if accepted in unordered:
+                method, token_score = "token_set", token_set_similarity(candidate, accepted)
+            else:
+                method, token_score = "token_sequence", token_sequence_similarity(candidate, accepted)
+            if token_score >= settings.PUZZLE_ANSWER_TOKEN_THRESHOLD:
+                return Verdict(True, method, token_score)
+            # Typos allowed: the ratio threshold, but at least PUZZLE_ANSWER_MAX_TYPOS
+            # edits unless the answer is too short for a typo to stay unambiguous
+            length = max(len(candidate), len(accepted))
+            allowed = int(length * (1 - settings.PUZZLE_ANSWER_EDIT_RATIO))
+            if len(accepted) >= settings.PUZZLE_ANSWER_TYPO_MIN_LENGTH:
+                allowed = max(allowed, settings.PUZZLE_ANSWER_MAX_TYPOS)
+            cutoff = allowed
+            if settings.PUZZLE_ANSWER_EMBEDDINGS:
+                # Near misses need their score for escalation
+                cutoff = max(allowed, int(length * (1 - settings.PUZZLE_ANSWER_ESCALATE_THRESHOLD)))
+            distance = edit_distance(candidate, accepted, cutoff)
+            edit_score = max(0.0, 1.0 - distance / length)
+            if distance <= allowed:
+                return Verdict(True, "edit_distance", edit_score)
+            best = max(best, token_score, edit_score)
+        return Verdict(False, "rejected", best)
+
+    async def _vector(self, text: str) -> np.ndarray:
+        """Unit-length embedding of a normalized answer (LRU-cached)"""
+        vector = self._vectors.get(text)
+        if vector is not None:
+            self._vectors.move_to_end(text)
+            return vector
+
+        vector = np.asarray(await self.llm.embed_text(text), dtype=np.float32)
+        vector /= np.linalg.norm(vector) or 1.0
+        self._vectors[text] = vector
+        while len(self._vectors) > self.cache_size:
+            self._vectors.popitem(last=False)
+        return vector
+
+    async def verify(self, answer: str, puzzle: Mapping[str, Any]) -> Verdict:
+        """
+        Judge an answer, escalating near misses to embedding similarity.
+        STEP: Only rejected free-form answers scoring above the escalation threshold
+        cost an embedding call (accepted-answer vectors are cached); embedding
+        failures keep the local verdict.
+        """
+        verdict = self.judge(answer, puzzle)
+        if (
+            not verdict.correct
+            and verdict.score >= settings.PUZZLE_ANSWER_ESCALATE_THRESHOLD
+            and settings.PUZZLE_ANSWER_EMBEDDINGS
+            and self.llm is not None
+        ):
+            primary, aliases = self.accepted_answers(puzzle)
+            try:
+                candidate = await self._vector(normalize_answer(str(answer)))
+                similarity = max([float(candidate @ await self._vector(accepted)) for accepted in primary + aliases])
+            except Exception as e:
+                print(f"Answer embedding check failed: {e}")
+            else:
+                accepted = similarity >= settings.PUZZLE_ANSWER_EMBEDDING_THRESHOLD
+                verdict = Verdict(accepted, "embedding" if accepted else "rejected", similarity, escalated=True)
+
+        PUZZLE_ANSWER_VERDICTS.labels(method=verdict.method).inc()
+        return verdict
+
+
+# Process-wide verifier (embedder bound during application startup)
+answer_verifier = AnswerVerifier()
@@ -8,7 +8,7 @@ API routes package
 """
 from fastapi import APIRouter
 
-from app.routes import auth, game, oracle, assets
+from app.routes import auth, game, oracle, assets, admin
 
 api_router = APIRouter()
 
@@ -16,3 +16,4 @@ api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(game.router, prefix="/game", tags=["game"])
 api_router.include_router(oracle.router, prefix="/oracle", tags=["oracle"])
 api_router.include_router(assets.router, prefix="/assets", tags=["assets"])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
@@ -0,0 +1,220 @@
+"""
+backend/app/routes/admin.py
+STEP: Admin API Routes
+Operational endpoints restricted to admin players.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
+from typing import List, Optional
+
+from app.database import get_db
+from app.services.game_service import GameService
+from app.services.archive_service import ArchiveService
+from app.services.snapshot_service import SnapshotDecoder
+from app.services.event_service import GameEventService
+from app.routes.auth import get_current_player
+from app.models.player import Player
+from app.cache.catalog import catalog_cache, CATALOG_INVALIDATION_CHANNEL, PROCESS_ID
+
+router = APIRouter()
+
+# Upper bound on games created by one batch request
+MAX_BATCH_GAMES = 1000
+
+
+class BatchCreateGamesRequest(BaseModel):
+    player_ids: List[int]
+    difficulty: str = "normal"
+
+
+async def require_admin(player: Player = Depends(get_current_player)) -> Player:
+    """Dependency rejecting non-admin players"""
+    if not player.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required"
+        )
+    return player
+
+
+@router.post("/catalog/reload")
+async def reload_catalog(player: Player = Depends(require_admin)):
+    """
+    Reload the oracle / army unit catalog.
+    STEP: Reloads this process and signals the others via Redis.
+    """
+    from app.main import redis_pubsub
+    
+    catalog = await catalog_cache.reload()
+    if redis_pubsub:
+        await redis_pubsub.publish(
+            CATALOG_INVALIDATION_CHANNEL,
+            {"origin": PROCESS_ID, "requested_by": player.id}
+        )
+    
+    return {
+        "message": "Catalog reloaded",
+        "oracles": len(catalog.oracles),
+        "army_units": len(catalog.army_units)
+    }
+
+
+@router.post("/games/batch")
+async def create_games_batch(
+    request: BatchCreateGamesRequest,
+    player: Player = Depends(require_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create one game per listed player in a single transaction.
+    STEP: Used for onboarding waves and load tests.
+    """
+    if len(request.player_ids) > MAX_BATCH_GAMES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BATCH_GAMES} games per batch"
+        )
+    
+    game_states = await GameService.create_new_games(
+        db,
+        request.player_ids,
+        request.difficulty
+    )
+    
+    return {
+        "created": len(game_states),
+        "game_ids": [game_state.id for game_state in game_states]
+    }
+
+
+@router.delete("/games/{game_id}/cache")
+async def invalidate_game_cache(
+    game_id: int,
+    player: Player = Depends(require_admin)
+):
+    """
+    Drop cached snapshots for a game.
+    STEP: Next read reloads the game state from Postgres.
+    """
+    await GameService.invalidate_game_cache(game_id)
+    return {"message": "Game cache invalidated", "game_id": game_id}
+
+
+@router.post("/archive/run")
+async def run_archival(
+    limit: Optional[int] = None,
+    idle_days: Optional[int] = None,
+    player: Player = Depends(require_admin)
+):
+    """
+    Run one cold-archival pass now.
+    STEP: Archives completed games and games idle for `idle_days`.
+    """
+    archived = await ArchiveService.archive_due_games(limit, idle_days)
+    return {"archived": archived}
+
+
+@router.post("/games/{game_id}/archive")
+async def archive_game(
+    game_id: int,
+    player: Player = Depends(require_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Archive a single game immediately.
+    STEP: Snapshot to object storage, hot rows deleted.
+    """
+    if not await ArchiveService.archive_game(db, game_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Game not found, busy or in battle"
+        )
+    return {"message": "Game archived", "game_id": game_id}
+
+
+@router.post("/games/import")
+async def import_game_snapshot(
+    player_id: int,
+    request: Request,
+    player: Player = Depends(require_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Import a game snapshot (request body) as a new game for `player_id`.
+    STEP: Decodes the upload incrementally, then bulk inserts with fresh ids.
+    Admin-only: snapshot contents (gold, armies, ...) are taken as-is.
+    """
+    decoder = SnapshotDecoder()
+    try:
+        async for chunk in request.stream():
+            decoder.feed(chunk)
+        snapshot = decoder.finish()
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid snapshot: {e}"
+        )
+    
+    game_id = await GameService.import_game_snapshot(db, snapshot, player_id)
+    return {"message": "Game imported", "game_id": game_id}
+
+
+@router.get("/games/{game_id}/events")
+async def list_game_events(
+    game_id: int,
+    after: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    player: Player = Depends(require_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Audit view of a game's event log.
+    STEP: Up to `limit` (1-1000) events with version > `after`, oldest first.
+    """
+    events = await GameEventService.list_events(db, game_id, after, limit)
+    return {"game_id": game_id, "events": events}
+
+
+@router.get("/games/{game_id}/state")
+async def reconstruct_game_state(
+    game_id: int,
+    version: Optional[int] = None,
+    player: Player = Depends(require_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Rebuild a game's state at `version` from its history (read-only).
+    STEP: Nearest snapshot + replay of the event tail.
+    """
+    try:
+        state = await GameEventService.reconstruct(db, game_id, version)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    if state is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No history covers this game version"
+        )
+    return state
+
+
+@router.post("/games/{game_id}/rebuild")
+async def rebuild_game_tables(
+    game_id: int,
+    version: Optional[int] = None,
+    player: Player = Depends(require_admin),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Re-project a game's tables from its history.
+    STEP: Without `version` repairs the tables to the latest logged state;
+    with it the game is rewound (as a new version, history is kept).
+    """
+    try:
+        new_version = await GameEventService.rebuild_tables(db, game_id, version)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return {"message": "Game rebuilt", "game_id": game_id, "version": new_version}
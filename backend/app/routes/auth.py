@@ -6,12 +6,14 @@ STEP: Authentication API Routes
 Handles registration, login, logout, token validation.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, EmailStr
 
-from app.database import get_db
+from app.database import get_db, get_read_db, retry_on_conflict
 from app.services.game_service import GameService
+from app.services.snapshot_service import SnapshotService, SNAPSHOT_MEDIA_TYPE
 from app.routes.auth import get_current_player
 from app.models.player import Player
 
@@ -57,49 +59,41 @@ async def create_game(
 async def get_game(
     game_id: int,
     player: Player = Depends(get_current_player),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get complete game state.
     STEP: Returns all game data including oracles, dominions, armies.
     """
-    game_state = await GameService.get_game_state(db, game_id, player.id)
+    snapshot = await GameService.get_game_snapshot(db, game_id, player.id)
     
     return {
-        "game_id": game_state.id,
-        "current_stage": game_state.current_stage,
-        "oracles_defeated": game_state.oracles_defeated,
+        "game_id": snapshot["id"],
+        "current_stage": snapshot["current_stage"],
+        "oracles_defeated": snapshot["oracles_defeated"],
         "resources": {
-            "gold": game_state.gold,
-            "insight_tokens": game_state.insight_tokens,
-            "healing_draughts": game_state.healing_draughts
+            "gold": snapshot["gold"],
+            "insight_tokens": snapshot["insight_tokens"],
+            "healing_draughts": snapshot["healing_draughts"]
         },
         "inventory": {
-            "weapons": game_state.weapons,
-            "special_items": game_state.special_items,
-            "potions": game_state.potions
+            "weapons": snapshot["weapons"],
+            "special_items": snapshot["special_items"],
+            "potions": snapshot["potions"]
         },
-        "is_completed": game_state.is_completed,
+        "is_completed": snapshot["is_completed"],
         "oracles": [
             {
-                "id": os.oracle.id,
-                "name": os.oracle.name,
-                "domain": os.oracle.domain,
-                "is_defeated": os.is_defeated,
-                "is_hostile": os.is_hostile,
-                "current_phase": os.current_phase
+                "id": os["oracle_id"],
+                "name": os["name"],
+                "domain": os["domain"],
+                "is_defeated": os["is_defeated"],
+                "is_hostile": os["is_hostile"],
+                "current_phase": os["current_phase"]
             }
-            for os in game_state.oracle_states
+            for os in snapshot["oracle_states"]
         ],
-        "dominions": [
-            {
-                "name": ds.name,
-                "oracle_name": ds.oracle_name,
-                "is_controlled": ds.is_controlled,
-                "is_accessible": ds.is_accessible
-            }
-            for ds in game_state.dominion_states
-        ]
+        "dominions": snapshot["dominion_states"]
     }
 
 
@@ -113,15 +107,37 @@ async def save_game(
     Save current game progress.
     STEP: Persists game state to PostgreSQL.
     """
-    result = await GameService.save_game_state(db, game_id, player.id)
+    result = await retry_on_conflict(
+        db,
+        lambda: GameService.save_game_state(db, game_id, player.id),
+        "save_game_state"
+    )
     return result
 
 
+@router.get("/{game_id}/snapshot")
+async def export_game_snapshot(
+    game_id: int,
+    player: Player = Depends(get_current_player),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Download a binary snapshot of the whole game.
+    STEP: msgpack + zstd, streamed as it is compressed.
+    """
+    snapshot = await GameService.export_game_snapshot(db, game_id, player.id)
+    return StreamingResponse(
+        SnapshotService.iter_encode(snapshot),
+        media_type=SNAPSHOT_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="game-{game_id}.snapshot"'}
+    )
+
+
 @router.get("/{game_id}/inventory")
 async def get_inventory(
     game_id: int,
     player: Player = Depends(get_current_player),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get player inventory and armies.
@@ -142,10 +158,14 @@ async def use_insight_token(
     Use insight token for hint.
     STEP: Decrements token, triggers LLM hint generation.
     """
-    result = await GameService.use_insight_token(
+    result = await retry_on_conflict(
         db,
-        game_id,
-        player.id,
-        request.question
+        lambda: GameService.use_insight_token(
+            db,
+            game_id,
+            player.id,
+            request.question
+        ),
+        "use_insight_token"
     )
     return result
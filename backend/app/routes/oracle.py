@@ -5,11 +5,12 @@ backend/app/routes/oracle.py
 STEP: Oracle Interaction API Routes
 Handles oracle challenges, puzzles, battles, diplomacy.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
+from typing import Optional
 
-from app.database import get_db
+from app.database import get_db, get_read_db, retry_on_conflict
 from app.services.game_service import GameService
 from app.services.puzzle_service import PuzzleService
 from app.services.combat_service import CombatService
@@ -43,11 +44,34 @@ async def challenge_oracle(
     Select oracle to challenge.
     STEP: Initiates oracle encounter, sets phase to exploration.
     """
-    result = await GameService.select_oracle_challenge(
+    result = await retry_on_conflict(
         db,
-        game_id,
-        player.id,
-        request.oracle_name
+        lambda: GameService.select_oracle_challenge(
+            db,
+            game_id,
+            player.id,
+            request.oracle_name
+        ),
+        "select_oracle_challenge"
+    )
+    return result
+
+
+@router.post("/{game_id}/puzzle/start")
+async def start_puzzle(
+    game_id: int,
+    oracle_id: int,
+    player: Player = Depends(get_current_player),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Receive the oracle's puzzle.
+    STEP: Serves the player's next unseen banked puzzle, generating (and banking) one on a miss.
+    """
+    result = await retry_on_conflict(
+        db,
+        lambda: GameService.start_oracle_puzzle(db, game_id, player.id, oracle_id),
+        "start_oracle_puzzle"
     )
     return result
 
@@ -63,10 +87,14 @@ async def solve_puzzle(
     Submit puzzle solution.
     STEP: Validates solution, updates phase if correct.
     """
-    result = await PuzzleService.validate_puzzle_solution(
+    result = await retry_on_conflict(
         db,
-        request.oracle_state_id,
-        request.solution
+        lambda: PuzzleService.validate_puzzle_solution(
+            db,
+            request.oracle_state_id,
+            request.solution
+        ),
+        "validate_puzzle_solution"
     )
     return result
 
@@ -80,9 +108,13 @@ async def start_battle(
 ):
     """
     Initiate battle with oracle.
-    STEP: Generates enemy army, calculates combat stats, starts battle.
+    STEP: Looks up the precomputed enemy army, calculates combat stats, starts battle.
     """
-    result = await CombatService.initiate_battle(db, game_id, oracle_id)
+    result = await retry_on_conflict(
+        db,
+        lambda: CombatService.initiate_battle(db, game_id, oracle_id),
+        "initiate_battle"
+    )
     return result
 
 
@@ -98,15 +130,100 @@ async def execute_battle_action(
     Execute combat turn.
     STEP: Processes player action, enemy counterattack, checks victory.
     """
-    result = await CombatService.execute_combat_turn(
+    result = await retry_on_conflict(
+        db,
+        lambda: CombatService.execute_combat_turn(
+            db,
+            game_id,
+            oracle_id,
+            request.action
+        ),
+        "execute_combat_turn"
+    )
+    return result
+
+
+@router.post("/{game_id}/battle/rewind")
+async def rewind_battle_turn(
+    game_id: int,
+    oracle_id: int,
+    player: Player = Depends(get_current_player),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Rewind the last combat turn.
+    STEP: The player's Temporal Guards undo one turn per battle.
+    """
+    await GameService.ensure_game_owner(db, game_id, player.id)
+    result = await retry_on_conflict(
+        db,
+        lambda: CombatService.rewind_battle_turn(db, game_id, oracle_id),
+        "rewind_battle_turn"
+    )
+    return result
+
+
+@router.post("/{game_id}/battle/auto")
+async def auto_resolve_battle(
+    game_id: int,
+    oracle_id: int,
+    policy: str = "balanced",
+    player: Player = Depends(get_current_player),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Resolve a whole battle server-side.
+    STEP: Plays every remaining turn with the chosen policy
+    (aggressive | defensive | balanced) and returns a summarized log.
+    """
+    await GameService.ensure_game_owner(db, game_id, player.id)
+    result = await retry_on_conflict(
+        db,
+        lambda: CombatService.auto_resolve_battle(db, game_id, oracle_id, policy),
+        "auto_resolve_battle"
+    )
+    return result
+
+
+@router.get("/{game_id}/battle/log")
+async def get_battle_log(
+    game_id: int,
+    oracle_id: int,
+    limit: int = Query(20, ge=1, le=200),
+    player: Player = Depends(get_current_player),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Get recent battle events.
+    STEP: Returns the last `limit` (1-200) events of the current battle.
+    """
+    await GameService.ensure_game_owner(db, game_id, player.id)
+    result = await CombatService.get_current_battle_log(
         db,
         game_id,
         oracle_id,
-        request.action
+        limit
     )
     return result
 
 
+@router.get("/{game_id}/battle/predict")
+async def predict_battle(
+    game_id: int,
+    oracle_id: int,
+    simulations: Optional[int] = Query(None, ge=1),
+    player: Player = Depends(get_current_player),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Predict a battle's outcome before (or during) the fight.
+    STEP: Monte Carlo simulation of the matchup; cached per army composition.
+    """
+    await GameService.ensure_game_owner(db, game_id, player.id)
+    result = await CombatService.predict_battle(db, game_id, oracle_id, simulations)
+    return result
+
+
 @router.post("/{game_id}/defeat/{oracle_id}")
 async def defeat_oracle(
     game_id: int,
@@ -118,10 +235,14 @@ async def defeat_oracle(
     Mark oracle as defeated and receive rewards.
     STEP: Updates oracle state, awards resources, progresses game.
     """
-    result = await GameService.defeat_oracle(
+    result = await retry_on_conflict(
         db,
-        game_id,
-        player.id,
-        oracle_id
+        lambda: GameService.defeat_oracle(
+            db,
+            game_id,
+            player.id,
+            oracle_id
+        ),
+        "defeat_oracle"
     )
     return result
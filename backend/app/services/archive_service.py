@@ -0,0 +1,189 @@
+"""
+backend/app/services/archive_service.py
+STEP: Cold Game Archival
+Moves completed or long-idle games out of the hot Postgres tables into compressed
+snapshots in MinIO, and restores them transparently when a player reopens the game.
+"""
+from typing import Optional, List
+from datetime import datetime, timedelta, timezone
+import asyncio
+import io
+import time
+
+from sqlalchemy import select, delete, exists, and_, or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.game_state import GameState
+from app.models.oracle import OracleState
+from app.models.archive import ArchivedGame
+from app.services.snapshot_service import SnapshotService
+from app.services.storage_service import StorageService
+from app.cache.game_state_cache import game_state_cache
+from app.utils.metrics import GAMES_ARCHIVED, GAMES_RESTORED, GAME_RESTORE_SECONDS
+
+
+class ArchiveService:
+    """Archive / restore of whole games to object storage"""
+
+    OBJECT_PREFIX = "archives/games"
+
+    _storage: Optional[StorageService] = None
+
+    @classmethod
+    def storage(cls) -> StorageService:
+        """MinIO client, created on first use"""
+        if cls._storage is None:
+            cls._storage = StorageService()
+        return cls._storage
+
+    @staticmethod
+    def object_key(game_id: int) -> str:
+        return f"{ArchiveService.OBJECT_PREFIX}/{game_id}.snapshot"
+
+    @staticmethod
+    def battle_in_progress():
+        """Correlated EXISTS: the game has a battle in progress (its live session is in Redis)"""
+        return exists().where(
+            OracleState.game_state_id == GameState.id,
+            OracleState.battle_state["status"].as_string() == "in_progress"
+        )
+
+    @staticmethod
+    async def archive_game(db: AsyncSession, game_id: int) -> bool:
+        """
+        Archive one game and delete its hot rows.
+        STEP: Locks the game row (skipping games another worker holds), uploads the
+        snapshot, then records the pointer and deletes the game (children cascade)
+        in one transaction. Games mid-battle are left alone. Returns False if the
+        game was not archived.
+        """
+        result = await db.execute(
+            select(GameState.id, GameState.player_id, GameState.is_completed)
+            .where(GameState.id == game_id, ~ArchiveService.battle_in_progress())
+            .with_for_update(of=GameState, skip_locked=True)
+        )
+        game = result.one_or_none()
+        if game is None:
+            await db.rollback()
+            return False
+
+        snapshot = await SnapshotService.dump_game(db, game_id)
+        payload = SnapshotService.encode(snapshot)
+        object_key = ArchiveService.object_key(game_id)
+
+        await ArchiveService.storage().upload_file(object_key, io.BytesIO(payload))
+
+        db.add(ArchivedGame(
+            game_id=game_id,
+            player_id=game.player_id,
+            object_key=object_key,
+            schema_version=snapshot["schema_version"],
+            size_bytes=len(payload),
+            is_completed=bool(game.is_completed)
+        ))
+        await db.execute(delete(GameState).where(GameState.id == game_id))
+        await db.commit()
+
+        await game_state_cache.invalidate(game_id)
+        GAMES_ARCHIVED.inc()
+        return True
+
+    @staticmethod
+    async def find_archivable_games(
+        db: AsyncSession,
+        limit: int,
+        idle_days: int
+    ) -> List[int]:
+        """
+        Completed games, or games without any activity for `idle_days`.
+        STEP: Activity is the latest of the last mutation (updated_at, bumped with
+        the version on every committed move), last save and creation; games with a
+        battle in progress are never picked.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=idle_days)
+        last_activity = func.greatest(GameState.updated_at, GameState.last_save, GameState.created_at)
+        result = await db.execute(
+            select(GameState.id)
+            .where(
+                or_(GameState.is_completed.is_(True), last_activity < cutoff),
+                ~ArchiveService.battle_in_progress()
+            )
+            .order_by(GameState.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def archive_due_games(
+        limit: Optional[int] = None,
+        idle_days: Optional[int] = None
+    ) -> int:
+        """
+        Run one archival pass.
+        STEP: Each game is archived in its own transaction so one failure
+        does not hold back the batch.
+        """
+        async with AsyncSessionLocal() as db:
+            game_ids = await ArchiveService.find_archivable_games(
+                db,
+                limit or settings.ARCHIVE_BATCH_SIZE,
+                idle_days if idle_days is not None else settings.ARCHIVE_IDLE_DAYS
+            )
+
+        archived = 0
+        for game_id in game_ids:
+            async with AsyncSessionLocal() as db:
+                try:
+                    if await ArchiveService.archive_game(db, game_id):
+                        archived += 1
+                except Exception as e:
+                    await db.rollback()
+                    print(f"Archiving game {game_id} failed: {e}")
+
+        if archived:
+            print(f"Archived {archived} games")
+        return archived
+
+    @staticmethod
+    async def restore_game(game_id: int, player_id: int) -> bool:
+        """
+        Restore an archived game for its owner.
+        STEP: Locks the archive pointer, downloads and inserts the snapshot with its
+        original ids, drops the pointer and commits; the object is removed last.
+        Returns False when the game is not archived (or another request restored it).
+        """
+        started = time.perf_counter()
+
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(ArchivedGame)
+                .where(ArchivedGame.game_id == game_id, ArchivedGame.player_id == player_id)
+                .with_for_update()
+            )
+            archived = result.scalar_one_or_none()
+            if archived is None:
+                return False
+
+            payload = await ArchiveService.storage().download_file(archived.object_key)
+            await SnapshotService.restore_game(db, SnapshotService.decode(payload))
+            await db.delete(archived)
+            await db.commit()
+            object_key = archived.object_key
+
+        await ArchiveService.storage().delete_file(object_key)
+
+        GAMES_RESTORED.inc()
+        GAME_RESTORE_SECONDS.observe(time.perf_counter() - started)
+        return True
+
+    @staticmethod
+    async def run_periodically():
+        """Background archival loop (started from the app lifespan)"""
+        while True:
+            await asyncio.sleep(settings.ARCHIVE_INTERVAL_SECONDS)
+            try:
+                await ArchiveService.archive_due_games()
+            except Exception as e:
+                print(f"Archival pass failed: {e}")
@@ -2,50 +2,136 @@
 """
 backend/app/services/combat_service.py
 STEP: Combat Simulation Service
-Deterministic combat engine, army management, battle resolution.
+Battle lifecycle and persistence around the vectorized combat engine
+(app/simulation/combat_engine.py), army management, battle resolution.
 """
-from typing import Dict, Any, List
-from sqlalchemy import select
+from typing import Dict, Any, List, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import flag_modified
+import asyncio
 import random
 
+from app.config import settings
+from app.database import ConcurrencyConflict
 from app.models.game_state import GameState
-from app.models.army import PlayerArmy, ArmyUnit
+from app.models.army import PlayerArmy
 from app.models.oracle import OracleState
+from app.models.battle_log import BattleLogEntry
+from app.cache.catalog import catalog_cache
+from app.cache.battle_sessions import battle_sessions, BattleSession
+from app.cache.state_history import battle_history
+from app.services.game_service import GameService
+from app.services.event_service import EventType
+from app.simulation.combat_engine import (
+    CombatEngine,
+    battle_state_armies,
+    combat_power,
+    units_to_array,
+    action_stance,
+)
+from app.simulation.policies import PLAYER_POLICIES, player_stances, oracle_stances
+from app.simulation.predictor import battle_predictor
+from app.simulation.enemy_armies import enemy_armies
+from app.utils.metrics import BATTLE_SESSION_FLUSHES, BATTLE_SESSION_RECOVERIES
+
+# One letter per stance in compact replays (attack, defend, special)
+STANCE_CODES = "ADS"
+
+# Player unit (Chronos' reward) that can rewind one combat turn per battle
+REWIND_UNIT = "Temporal Guards"
 
 
 class CombatService:
     """Deterministic combat simulation and battle management"""
     
+    # Rendered text for each BattleLogEntry event code
+    BATTLE_EVENT_TEMPLATES = {
+        BattleLogEntry.PLAYER_DAMAGE: "Turn {turn}: Player dealt {value} damage",
+        BattleLogEntry.ENEMY_DAMAGE: "Turn {turn}: Enemy dealt {value} damage",
+        BattleLogEntry.VICTORY: "Victory! Enemy defeated!",
+        BattleLogEntry.DEFEAT: "Defeat! Your army has fallen!",
+    }
+    
     @staticmethod
     def calculate_combat_power(
         units: List[Dict[str, Any]]
     ) -> Dict[str, float]:
         """
         Calculate total combat power from army units.
-        STEP: Aggregates attack, defense, health, and applies modifiers.
-        """
-        total_attack = 0
-        total_defense = 0
-        total_health = 0
-        
-        for unit in units:
-            quantity = unit.get("quantity", 1)
-            attack = unit.get("attack", 10)
-            defense = unit.get("defense", 10)
-            health = unit.get("health", 100)
-            morale = unit.get("morale", 1.0)
-            
-            total_attack += (attack * quantity * morale)
-            total_defense += (defense * quantity * morale)
-            total_health += (health * quantity)
+        STEP: Aggregates attack, defense, health, and applies modifiers
+        (vectorized over the unit array).
+        """
+        power = combat_power(units_to_array(units))
+        return {key: float(value) for key, value in power.items()}
+    
+    @staticmethod
+    async def load_deployed_units(db: AsyncSession, game_id: int) -> List[Dict[str, Any]]:
+        """
+        Deployed player armies as combat unit dicts.
+        STEP: Army rows joined with the static unit catalog in memory.
+        """
+        result = await db.execute(
+            select(PlayerArmy.army_unit_id, PlayerArmy.quantity, PlayerArmy.morale)
+            .where(PlayerArmy.game_state_id == game_id, PlayerArmy.is_deployed == True)
+        )
         
-        return {
-            "attack": total_attack,
-            "defense": total_defense,
-            "health": total_health,
-            "power_score": (total_attack + total_defense) * (total_health / 100)
-        }
+        catalog = catalog_cache.current
+        player_units = []
+        for army_unit_id, quantity, morale in result.all():
+            unit_type = catalog.unit_by_id(army_unit_id)
+            player_units.append({
+                "name": unit_type.name,
+                "quantity": quantity,
+                "attack": unit_type.attack,
+                "defense": unit_type.defense,
+                "health": unit_type.health,
+                "morale": morale,
+                "speed": unit_type.speed,
+                "element": unit_type.element_affinity
+            })
+        return player_units
+    
+    @staticmethod
+    async def predict_battle(
+        db: AsyncSession,
+        game_id: int,
+        oracle_id: int,
+        simulations: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Monte Carlo outlook of a battle against an oracle.
+        STEP: A battle in progress is predicted from its current pools; otherwise the
+        deployed armies face the oracle's precomputed army. The simulation
+        batch runs in a worker thread.
+        """
+        catalog = catalog_cache.current
+        oracle = catalog.oracle_by_id(oracle_id)
+        if oracle is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Oracle not found")
+        
+        result = await db.execute(
+            select(OracleState.battle_state).where(
+                OracleState.game_state_id == game_id,
+                OracleState.oracle_id == oracle_id
+            )
+        )
+        battle_state = result.scalar_one_or_none() or {}
+        
+        if battle_state.get("status") == "in_progress":
+            player, enemy = battle_state_armies(battle_state)
+            basis = "current_battle"
+        else:
+            player_units = await CombatService.load_deployed_units(db, game_id)
+            if not player_units:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No deployed armies")
+            player = units_to_array(player_units)
+            enemy = enemy_armies.current.lookup(oracle.name, oracle.difficulty_level).army
+            basis = "deployed_armies"
+        
+        prediction = await asyncio.to_thread(battle_predictor.predict, player, enemy, simulations)
+        return {"oracle_id": oracle_id, "basis": basis, **prediction}
     
     @staticmethod
     async def initiate_battle(
@@ -63,24 +149,9 @@ class CombatService:
         )
         game_state = result.scalar_one_or_none()
         
-        result = await db.execute(
-            select(PlayerArmy)
-            .where(PlayerArmy.game_state_id == game_id, PlayerArmy.is_deployed == True)
-        )
-        player_armies = result.scalars().all()
-        
         # Calculate player power
-        player_units = [
-            {
-                "name": army.unit_type.name,
-                "quantity": army.quantity,
-                "attack": army.unit_type.attack,
-                "defense": army.unit_type.defense,
-                "health": army.unit_type.health,
-                "morale": army.morale
-            }
-            for army in player_armies
-        ]
+        catalog = catalog_cache.current
+        player_units = await CombatService.load_deployed_units(db, game_id)
         
         player_power = CombatService.calculate_combat_power(player_units)
         
@@ -93,30 +164,35 @@ class CombatService:
         )
         oracle_state = result.scalar_one_or_none()
         
-        # Generate enemy army based on oracle difficulty
-        result = await db.execute(
-            select(Oracle).where(Oracle.id == oracle_id)
-        )
-        oracle = result.scalar_one_or_none()
-        
-        enemy_power_multiplier = oracle.difficulty_level * 0.8
-        enemy_units = CombatService.generate_enemy_army(oracle.name, enemy_power_multiplier)
-        enemy_power = CombatService.calculate_combat_power(enemy_units)
+        # Precomputed enemy army for the oracle's difficulty
+        oracle = catalog.oracle_by_id(oracle_id)
+        enemy_army = enemy_armies.current.lookup(oracle.name, oracle.difficulty_level)
+        enemy_units = enemy_army.unit_dicts()
+        enemy_power = dict(enemy_army.power)
         
-        # Initialize battle state
+        # Initialize battle state (events go to battle_log_entries, keyed by battle_no)
+        previous_battle = oracle_state.battle_state or {}
         battle_state = {
+            "battle_no": previous_battle.get("battle_no", 0) + 1,
             "turn": 1,
-            "player_health": player_power["health"],
-            "enemy_health": enemy_power["health"],
+            "seed": random.getrandbits(31),
+            "player_health": int(player_power["health"]),
+            "enemy_health": int(enemy_power["health"]),
             "player_units": player_units,
             "enemy_units": enemy_units,
-            "battle_log": [],
             "status": "in_progress"
         }
         
         oracle_state.battle_state = battle_state
         oracle_state.current_phase = "battle"
-        await db.commit()
+        await GameService.commit_game_mutation(
+            db,
+            game_id,
+            game_state,
+            event=(EventType.BATTLE_STARTED, {"oracle_id": oracle_id, "battle_state": battle_state})
+        )
+        battle_history.discard((game_id, oracle_id))
+        await battle_sessions.open(game_id, oracle_id, oracle_state.id, dict(battle_state))
         
         return {
             "battle_initiated": True,
@@ -126,38 +202,133 @@ class CombatService:
         }
     
     @staticmethod
-    def generate_enemy_army(oracle_name: str, power_multiplier: float) -> List[Dict[str, Any]]:
-        """
-        Generate oracle's army composition.
-        STEP: Creates themed enemy units based on oracle domain.
-        """
-        army_templates = {
-            "Chronos": [
-                {"name": "Time Wraiths", "attack": 15, "defense": 10, "health": 80, "quantity": 8},
-                {"name": "Temporal Guards", "attack": 20, "defense": 15, "health": 120, "quantity": 5}
-            ],
-            "Nyx": [
-                {"name": "Shadow Assassins", "attack": 25, "defense": 8, "health": 70, "quantity": 10},
-                {"name": "Night Stalkers", "attack": 18, "defense": 12, "health": 90, "quantity": 6}
-            ],
-            "Aresion": [
-                {"name": "War Hoplites", "attack": 22, "defense": 20, "health": 150, "quantity": 10},
-                {"name": "Battle Champions", "attack": 30, "defense": 25, "health": 200, "quantity": 4}
-            ]
-        }
+    async def load_battle_session(
+        db: AsyncSession,
+        game_id: int,
+        oracle_id: int
+    ) -> Optional[BattleSession]:
+        """
+        Live session of the battle in progress against an oracle, or None.
+        STEP: Redis first; on a miss (expired, Redis restarted) the session is rebuilt
+        from the last Postgres checkpoint. A finished session whose end flush never
+        committed is flushed here.
+        """
+        session = await battle_sessions.load(game_id, oracle_id)
+        if session is not None:
+            if session.battle_state.get("status") == "in_progress":
+                return session
+            await CombatService.flush_battle_session(db, session, "end")
+            return None
         
-        base_army = army_templates.get(oracle_name, [
-            {"name": "Oracle Guards", "attack": 18, "defense": 15, "health": 100, "quantity": 8}
-        ])
+        result = await db.execute(
+            select(OracleState).where(
+                OracleState.game_state_id == game_id,
+                OracleState.oracle_id == oracle_id
+            )
+        )
+        oracle_state = result.scalar_one_or_none()
+        if oracle_state is None or (oracle_state.battle_state or {}).get("status") != "in_progress":
+            return None
         
-        # Apply power multiplier
-        for unit in base_army:
-            unit["attack"] = int(unit["attack"] * power_multiplier)
-            unit["defense"] = int(unit["defense"] * power_multiplier)
-            unit["health"] = int(unit["health"] * power_multiplier)
-            unit["morale"] = 1.0
+        battle_state = dict(oracle_state.battle_state)
+        history = await CombatService.get_battle_log_entries(
+            db, oracle_state.id, battle_state.get("battle_no", 1), limit=5
+        )
+        session = await battle_sessions.open(game_id, oracle_id, oracle_state.id, battle_state, history)
+        if session.stored:
+            BATTLE_SESSION_RECOVERIES.inc()
+        return session
+    
+    @staticmethod
+    async def flush_battle_session(
+        db: AsyncSession,
+        session: BattleSession,
+        reason: str,
+        event_type: int = EventType.BATTLE_CHECKPOINT,
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Write a live battle to Postgres: state, buffered log rows and one event, in one commit.
+        STEP: The checkpointed turn in Postgres decides what is still unwritten, so a
+        flush repeated after a lost Redis acknowledgement inserts nothing twice. The
+        session is dropped once the battle is over, otherwise re-checkpointed.
+        """
+        oracle_state = await db.get(OracleState, session.oracle_state_id)
+        battle_state = session.battle_state
+        stored_state = oracle_state.battle_state or {}
         
-        return base_army
+        if stored_state.get("battle_no") != battle_state.get("battle_no"):
+            # A newer battle has started since this session was opened
+            await battle_sessions.close(session.game_id, session.oracle_id)
+            battle_history.discard((session.game_id, session.oracle_id))
+            return
+        
+        stored_turn = stored_state.get("turn", 1)
+        # An outcome reached without a new turn (e.g. auto-resolve with nothing left to fight) still flushes
+        if stored_turn < battle_state["turn"] or stored_state.get("status") != battle_state["status"]:
+            entries = [entry for entry in session.pending if entry[0] >= stored_turn]
+            stances = session.stances[2 * max(0, stored_turn - session.checkpoint_turn):]
+            
+            oracle_state.battle_state = battle_state
+            flag_modified(oracle_state, "battle_state")
+            if battle_state["status"] == "victory":
+                oracle_state.current_phase = "confrontation"
+            if entries:
+                await db.execute(
+                    insert(BattleLogEntry),
+                    [
+                        {
+                            "oracle_state_id": oracle_state.id,
+                            "battle_no": battle_state.get("battle_no", 1),
+                            "turn": turn,
+                            "event": event,
+                            "value": value
+                        }
+                        for turn, event, value in entries
+                    ]
+                )
+            await GameService.commit_game_mutation(
+                db,
+                session.game_id,
+                event=(event_type, {
+                    "oracle_id": session.oracle_id,
+                    "turns": battle_state["turn"] - stored_turn,
+                    "status": battle_state["status"],
+                    "player_hp": battle_state["player_hp"],
+                    "enemy_hp": battle_state["enemy_hp"],
+                    "player_morale": battle_state["player_morale"],
+                    "enemy_morale": battle_state["enemy_morale"],
+                    "stances": stances,
+                    **(extra or {})
+                })
+            )
+            BATTLE_SESSION_FLUSHES.labels(reason=reason).inc()
+        
+        if battle_state["status"] != "in_progress":
+            await battle_sessions.close(session.game_id, session.oracle_id)
+            battle_history.discard((session.game_id, session.oracle_id))
+        else:
+            await battle_sessions.checkpoint(session)
+    
+    @staticmethod
+    async def _flush_after_turn(
+        db: AsyncSession,
+        session: BattleSession,
+        stored: bool,
+        reason: str,
+        **kwargs
+    ):
+        """
+        Flush after turns were recorded. Turns already live in Redis must not be replayed
+        by retry_on_conflict, so a conflicting flush is left to the next checkpoint
+        instead; turns that never reached Redis retry from Postgres as usual.
+        """
+        try:
+            await CombatService.flush_battle_session(db, session, reason, **kwargs)
+        except ConcurrencyConflict:
+            if not stored:
+                raise
+            await db.rollback()
     
     @staticmethod
     async def execute_combat_turn(
@@ -168,50 +339,329 @@ class CombatService:
     ) -> Dict[str, Any]:
         """
         Execute one turn of combat.
-        STEP: Processes player action, calculates damage, updates battle state.
+        STEP: Processes player action (as a stance) against the oracle's personality
+        policy, calculates damage, updates the live battle session in Redis with one
+        atomic script call. Postgres is written at checkpoints and when the battle ends.
         """
+        session = await CombatService.load_battle_session(db, game_id, oracle_id)
+        if session is None:
+            return {"error": "Battle is not in progress"}
+        
+        battle_state = dict(session.battle_state)
+        turn = battle_state["turn"]
+        events = []
+        
+        # Resolve the turn with the combat engine (seeded by battle and turn)
+        oracle = catalog_cache.current.oracle_by_id(oracle_id)
+        player_stance = action_stance(player_action)
+        engine = CombatEngine.from_battle_state(battle_state)
+        enemy_stance = oracle_stances(oracle.personality_config, engine)
+        outcome = engine.step(player_stance, enemy_stance)
+        engine.write_battle_state(battle_state)
+        
+        player_damage = int(round(outcome.player_damage[0]))
+        enemy_damage = int(round(outcome.enemy_damage[0]))
+        events.append((turn, BattleLogEntry.PLAYER_DAMAGE, player_damage))
+        if enemy_damage:
+            events.append((turn, BattleLogEntry.ENEMY_DAMAGE, enemy_damage))
+        
+        # Check battle outcome
+        next_phase = "battle"
+        if battle_state["enemy_health"] <= 0:
+            battle_state["status"] = "victory"
+            next_phase = "confrontation"
+            events.append((turn, BattleLogEntry.VICTORY, 0))
+        elif battle_state["player_health"] <= 0:
+            battle_state["status"] = "defeat"
+            events.append((turn, BattleLogEntry.DEFEAT, 0))
+        
+        battle_state["turn"] += 1
+        stances = STANCE_CODES[player_stance] + STANCE_CODES[enemy_stance[0]]
+        previous = session.battle_state
+        stored = await battle_sessions.record_turn(session, turn, battle_state, stances, events)
+        if stored:
+            # Keep the turn's starting state for a Temporal Guards rewind
+            key = (game_id, oracle_id)
+            ring = battle_history.head(key)
+            if ring is None or ring.head_version != turn:
+                battle_history.push(key, turn, previous)
+            battle_history.push(key, battle_state["turn"], battle_state)
+        
+        reason = battle_sessions.flush_reason(session) if stored else "fallback"
+        if reason:
+            await CombatService._flush_after_turn(db, session, stored, reason)
+        
+        return {
+            "turn": battle_state["turn"],
+            "player_health": battle_state["player_health"],
+            "enemy_health": battle_state["enemy_health"],
+            "status": battle_state["status"],
+            "battle_log": [CombatService.format_battle_event(*entry) for entry in session.log[-5:]],
+            "next_phase": next_phase
+        }
+    
+    @staticmethod
+    async def rewind_battle_turn(
+        db: AsyncSession,
+        game_id: int,
+        oracle_id: int
+    ) -> Dict[str, Any]:
+        """
+        Undo the last combat turn (player's Temporal Guards, once per battle).
+        STEP: The turn's starting state comes from the in-process battle history
+        ring and replaces the live session with one atomic script call; the turn
+        is then replayed with the same seed. Only turns not yet checkpointed to
+        Postgres can be undone.
+        """
+        session = await CombatService.load_battle_session(db, game_id, oracle_id)
+        if session is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Battle is not in progress")
+        
+        battle_state = session.battle_state
+        player_hp = battle_state.get("player_hp") or []
+        guards = [
+            i for i, unit in enumerate(battle_state["player_units"])
+            if unit.get("name") == REWIND_UNIT and (i >= len(player_hp) or player_hp[i] > 0)
+        ]
+        if not guards:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Rewinding a turn requires living {REWIND_UNIT}"
+            )
+        if battle_state.get("rewinds_used", 0) >= 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Turn rewind already used in this battle"
+            )
+        
+        key = (game_id, oracle_id)
+        target = battle_state["turn"] - 1
+        previous = battle_history.at(key, target) if target >= session.checkpoint_turn else None
+        if previous is None or previous.get("battle_no") != battle_state.get("battle_no"):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="The last turn can no longer be rewound"
+            )
+        
+        restored = {**previous, "rewinds_used": battle_state.get("rewinds_used", 0) + 1}
+        dropped = sum(1 for entry in session.pending if entry[0] == target)
+        if not await battle_sessions.rewind(session, battle_state["turn"], restored, dropped, 2):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="The last turn can no longer be rewound"
+            )
+        battle_history.push(key, target, restored)
+        
+        return {
+            "rewound_to_turn": target,
+            "player_health": restored["player_health"],
+            "enemy_health": restored["enemy_health"],
+            "status": restored["status"],
+            "battle_log": [CombatService.format_battle_event(*entry) for entry in session.log[-5:]]
+        }
+    
+    @staticmethod
+    async def auto_resolve_battle(
+        db: AsyncSession,
+        game_id: int,
+        oracle_id: int,
+        policy: str = "balanced"
+    ) -> Dict[str, Any]:
+        """
+        Play the rest of a battle server-side in one call.
+        STEP: Starts the battle if none is in progress, then steps the engine with the
+        player policy against the oracle's personality policy, seeded per turn exactly
+        like manual turns. The turns are claimed in the live session with one atomic
+        update, then the final state, the battle log rows and a compact replay
+        (policy + stance string) are flushed to Postgres in one commit.
+        """
+        if policy not in PLAYER_POLICIES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown policy; choose one of {', '.join(PLAYER_POLICIES)}"
+            )
+        
+        oracle = catalog_cache.current.oracle_by_id(oracle_id)
+        if oracle is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Oracle not found")
+        
         result = await db.execute(
-            select(OracleState).where(
+            select(OracleState.id).where(
                 OracleState.game_state_id == game_id,
                 OracleState.oracle_id == oracle_id
             )
         )
-        oracle_state = result.scalar_one_or_none()
-        
-        battle_state = oracle_state.battle_state
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Oracle state not found")
         
-        if battle_state["status"] != "in_progress":
-            return {"error": "Battle is not in progress"}
+        session = await CombatService.load_battle_session(db, game_id, oracle_id)
+        if session is None:
+            await CombatService.initiate_battle(db, game_id, oracle_id)
+            session = await CombatService.load_battle_session(db, game_id, oracle_id)
         
-        # Player attack
-        player_damage = random.randint(50, 150)  # Simplified deterministic range
-        battle_state["enemy_health"] -= player_damage
-        battle_state["battle_log"].append(f"Turn {battle_state['turn']}: Player dealt {player_damage} damage")
+        battle_state = dict(session.battle_state)
+        first_turn = battle_state["turn"]
+        engine = CombatEngine.from_battle_state(battle_state)
         
-        # Enemy counterattack
-        if battle_state["enemy_health"] > 0:
-            enemy_damage = random.randint(40, 120)
-            battle_state["player_health"] -= enemy_damage
-            battle_state["battle_log"].append(f"Turn {battle_state['turn']}: Enemy dealt {enemy_damage} damage")
+        events = []
+        stances = []
+        damage = []
+        for turn in range(first_turn, first_turn + settings.AUTO_RESOLVE_MAX_TURNS):
+            if not engine.active[0]:
+                break
+            engine.reseed([battle_state.get("seed", 0), turn])
+            player_stance = player_stances(policy, engine)
+            enemy_stance = oracle_stances(oracle.personality_config, engine)
+            outcome = engine.step(player_stance, enemy_stance)
+            engine.quantize()
+            
+            player_damage = int(round(outcome.player_damage[0]))
+            enemy_damage = int(round(outcome.enemy_damage[0]))
+            events.append((turn, BattleLogEntry.PLAYER_DAMAGE, player_damage))
+            if enemy_damage:
+                events.append((turn, BattleLogEntry.ENEMY_DAMAGE, enemy_damage))
+            stances.append(STANCE_CODES[player_stance[0]] + STANCE_CODES[enemy_stance[0]])
+            damage.append((turn, player_damage, enemy_damage))
         
-        # Check battle outcome
+        engine.write_battle_state(battle_state)
+        # Outcome logged on the last turn played (the current turn when none could be played)
+        last_turn = max(first_turn, first_turn + len(damage) - 1)
+        next_phase = "battle"
         if battle_state["enemy_health"] <= 0:
             battle_state["status"] = "victory"
-            oracle_state.current_phase = "confrontation"
-            battle_state["battle_log"].append("Victory! Enemy defeated!")
+            next_phase = "confrontation"
+            events.append((last_turn, BattleLogEntry.VICTORY, 0))
         elif battle_state["player_health"] <= 0:
             battle_state["status"] = "defeat"
-            battle_state["battle_log"].append("Defeat! Your army has fallen!")
+            events.append((last_turn, BattleLogEntry.DEFEAT, 0))
         
-        battle_state["turn"] += 1
-        oracle_state.battle_state = battle_state
-        await db.commit()
+        battle_state["turn"] = first_turn + len(damage)
+        battle_state["replay"] = {"policy": policy, "from_turn": first_turn, "stances": "".join(stances)}
+        
+        stored = await battle_sessions.record_turn(session, first_turn, battle_state, "".join(stances), events)
+        await CombatService._flush_after_turn(
+            db,
+            session,
+            stored,
+            "end" if battle_state["status"] != "in_progress" else "auto_resolve",
+            event_type=EventType.BATTLE_RESOLVED,
+            extra={"policy": policy, "replay": battle_state["replay"]}
+        )
         
         return {
+            "status": battle_state["status"],
+            "policy": policy,
+            "turns_played": len(damage),
             "turn": battle_state["turn"],
             "player_health": battle_state["player_health"],
             "enemy_health": battle_state["enemy_health"],
-            "status": battle_state["status"],
-            "battle_log": battle_state["battle_log"][-5:],  # Last 5 events
-            "next_phase": oracle_state.current_phase
+            "damage_dealt": sum(dealt for _, dealt, _ in damage),
+            "damage_taken": sum(taken for _, _, taken in damage),
+            "summary": CombatService.summarize_turns(damage, battle_state["status"]),
+            "next_phase": next_phase
+        }
+    
+    @staticmethod
+    def summarize_turns(damage: List[Tuple[int, int, int]], status: str) -> List[str]:
+        """Condense (turn, dealt, taken) rows into at most AUTO_RESOLVE_SUMMARY_LINES lines"""
+        if not damage:
+            return []
+        
+        size = -(-len(damage) // settings.AUTO_RESOLVE_SUMMARY_LINES)
+        lines = []
+        for i in range(0, len(damage), size):
+            chunk = damage[i:i + size]
+            first, last = chunk[0][0], chunk[-1][0]
+            turns = f"Turn {first}" if first == last else f"Turns {first}-{last}"
+            lines.append(
+                f"{turns}: Player dealt {sum(c[1] for c in chunk)} damage, "
+                f"took {sum(c[2] for c in chunk)}"
+            )
+        
+        if status == "victory":
+            lines.append(CombatService.BATTLE_EVENT_TEMPLATES[BattleLogEntry.VICTORY])
+        elif status == "defeat":
+            lines.append(CombatService.BATTLE_EVENT_TEMPLATES[BattleLogEntry.DEFEAT])
+        return lines
+    
+    @staticmethod
+    def format_battle_event(turn: int, event: int, value: int) -> str:
+        """Render a compact battle event as log text"""
+        template = CombatService.BATTLE_EVENT_TEMPLATES.get(event, "Turn {turn}: Unknown event")
+        return template.format(turn=turn, value=value)
+    
+    @staticmethod
+    async def get_battle_log_entries(
+        db: AsyncSession,
+        oracle_state_id: int,
+        battle_no: int,
+        limit: int = 5
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Get the last `limit` (turn, event, value) rows of a battle, oldest first.
+        STEP: Index range read on (oracle_state_id, battle_no, id).
+        """
+        result = await db.execute(
+            select(BattleLogEntry.turn, BattleLogEntry.event, BattleLogEntry.value)
+            .where(
+                BattleLogEntry.oracle_state_id == oracle_state_id,
+                BattleLogEntry.battle_no == battle_no
+            )
+            .order_by(BattleLogEntry.id.desc())
+            .limit(limit)
+        )
+        return [tuple(row) for row in reversed(result.all())]
+    
+    @staticmethod
+    async def get_battle_log(
+        db: AsyncSession,
+        oracle_state_id: int,
+        battle_no: int,
+        limit: int = 5
+    ) -> List[str]:
+        """Get the last `limit` events of a battle as log text, oldest first"""
+        entries = await CombatService.get_battle_log_entries(db, oracle_state_id, battle_no, limit)
+        return [CombatService.format_battle_event(*entry) for entry in entries]
+    
+    @staticmethod
+    async def get_current_battle_log(
+        db: AsyncSession,
+        game_id: int,
+        oracle_id: int,
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """
+        Get the recent log window of the latest battle against an oracle.
+        STEP: Resolves the battle number from scalar battle state, then range-reads events;
+        turns of a live session not yet checkpointed come from Redis.
+        """
+        result = await db.execute(
+            select(OracleState.id, OracleState.battle_state).where(
+                OracleState.game_state_id == game_id,
+                OracleState.oracle_id == oracle_id
+            )
+        )
+        row = result.one_or_none()
+        
+        if not row or not row.battle_state:
+            return {"battle_log": [], "status": None}
+        
+        battle_state = row.battle_state
+        pending = []
+        session = await battle_sessions.load(game_id, oracle_id)
+        if session is not None and session.battle_state.get("battle_no") == battle_state.get("battle_no"):
+            # Rows up to the stored checkpoint are in Postgres, the rest only in the session
+            battle_state = session.battle_state
+            stored_turn = row.battle_state.get("turn", 1)
+            pending = [entry for entry in session.pending if entry[0] >= stored_turn]
+        
+        battle_no = battle_state.get("battle_no", 1)
+        entries = await CombatService.get_battle_log_entries(db, row.id, battle_no, limit)
+        return {
+            "battle_no": battle_no,
+            "status": battle_state.get("status"),
+            "battle_log": [
+                CombatService.format_battle_event(*entry)
+                for entry in (entries + pending)[-limit:]
+            ]
         }
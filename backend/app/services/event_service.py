@@ -0,0 +1,502 @@
+"""
+backend/app/services/event_service.py
+STEP: Event-Sourced Game History
+Every committed game version has one typed, compact event. Replay state is rebuilt
+from the nearest snapshot plus the tail of events; the projector writes a replay
+state back into the game tables.
+"""
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime
+import asyncio
+
+from sqlalchemy import select, insert, update, delete, bindparam, text, DateTime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.game_state import GameState, DominionState
+from app.models.oracle import OracleState
+from app.models.army import PlayerArmy
+from app.models.game_event import GameEvent, GameSnapshot
+from app.services.snapshot_service import SnapshotService
+from app.cache.game_state_cache import game_state_cache
+from app.cache.state_history import game_history, copy_on_write
+
+
+class EventType:
+    """Event type codes stored in game_events.event_type"""
+    GAME_CREATED = 1
+    ORACLE_CHALLENGED = 2
+    PUZZLE_ATTEMPTED = 3
+    BATTLE_STARTED = 4
+    BATTLE_TURN = 5
+    ORACLE_DEFEATED = 6
+    INSIGHT_USED = 7
+    GAME_SAVED = 8
+    RULE_CHANGED = 9
+    GAME_REBUILT = 10  # Tables re-projected from history; always has a snapshot at its version
+    BATTLE_RESOLVED = 11  # Several turns resolved server-side in one mutation
+    BATTLE_CHECKPOINT = 12  # Turns played in a live Redis session, flushed together
+    PUZZLE_SERVED = 13  # Banked or freshly generated puzzle stored for an oracle
+
+    NAMES = {
+        1: "game_created", 2: "oracle_challenged", 3: "puzzle_attempted", 4: "battle_started",
+        5: "battle_turn", 6: "oracle_defeated", 7: "insight_used", 8: "game_saved",
+        9: "rule_changed", 10: "game_rebuilt", 11: "battle_resolved",
+        12: "battle_checkpoint", 13: "puzzle_served",
+    }
+
+
+# A pending event: (event_type, payload)
+Event = Tuple[int, Dict[str, Any]]
+
+# Columns never carried in replay state (identity / bookkeeping)
+_SKIPPED_COLUMNS = {"id", "game_state_id", "player_id", "version"}
+
+
+class GameProjector:
+    """
+    Pure reducers over replay state.
+    STEP: State is keyed naturally (oracle_id, dominion oracle_name) so it is
+    independent of row ids and survives archive/import.
+    """
+
+    @staticmethod
+    def build_state(
+        version: int,
+        game: Dict[str, Any],
+        oracle_states: List[Dict[str, Any]],
+        dominion_states: List[Dict[str, Any]],
+        player_armies: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Replay state from plain row dicts"""
+        def strip(row: Dict[str, Any]) -> Dict[str, Any]:
+            return {k: v for k, v in row.items() if k not in _SKIPPED_COLUMNS}
+
+        return {
+            "version": version,
+            "game": strip(game),
+            "oracles": {row["oracle_id"]: strip(row) for row in oracle_states},
+            "dominions": {row["oracle_name"]: strip(row) for row in dominion_states},
+            "armies": [strip(row) for row in player_armies],
+        }
+
+    @staticmethod
+    def state_from_dump(dump: Dict[str, Any]) -> Dict[str, Any]:
+        """Replay state from a SnapshotService.dump_game document"""
+        def rows(name: str) -> List[Dict[str, Any]]:
+            table = dump["tables"].get(name) or {"columns": [], "rows": []}
+            return [dict(zip(table["columns"], values)) for values in table["rows"]]
+
+        return GameProjector.build_state(
+            dump["version"],
+            rows("game_states")[0],
+            rows("oracle_states"),
+            rows("dominion_states"),
+            rows("player_armies")
+        )
+
+    @staticmethod
+    def apply(state: Dict[str, Any], event_type: int, payload: Dict[str, Any]):
+        """Apply one event to replay state in place"""
+        handler = _REDUCERS.get(event_type)
+        if handler is None:
+            raise ValueError(f"Event type {event_type} cannot be replayed")
+        handler(state, payload)
+
+    @staticmethod
+    def _oracle_challenged(state, p):
+        oracle = state["oracles"][p["oracle_id"]]
+        state["game"]["current_oracle_id"] = p["oracle_id"]
+        oracle["current_phase"] = "exploration"
+        oracle["last_interaction"] = p["at"]
+        oracle["interactions_count"] = (oracle.get("interactions_count") or 0) + 1
+
+    @staticmethod
+    def _puzzle_attempted(state, p):
+        oracle = state["oracles"][p["oracle_id"]]
+        oracle["puzzle_state"] = {**(oracle.get("puzzle_state") or {}), **p["patch"]}
+        if p["patch"].get("solved"):
+            oracle["current_phase"] = "battle"
+
+    @staticmethod
+    def _puzzle_served(state, p):
+        oracle = state["oracles"][p["oracle_id"]]
+        oracle["puzzle_state"] = p["puzzle_state"]
+        oracle["current_phase"] = "puzzle"
+    
+    @staticmethod
+    def _battle_started(state, p):
+        oracle = state["oracles"][p["oracle_id"]]
+        oracle["battle_state"] = p["battle_state"]
+        oracle["current_phase"] = "battle"
+
+    @staticmethod
+    def _battle_turn(state, p):
+        oracle = state["oracles"][p["oracle_id"]]
+        battle = dict(oracle["battle_state"])
+        if "player_hp" in p:
+            # Engine turns carry the resulting per-stack pools
+            for key in ("player_hp", "enemy_hp", "player_morale", "enemy_morale"):
+                battle[key] = p[key]
+            battle["player_health"] = sum(p["player_hp"])
+            battle["enemy_health"] = sum(p["enemy_hp"])
+        else:
+            battle["enemy_health"] -= p["player_damage"]
+            if p.get("enemy_damage"):
+                battle["player_health"] -= p["enemy_damage"]
+        if battle["enemy_health"] <= 0:
+            battle["status"] = "victory"
+            oracle["current_phase"] = "confrontation"
+        elif battle["player_health"] <= 0:
+            battle["status"] = "defeat"
+        battle["turn"] += 1
+        oracle["battle_state"] = battle
+
+    @staticmethod
+    def _battle_resolved(state, p):
+        oracle = state["oracles"][p["oracle_id"]]
+        battle = dict(oracle["battle_state"])
+        for key in ("player_hp", "enemy_hp", "player_morale", "enemy_morale", "status", "replay"):
+            if key in p:
+                battle[key] = p[key]
+        battle["player_health"] = sum(p["player_hp"])
+        battle["enemy_health"] = sum(p["enemy_hp"])
+        battle["turn"] += p["turns"]
+        if battle["status"] == "victory":
+            oracle["current_phase"] = "confrontation"
+        oracle["battle_state"] = battle
+
+    @staticmethod
+    def _oracle_defeated(state, p):
+        game = state["game"]
+        oracle = state["oracles"][p["oracle_id"]]
+        oracle.update(is_defeated=True, is_hostile=False, defeated_at=p["at"])
+
+        dominion = state["dominions"].get(p["oracle_name"])
+        if dominion:
+            dominion.update(is_controlled=True, conquered_at=p["at"])
+
+        if p.get("weapon") and p["weapon"] not in (game.get("weapons") or []):
+            game["weapons"] = list(game.get("weapons") or []) + [p["weapon"]]
+        game["insight_tokens"] += 2
+        game["gold"] += 500
+        game["oracles_defeated"] += 1
+        game["current_stage"] = game["oracles_defeated"] + 1
+        if game["oracles_defeated"] >= 13:
+            game["is_completed"] = True
+            game["completed_at"] = p["at"]
+
+        if p.get("army_unit_id"):
+            state["armies"].append({
+                "army_unit_id": p["army_unit_id"],
+                "quantity": 5,
+                "total_health": p["unit_health"] * 5,
+                "morale": 1.0,
+                "experience_level": 1,
+                "is_deployed": False,
+                "current_location": None,
+                "recruited_at": p["at"],
+            })
+
+    @staticmethod
+    def _insight_used(state, p):
+        state["game"]["insight_tokens"] -= 1
+
+    @staticmethod
+    def _game_saved(state, p):
+        state["game"]["last_save"] = p["at"]
+
+    @staticmethod
+    def _rule_changed(state, p):
+        world_state = dict(state["game"].get("world_state") or {})
+        world_state["rule_changes"] = list(world_state.get("rule_changes", [])) + [p["rule_change"]]
+        state["game"]["world_state"] = world_state
+
+    @staticmethod
+    async def project(db: AsyncSession, game_id: int, state: Dict[str, Any]):
+        """
+        Write a replay state into the game tables (caller bumps version and commits).
+        STEP: One UPDATE for the game, one executemany UPDATE each for oracle and
+        dominion states, and a delete + insert of the armies.
+        """
+        game_states = GameState.__table__
+        oracle_states = OracleState.__table__
+        dominion_states = DominionState.__table__
+        player_armies = PlayerArmy.__table__
+
+        game_values = _coerce_row(game_states, {k: v for k, v in state["game"].items() if k != "created_at"})
+        await db.execute(update(game_states).where(game_states.c.id == game_id).values(**game_values))
+
+        for table, key, rows in (
+            (oracle_states, "oracle_id", list(state["oracles"].values())),
+            (dominion_states, "oracle_name", list(state["dominions"].values())),
+        ):
+            if not rows:
+                continue
+            rows = [_coerce_row(table, row) for row in rows]
+            columns = [c for c in rows[0] if c != key]
+            values = {c: bindparam(f"v_{c}") for c in columns}
+            if "version" in table.c:
+                values["version"] = table.c.version + 1  # keep ORM optimistic locks honest
+            await db.execute(
+                update(table)
+                .where(table.c.game_state_id == bindparam("_game_id"), table.c[key] == bindparam("_key"))
+                .values(values)
+                .execution_options(synchronize_session=False),
+                [{"_game_id": game_id, "_key": row[key], **{f"v_{c}": row.get(c) for c in columns}} for row in rows]
+            )
+
+        await db.execute(delete(player_armies).where(player_armies.c.game_state_id == game_id))
+        if state["armies"]:
+            await db.execute(
+                insert(player_armies),
+                [{**_coerce_row(player_armies, army), "game_state_id": game_id} for army in state["armies"]]
+            )
+
+
+def _coerce_row(table, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the table's columns; ISO strings (from event payloads) become datetimes"""
+    return {
+        k: datetime.fromisoformat(v) if isinstance(v, str) and isinstance(table.c[k].type, DateTime) else v
+        for k, v in row.items()
+        if k in table.c and k not in _SKIPPED_COLUMNS
+    }
+
+
+_REDUCERS = {
+    EventType.GAME_CREATED: lambda state, p: None,
+    EventType.ORACLE_CHALLENGED: GameProjector._oracle_challenged,
+    EventType.PUZZLE_ATTEMPTED: GameProjector._puzzle_attempted,
+    EventType.PUZZLE_SERVED: GameProjector._puzzle_served,
+    EventType.BATTLE_STARTED: GameProjector._battle_started,
+    EventType.BATTLE_TURN: GameProjector._battle_turn,
+    EventType.BATTLE_RESOLVED: GameProjector._battle_resolved,
+    EventType.BATTLE_CHECKPOINT: GameProjector._battle_resolved,
+    EventType.ORACLE_DEFEATED: GameProjector._oracle_defeated,
+    EventType.INSIGHT_USED: GameProjector._insight_used,
+    EventType.GAME_SAVED: GameProjector._game_saved,
+    EventType.RULE_CHANGED: GameProjector._rule_changed,
+}
+
+
+class GameEventService:
+    """Event log append, snapshots and reconstruction"""
+
+    @staticmethod
+    async def append(db: AsyncSession, game_id: int, version: int, event: Event):
+        """Record the event that produced `version` (same transaction as the mutation)"""
+        event_type, payload = event
+        await db.execute(
+            insert(GameEvent).values(
+                game_state_id=game_id,
+                version=version,
+                event_type=event_type,
+                payload=payload
+            )
+        )
+
+    @staticmethod
+    async def append_many(db: AsyncSession, events: List[Tuple[int, int, Event]]):
+        """Bulk variant of append: [(game_id, version, event), ...]"""
+        if events:
+            await db.execute(
+                insert(GameEvent),
+                [
+                    {"game_state_id": game_id, "version": version, "event_type": t, "payload": p}
+                    for game_id, version, (t, p) in events
+                ]
+            )
+
+    @staticmethod
+    async def save_snapshots(db: AsyncSession, states: List[Tuple[int, Dict[str, Any]]]):
+        """Store replay states [(game_id, state), ...]; existing versions are kept"""
+        if states:
+            await db.execute(
+                pg_insert(GameSnapshot).on_conflict_do_nothing(constraint="uq_game_snapshots_version"),
+                [
+                    {
+                        "game_state_id": game_id,
+                        "version": state["version"],
+                        "payload": SnapshotService.pack_document(state)
+                    }
+                    for game_id, state in states
+                ]
+            )
+
+    @staticmethod
+    def snapshot_due(version: int) -> bool:
+        return version % settings.EVENT_SNAPSHOT_INTERVAL == 0
+
+    @staticmethod
+    async def take_snapshot(game_id: int):
+        """
+        Snapshot the committed state of a game (background task).
+        STEP: REPEATABLE READ dump so the rows and the version agree.
+        """
+        from app.database import AsyncSessionLocal
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ"))
+                dump = await SnapshotService.dump_game(db, game_id)
+                if dump is None:
+                    return
+                state = GameProjector.state_from_dump(dump)
+                await GameEventService.save_snapshots(db, [(game_id, state)])
+                await db.commit()
+            
+            # Warm (or resync) the recent-version ring from the fresh snapshot
+            ring = game_history.head(game_id)
+            if ring is None or ring.head_version < state["version"]:
+                game_history.push(game_id, state["version"], state)
+        except Exception as e:
+            print(f"Snapshot of game {game_id} failed: {e}")
+
+    @staticmethod
+    def record_history(game_id: int, version: int, event: Optional[Event]):
+        """
+        Extend a game's recent-version ring with a committed mutation.
+        STEP: Copy-on-write of the head state plus one reducer call; a ring that
+        cannot be extended (cold, gap, unreplayable event) is dropped.
+        """
+        ring = game_history.head(game_id)
+        if event is None or ring is None or ring.head_version != version - 1 or event[0] not in _REDUCERS:
+            game_history.discard(game_id)
+            return
+
+        event_type, payload = event
+        state = copy_on_write(ring.back(0), payload.get("oracle_id"), payload.get("oracle_name"))
+        try:
+            GameProjector.apply(state, event_type, payload)
+        except Exception as e:
+            print(f"History of game {game_id} dropped at version {version}: {e}")
+            game_history.discard(game_id)
+            return
+        state["version"] = version
+        game_history.push(game_id, version, state)
+
+    @staticmethod
+    def schedule_snapshot(game_id: int, version: int):
+        """Take a snapshot in the background every EVENT_SNAPSHOT_INTERVAL versions"""
+        if GameEventService.snapshot_due(version):
+            asyncio.create_task(GameEventService.take_snapshot(game_id))
+
+    @staticmethod
+    async def list_events(
+        db: AsyncSession,
+        game_id: int,
+        after_version: int = 0,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Audit view of the log"""
+        result = await db.execute(
+            select(GameEvent)
+            .where(GameEvent.game_state_id == game_id, GameEvent.version > after_version)
+            .order_by(GameEvent.version)
+            .limit(limit)
+        )
+        return [
+            {
+                "version": e.version,
+                "type": EventType.NAMES.get(e.event_type, str(e.event_type)),
+                "payload": e.payload,
+                "created_at": e.created_at.isoformat() if e.created_at else None
+            }
+            for e in result.scalars().all()
+        ]
+
+    @staticmethod
+    async def reconstruct(
+        db: AsyncSession,
+        game_id: int,
+        version: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild the replay state of a game at `version` (default: latest logged).
+        STEP: Nearest snapshot at or below the version, then replay of the event tail.
+        Returns None when no snapshot covers the version.
+        """
+        query = select(GameSnapshot.version, GameSnapshot.payload).where(GameSnapshot.game_state_id == game_id)
+        if version is not None:
+            query = query.where(GameSnapshot.version <= version)
+        result = await db.execute(query.order_by(GameSnapshot.version.desc()).limit(1))
+        snapshot = result.one_or_none()
+        if snapshot is None:
+            return None
+
+        query = (
+            select(GameEvent.version, GameEvent.event_type, GameEvent.payload)
+            .where(GameEvent.game_state_id == game_id, GameEvent.version > snapshot.version)
+            .order_by(GameEvent.version)
+        )
+        if version is not None:
+            query = query.where(GameEvent.version <= version)
+        result = await db.execute(query)
+
+        state = SnapshotService.unpack_document(snapshot.payload)
+        GameEventService.replay(state, result.all())
+
+        if version is not None and state["version"] != version:
+            raise ValueError(f"History of game {game_id} ends at version {state['version']}")
+        return state
+
+    @staticmethod
+    def replay(state: Dict[str, Any], events: List[Tuple[int, int, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Apply (version, event_type, payload) rows in order; versions must be contiguous"""
+        for version, event_type, payload in events:
+            if version != state["version"] + 1:
+                raise ValueError(f"Gap in event history: {state['version']} -> {version}")
+            GameProjector.apply(state, event_type, payload)
+            state["version"] = version
+        return state
+
+    @staticmethod
+    async def rebuild_tables(db: AsyncSession, game_id: int, version: Optional[int] = None) -> int:
+        """
+        Re-project the game tables from history (repair, or return to an old version).
+        STEP: Reconstruct, project, bump the version with a GAME_REBUILT event and
+        snapshot the new version so later replays never cross the rebuild.
+        """
+        # Recent versions come from the in-process ring; older ones are replayed
+        state = game_history.at(game_id, version) if version is not None else None
+        if state is None:
+            state = await GameEventService.reconstruct(db, game_id, version)
+        if state is None:
+            raise ValueError(f"No snapshot covers game {game_id} version {version}")
+
+        await GameProjector.project(db, game_id, state)
+        result = await db.execute(
+            update(GameState)
+            .where(GameState.id == game_id)
+            .values(version=GameState.version + 1)
+            .returning(GameState.version)
+        )
+        new_version = result.scalar_one()
+
+        await GameEventService.append(
+            db,
+            game_id,
+            new_version,
+            (EventType.GAME_REBUILT, {"from_version": state["version"]})
+        )
+        await GameEventService.save_snapshots(db, [(game_id, {**state, "version": new_version})])
+        await db.commit()
+
+        await game_state_cache.set_version(game_id, new_version)
+        game_history.push(game_id, new_version, {**state, "version": new_version})
+        return new_version
+    
+    @staticmethod
+    async def rewind(db: AsyncSession, game_id: int, steps: int = 1) -> int:
+        """
+        Return a game to the state `steps` versions back (as a new version).
+        STEP: O(1) from the recent-version ring when the target is still in it.
+        """
+        result = await db.execute(select(GameState.version).where(GameState.id == game_id))
+        version = result.scalar_one_or_none()
+        if version is None:
+            raise ValueError(f"Game {game_id} not found")
+        if not 0 < steps < version:
+            raise ValueError(f"Cannot rewind game {game_id} by {steps} versions")
+        return await GameEventService.rebuild_tables(db, game_id, version - steps)
@@ -8,21 +8,54 @@ STEP: Core Game Service
 Manages game state, progression, inventory, and player actions.
 """
 from typing import Optional, List, Dict, Any
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, exists, case, func, literal, bindparam, true
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, load_only
+from sqlalchemy.orm.exc import StaleDataError
 from fastapi import HTTPException, status
-from datetime import datetime
+from datetime import datetime, timezone
 
+from app.database import AsyncSessionLocal, ConcurrencyConflict, is_replica_session
 from app.models.player import Player
 from app.models.game_state import GameState, DominionState
-from app.models.oracle import Oracle, OracleState
-from app.models.army import PlayerArmy, ArmyUnit
+from app.models.oracle import OracleState
+from app.models.army import PlayerArmy
+from app.models.game_event import GameEvent
+from app.cache.prefetch import phase_prefetcher
+from app.cache.catalog import catalog_cache
+from app.cache.game_state_cache import game_state_cache
+from app.services.archive_service import ArchiveService
+from app.services.snapshot_service import SnapshotService
+from app.services.event_service import GameEventService, GameProjector, EventType, Event
+from app.services.puzzle_bank_service import PuzzleBankService
+from app.puzzles.generators import PUZZLE_GENERATORS, generate_puzzle
+from app.puzzles.verifier import public_puzzle
+from app.config import settings
+from app.utils.metrics import REPLICA_FALLBACKS
+from app.utils.jsonb import apply_jsonb_update, jsonb_append_unique, jsonb_append_at
 
 
 class GameService:
     """Core game logic and state management"""
     
+    # The 13 floating dominions created for every new game
+    DOMINIONS = [
+        ("Chronos Domain", "Chronos"),
+        ("Shadow Realm of Nyx", "Nyx"),
+        ("Proteus Mirage", "Proteus"),
+        ("Aresion War Citadel", "Aresion"),
+        ("Athenaia's Acropolis", "Athenaia"),
+        ("Helios Solar Spire", "Helios"),
+        ("Boreas Frozen Wastes", "Boreas"),
+        ("Gaia's Living Gardens", "Gaia"),
+        ("Themis Hall of Balance", "Themis"),
+        ("Echo's Resonance Chamber", "Echo"),
+        ("Selene's Lunar Palace", "Selene"),
+        ("DelphiX Oracle Tower", "DelphiX"),
+        ("Typhon's Chaos Abyss", "Typhon")
+    ]
+    
     @staticmethod
     async def create_new_game(
         db: AsyncSession,
@@ -33,102 +66,157 @@ class GameService:
         Initialize a new game session with starting resources.
         STEP: Creates game state, initializes 13 dominions, sets up starting inventory.
         """
-        # Create game state
-        game_state = GameState(
-            player_id=player_id,
-            current_stage=1,
-            oracles_defeated=0,
-            gold=100,
-            insight_tokens=1,
-            healing_draughts=1,
-            weapons=["Mortal Spear"],
-            special_items=[],
-            potions=["Basic Healing Draught"],
-            difficulty_level=difficulty,
-            world_state={
-                "global_modifiers": [],
-                "alliances": [],
-                "hostilities": [],
-                "rule_changes": []
-            },
-            active_events=[]
+        game_states = await GameService.create_new_games(db, [player_id], difficulty)
+        return game_states[0]
+    
+    @staticmethod
+    async def create_new_games(
+        db: AsyncSession,
+        player_ids: List[int],
+        difficulty: str = "normal"
+    ) -> List[GameState]:
+        """
+        Create one new game per player id in a single transaction.
+        STEP: One INSERT ... RETURNING for the game states, then one batched
+        executemany per child table (oracle states, dominions, starting army),
+        then the genesis snapshots and creation events. Unknown player ids are
+        rejected up front (422).
+        """
+        if not player_ids:
+            return []
+        
+        # Unknown players would otherwise fail mid-batch as a foreign key violation
+        result = await db.scalars(select(Player.id).where(Player.id.in_(set(player_ids))))
+        missing = sorted(set(player_ids) - set(result.all()))
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Unknown player ids: {missing[:20]}"
+            )
+        
+        # Create game states
+        result = await db.scalars(
+            insert(GameState).returning(GameState, sort_by_parameter_order=True),
+            [
+                {
+                    "player_id": player_id,
+                    "current_stage": 1,
+                    "oracles_defeated": 0,
+                    "gold": 100,
+                    "insight_tokens": 1,
+                    "healing_draughts": 1,
+                    "weapons": ["Mortal Spear"],
+                    "special_items": [],
+                    "potions": ["Basic Healing Draught"],
+                    "difficulty_level": difficulty,
+                    "world_state": {
+                        "global_modifiers": [],
+                        "alliances": [],
+                        "hostilities": [],
+                        "rule_changes": []
+                    },
+                    "active_events": []
+                }
+                for player_id in player_ids
+            ]
         )
+        game_states = result.all()
+        game_ids = [game_state.id for game_state in game_states]
         
-        db.add(game_state)
-        await db.flush()
+        catalog = catalog_cache.current
         
         # Initialize all 13 oracles
-        result = await db.execute(select(Oracle))
-        oracles = result.scalars().all()
-        
-        for oracle in oracles:
-            oracle_state = OracleState(
-                game_state_id=game_state.id,
-                oracle_id=oracle.id,
-                is_defeated=False,
-                is_hostile=True,
-                is_allied=False,
-                current_phase="locked",
-                puzzle_state={},
-                battle_state={},
-                diplomatic_stance=-0.5,
-                special_rules_active={}
+        oracle_rows = []
+        if catalog.oracles:
+            result = await db.execute(
+                insert(OracleState).returning(*OracleState.__table__.c),
+                [
+                    {
+                        "game_state_id": game_id,
+                        "oracle_id": oracle.id,
+                        "is_defeated": False,
+                        "is_hostile": True,
+                        "is_allied": False,
+                        "current_phase": "locked",
+                        "puzzle_state": {},
+                        "battle_state": {},
+                        "diplomatic_stance": -0.5,
+                        "special_rules_active": {}
+                    }
+                    for game_id in game_ids
+                    for oracle in catalog.oracles
+                ]
             )
-            db.add(oracle_state)
+            oracle_rows = result.mappings().all()
         
         # Initialize 13 dominions
-        dominion_names = [
-            ("Chronos Domain", "Chronos"),
-            ("Shadow Realm of Nyx", "Nyx"),
-            ("Proteus Mirage", "Proteus"),
-            ("Aresion War Citadel", "Aresion"),
-            ("Athenaia's Acropolis", "Athenaia"),
-            ("Helios Solar Spire", "Helios"),
-            ("Boreas Frozen Wastes", "Boreas"),
-            ("Gaia's Living Gardens", "Gaia"),
-            ("Themis Hall of Balance", "Themis"),
-            ("Echo's Resonance Chamber", "Echo"),
-            ("Selene's Lunar Palace", "Selene"),
-            ("DelphiX Oracle Tower", "DelphiX"),
-            ("Typhon's Chaos Abyss", "Typhon")
-        ]
-        
-        for dominion_name, oracle_name in dominion_names:
-            dominion = DominionState(
-                game_state_id=game_state.id,
-                name=dominion_name,
-                oracle_name=oracle_name,
-                is_controlled=False,
-                is_accessible=True if oracle_name == "Chronos" else False,
-                resource_bonus={},
-                explored_areas=[],
-                hidden_secrets=[]
-            )
-            db.add(dominion)
-        
-        # Add starting army unit
         result = await db.execute(
-            select(ArmyUnit).where(ArmyUnit.name == "Novice Soldiers")
+            insert(DominionState).returning(*DominionState.__table__.c),
+            [
+                {
+                    "game_state_id": game_id,
+                    "name": dominion_name,
+                    "oracle_name": oracle_name,
+                    "is_controlled": False,
+                    "is_accessible": oracle_name == "Chronos",
+                    "resource_bonus": {},
+                    "explored_areas": [],
+                    "hidden_secrets": []
+                }
+                for game_id in game_ids
+                for dominion_name, oracle_name in GameService.DOMINIONS
+            ]
         )
-        novice_unit = result.scalar_one_or_none()
+        dominion_rows = result.mappings().all()
+        
+        # Add starting army unit
+        novice_unit = catalog.unit_by_name("Novice Soldiers")
         
+        army_rows = []
         if novice_unit:
-            player_army = PlayerArmy(
-                game_state_id=game_state.id,
-                army_unit_id=novice_unit.id,
-                quantity=10,
-                total_health=1000,
-                morale=1.0,
-                experience_level=1,
-                is_deployed=True,
-                current_location="Chronos Domain"
+            result = await db.execute(
+                insert(PlayerArmy).returning(*PlayerArmy.__table__.c),
+                [
+                    {
+                        "game_state_id": game_id,
+                        "army_unit_id": novice_unit.id,
+                        "quantity": 10,
+                        "total_health": 1000,
+                        "morale": 1.0,
+                        "experience_level": 1,
+                        "is_deployed": True,
+                        "current_location": "Chronos Domain"
+                    }
+                    for game_id in game_ids
+                ]
+            )
+            army_rows = result.mappings().all()
+        
+        # Genesis snapshot + creation event: history starts at version 1
+        def rows_for(rows, game_id):
+            return [dict(row) for row in rows if row["game_state_id"] == game_id]
+        
+        await GameEventService.save_snapshots(db, [
+            (
+                game_state.id,
+                GameProjector.build_state(
+                    game_state.version,
+                    {c.key: getattr(game_state, c.key) for c in GameState.__table__.c},
+                    rows_for(oracle_rows, game_state.id),
+                    rows_for(dominion_rows, game_state.id),
+                    rows_for(army_rows, game_state.id)
+                )
             )
-            db.add(player_army)
+            for game_state in game_states
+        ])
+        await GameEventService.append_many(db, [
+            (game_state.id, game_state.version, (EventType.GAME_CREATED, {"difficulty": difficulty}))
+            for game_state in game_states
+        ])
         
         await db.commit()
-        await db.refresh(game_state)
         
-        return game_state
+        return list(game_states)
     
     @staticmethod
     async def get_game_state(
@@ -139,8 +227,9 @@ class GameService:
         """
         Get complete game state with all relationships loaded.
         STEP: Fetches game state, validates ownership, loads oracles and dominions.
+        Archived games are restored into Postgres first.
         """
-        result = await db.execute(
+        query = (
             select(GameState)
             .options(
                 selectinload(GameState.oracle_states).selectinload(OracleState.oracle),
@@ -149,9 +238,14 @@ class GameService:
             )
             .where(GameState.id == game_id, GameState.player_id == player_id)
         )
+        result = await db.execute(query)
         
         game_state = result.scalar_one_or_none()
         
+        if not game_state and await ArchiveService.restore_game(game_id, player_id):
+            result = await db.execute(query)
+            game_state = result.scalar_one_or_none()
+        
         if not game_state:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -160,6 +254,271 @@ class GameService:
         
         return game_state
     
+    @staticmethod
+    async def ensure_game_owner(db: AsyncSession, game_id: int, player_id: int):
+        """
+        Check that a game belongs to the player without loading it.
+        STEP: Guards endpoints that act on a game's battles by id; 404 for games
+        that do not exist and for other players' games alike.
+        """
+        result = await db.execute(
+            select(GameState.id).where(GameState.id == game_id, GameState.player_id == player_id)
+        )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+    
+    @staticmethod
+    def serialize_game_state(game_state: GameState) -> Dict[str, Any]:
+        """
+        Flatten a fully loaded game state into a JSON-safe snapshot.
+        STEP: Captures everything the read-only endpoints return.
+        """
+        catalog = catalog_cache.current
+        oracle_states = []
+        for oracle_state in game_state.oracle_states:
+            oracle = catalog.oracle_by_id(oracle_state.oracle_id)
+            oracle_states.append({
+                "id": oracle_state.id,
+                "oracle_id": oracle_state.oracle_id,
+                "name": oracle.name if oracle else None,
+                "domain": oracle.domain if oracle else None,
+                "is_defeated": oracle_state.is_defeated,
+                "is_hostile": oracle_state.is_hostile,
+                "is_allied": oracle_state.is_allied,
+                "current_phase": oracle_state.current_phase,
+                "diplomatic_stance": oracle_state.diplomatic_stance
+            })
+        
+        player_armies = []
+        for army in game_state.player_armies:
+            unit_type = catalog.unit_by_id(army.army_unit_id)
+            player_armies.append({
+                "id": army.id,
+                "army_unit_id": army.army_unit_id,
+                "unit_name": unit_type.name if unit_type else None,
+                "quantity": army.quantity,
+                "total_health": army.total_health,
+                "morale": army.morale,
+                "experience_level": army.experience_level,
+                "is_deployed": army.is_deployed,
+                "current_location": army.current_location
+            })
+        
+        return {
+            "id": game_state.id,
+            "player_id": game_state.player_id,
+            "version": game_state.version,
+            "current_stage": game_state.current_stage,
+            "oracles_defeated": game_state.oracles_defeated,
+            "current_oracle_id": game_state.current_oracle_id,
+            "gold": game_state.gold,
+            "insight_tokens": game_state.insight_tokens,
+            "healing_draughts": game_state.healing_draughts,
+            "weapons": list(game_state.weapons or []),
+            "special_items": list(game_state.special_items or []),
+            "potions": list(game_state.potions or []),
+            "is_active": game_state.is_active,
+            "is_completed": game_state.is_completed,
+            "difficulty_level": game_state.difficulty_level,
+            "world_state": game_state.world_state or {},
+            "active_events": list(game_state.active_events or []),
+            "oracle_states": oracle_states,
+            "dominion_states": [
+                {
+                    "name": ds.name,
+                    "oracle_name": ds.oracle_name,
+                    "is_controlled": ds.is_controlled,
+                    "is_accessible": ds.is_accessible
+                }
+                for ds in game_state.dominion_states
+            ],
+            "player_armies": player_armies
+        }
+    
+    @staticmethod
+    async def get_game_snapshot(
+        db: AsyncSession,
+        game_id: int,
+        player_id: int
+    ) -> Dict[str, Any]:
+        """
+        Get a read-only snapshot of the game state.
+        STEP: Served from the versioned cache; loads from Postgres only on a miss
+        (restoring the game from the archive if it was archived).
+        """
+        snapshot = await game_state_cache.get(game_id)
+        
+        if snapshot is None:
+            snapshot = await GameService._load_snapshot(db, game_id)
+            
+            # A lagging replica may miss the game or serve a version older than the
+            # last committed mutation: re-read from the primary (read-your-writes)
+            if is_replica_session(db):
+                known_version = await game_state_cache.current_version(game_id)
+                if snapshot is None or (known_version is not None and snapshot["version"] < known_version):
+                    REPLICA_FALLBACKS.labels(reason="stale_version").inc()
+                    async with AsyncSessionLocal() as primary:
+                        snapshot = await GameService._load_snapshot(primary, game_id)
+            
+            # Reopening an archived game brings it back into the hot tables
+            if snapshot is None and await ArchiveService.restore_game(game_id, player_id):
+                async with AsyncSessionLocal() as primary:
+                    snapshot = await GameService._load_snapshot(primary, game_id)
+            
+            if snapshot:
+                await game_state_cache.put(snapshot)
+        
+        if not snapshot or snapshot["player_id"] != player_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+        
+        return snapshot
+    
+    @staticmethod
+    async def _load_snapshot(db: AsyncSession, game_id: int) -> Optional[Dict[str, Any]]:
+        """Load and serialize a game state straight from Postgres"""
+        result = await db.execute(
+            select(GameState)
+            .options(
+                selectinload(GameState.oracle_states),
+                selectinload(GameState.dominion_states),
+                selectinload(GameState.player_armies)
+            )
+            .where(GameState.id == game_id)
+        )
+        game_state = result.scalar_one_or_none()
+        return GameService.serialize_game_state(game_state) if game_state else None
+    
+    @staticmethod
+    async def commit_game_mutation(
+        db: AsyncSession,
+        game_id: int,
+        game_state: Optional[GameState] = None,
+        event: Optional[Event] = None
+    ) -> int:
+        """
+        Commit a mutating call and advance the game's version.
+        STEP: With a loaded game_state the bump is a versioned ORM UPDATE
+        (WHERE version = <read version>); otherwise an atomic SQL increment.
+        The event describing the mutation is logged against the new version in the
+        same transaction. Stale rows raise ConcurrencyConflict; after commit the
+        cache pointer moves and the recent-version ring is extended.
+        """
+        try:
+            if game_state is not None:
+                game_state.version = game_state.version + 1
+                await db.flush()
+                version = game_state.version
+            else:
+                await db.flush()
+                result = await db.execute(
+                    update(GameState)
+                    .where(GameState.id == game_id)
+                    .values(version=GameState.version + 1)
+                    .returning(GameState.version)
+                )
+                version = result.scalar_one()
+            if event is not None:
+                await GameEventService.append(db, game_id, version, event)
+            await db.commit()
+        except StaleDataError as e:
+            await db.rollback()
+            raise ConcurrencyConflict(str(e)) from e
+        
+        await game_state_cache.set_version(game_id, version)
+        GameEventService.record_history(game_id, version, event)
+        GameEventService.schedule_snapshot(game_id, version)
+        return version
+    
+    @staticmethod
+    async def record_rule_change(
+        db: AsyncSession,
+        game_id: int,
+        player_id: int,
+        rule_change: Dict[str, Any]
+    ) -> int:
+        """
+        Append a global rule change to world_state.
+        STEP: Loads only id/version, then a single jsonb_set on world_state.rule_changes;
+        the ever-growing document is never shipped back and forth.
+        """
+        result = await db.execute(
+            select(GameState)
+            .options(load_only(GameState.id, GameState.version))
+            .where(GameState.id == game_id, GameState.player_id == player_id)
+        )
+        game_state = result.scalar_one_or_none()
+        
+        if not game_state:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+        
+        await apply_jsonb_update(
+            db,
+            game_state,
+            {"world_state": jsonb_append_at(GameState.world_state, ["rule_changes"], rule_change)}
+        )
+        return await GameService.commit_game_mutation(
+            db,
+            game_id,
+            game_state,
+            event=(EventType.RULE_CHANGED, {"rule_change": rule_change})
+        )
+    
+    @staticmethod
+    async def export_game_snapshot(
+        db: AsyncSession,
+        game_id: int,
+        player_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Dump a whole game for export (owner-checked unless player_id is None).
+        STEP: See SnapshotService for the format.
+        """
+        snapshot = await SnapshotService.dump_game(db, game_id)
+        
+        if not snapshot or (player_id is not None and snapshot["player_id"] != player_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+        
+        return snapshot
+    
+    @staticmethod
+    async def import_game_snapshot(
+        db: AsyncSession,
+        snapshot: Dict[str, Any],
+        player_id: int
+    ) -> int:
+        """
+        Import a snapshot as a new game for a player.
+        STEP: Bulk inserts with fresh ids in one transaction; returns the new game id.
+        """
+        try:
+            game_id = await SnapshotService.import_game(db, snapshot, player_id)
+        except (ValueError, KeyError) as e:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid snapshot: {e}"
+            )
+        
+        await db.commit()
+        return game_id
+    
+    @staticmethod
+    async def invalidate_game_cache(game_id: int):
+        """Explicitly drop cached snapshots for a game"""
+        await game_state_cache.invalidate(game_id)
+    
     @staticmethod
     async def save_game_state(
         db: AsyncSession,
@@ -171,8 +530,13 @@ class GameService:
         STEP: Updates last_save timestamp and persists all changes.
         """
         game_state = await GameService.get_game_state(db, game_id, player_id)
-        game_state.last_save = datetime.utcnow()
-        await db.commit()
+        game_state.last_save = datetime.now(timezone.utc)
+        await GameService.commit_game_mutation(
+            db,
+            game_id,
+            game_state,
+            event=(EventType.GAME_SAVED, {"at": game_state.last_save.isoformat()})
+        )
         
         return {
             "message": "Game saved successfully",
@@ -193,10 +557,7 @@ class GameService:
         game_state = await GameService.get_game_state(db, game_id, player_id)
         
         # Find oracle
-        result = await db.execute(
-            select(Oracle).where(Oracle.name == oracle_name)
-        )
-        oracle = result.scalar_one_or_none()
+        oracle = catalog_cache.current.oracle_by_name(oracle_name)
         
         if not oracle:
             raise HTTPException(
@@ -222,10 +583,33 @@ class GameService:
         # Update game state
         game_state.current_oracle_id = oracle.id
         oracle_state.current_phase = "exploration"
-        oracle_state.last_interaction = datetime.utcnow()
+        oracle_state.last_interaction = datetime.now(timezone.utc)
         oracle_state.interactions_count += 1
         
-        await db.commit()
+        await GameService.commit_game_mutation(
+            db,
+            game_id,
+            game_state,
+            event=(EventType.ORACLE_CHALLENGED, {
+                "oracle_id": oracle.id,
+                "at": oracle_state.last_interaction.isoformat()
+            })
+        )
+        
+        # Warm puzzle, diplomacy and battle inputs while the player explores
+        # (no puzzle LLM call when the bank already holds one this player has not seen)
+        bucket = GameService._puzzle_bucket(oracle)
+        phase_prefetcher.start(
+            game_id,
+            player_id,
+            oracle.name,
+            oracle.difficulty_level,
+            {
+                "oracles_defeated": game_state.oracles_defeated,
+                "current_stage": game_state.current_stage
+            },
+            puzzle=bucket is None or not await PuzzleBankService.has_unseen(db, player_id, bucket)
+        )
         
         return {
             "oracle": {
@@ -240,128 +624,320 @@ class GameService:
         }
     
     @staticmethod
-    async def defeat_oracle(
+    def _puzzle_bucket(oracle) -> Optional[tuple]:
+        """Bank bucket of an oracle's puzzles, or None when they are not banked (procedural or bank off)"""
+        agent = phase_prefetcher.agent(oracle.name)
+        puzzle_type = agent.puzzle_type if agent else settings.PUZZLE_FALLBACK_TYPE
+        if not settings.PUZZLE_BANK_ENABLED or puzzle_type in PUZZLE_GENERATORS:
+            return None
+        return (oracle.id, puzzle_type, oracle.difficulty_level)
+    
+    @staticmethod
+    async def start_oracle_puzzle(
         db: AsyncSession,
         game_id: int,
         player_id: int,
         oracle_id: int
     ) -> Dict[str, Any]:
         """
-        Mark oracle as defeated and distribute rewards.
-        STEP: Updates oracle state, adds rewards, increments stage, updates player stats.
+        Serve the oracle's puzzle and enter the puzzle phase.
+        STEP: An unsolved puzzle already served is returned again. Otherwise the
+        player's next unseen banked puzzle is drawn; on a miss the prefetched (or a
+        freshly generated) puzzle is served and banked for other players.
+        Procedural puzzles are cheap and always fresh, so they skip the bank; oracles
+        without an agent get a PUZZLE_FALLBACK_TYPE procedural puzzle.
         """
         game_state = await GameService.get_game_state(db, game_id, player_id)
-        
-        # Get oracle and state
-        result = await db.execute(
-            select(Oracle).where(Oracle.id == oracle_id)
-        )
-        oracle = result.scalar_one_or_none()
-        
-        result = await db.execute(
-            select(OracleState).where(
-                OracleState.game_state_id == game_id,
-                OracleState.oracle_id == oracle_id
-            )
-        )
-        oracle_state = result.scalar_one_or_none()
+        oracle = catalog_cache.current.oracle_by_id(oracle_id)
+        oracle_state = next((o for o in game_state.oracle_states if o.oracle_id == oracle_id), None)
         
         if not oracle or not oracle_state:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Oracle not found"
             )
-        
         if oracle_state.is_defeated:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Oracle already defeated"
             )
         
-        # Mark as defeated
-        oracle_state.is_defeated = True
-        oracle_state.defeated_at = datetime.utcnow()
-        oracle_state.is_hostile = False
-        
-        # Update dominion
-        result = await db.execute(
-            select(DominionState).where(
-                DominionState.game_state_id == game_id,
-                DominionState.oracle_name == oracle.name
+        puzzle_state = oracle_state.puzzle_state or {}
+        if oracle_state.current_phase == "puzzle" and puzzle_state and not puzzle_state.get("solved"):
+            return GameService._puzzle_view(oracle, puzzle_state)
+        
+        bucket = GameService._puzzle_bucket(oracle)
+        puzzle = await PuzzleBankService.draw(db, player_id, bucket) if bucket else None
+        
+        if puzzle is None:
+            difficulty = oracle.difficulty_level
+            puzzle = await phase_prefetcher.consume(game_id, oracle.name, f"puzzle:{difficulty}")
+            if puzzle is None:
+                agent = phase_prefetcher.agent(oracle.name)
+                if agent:
+                    puzzle = await agent.generate_puzzle(difficulty, {
+                        "oracles_defeated": game_state.oracles_defeated,
+                        "current_stage": game_state.current_stage
+                    })
+                else:
+                    # No agent for this oracle (or no orchestrator bound): serve a procedural puzzle
+                    puzzle = generate_puzzle(settings.PUZZLE_FALLBACK_TYPE, difficulty)
+            if bucket:
+                bank_id = await PuzzleBankService.add(db, player_id, bucket, puzzle)
+                if bank_id is not None:
+                    puzzle = {**puzzle, "bank_id": bank_id}
+        
+        puzzle_state = {**puzzle, "attempts": 0}
+        oracle_state.puzzle_state = puzzle_state
+        oracle_state.current_phase = "puzzle"
+        
+        await GameService.commit_game_mutation(
+            db,
+            game_id,
+            game_state,
+            event=(EventType.PUZZLE_SERVED, {"oracle_id": oracle_id, "puzzle_state": puzzle_state})
+        )
+        return GameService._puzzle_view(oracle, puzzle_state)
+    
+    @staticmethod
+    def _puzzle_view(oracle, puzzle_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Puzzle as shown to the player (answers, seed and rules withheld)"""
+        return {
+            "oracle_id": oracle.id,
+            "phase": "puzzle",
+            "puzzle": public_puzzle(puzzle_state)
+        }
+    
+    @staticmethod
+    async def defeat_oracle(
+        db: AsyncSession,
+        game_id: int,
+        player_id: int,
+        oracle_id: int
+    ) -> Dict[str, Any]:
+        """
+        Mark oracle as defeated and distribute rewards.
+        STEP: One statement of chained UPDATE/INSERT ... RETURNING CTEs flips the oracle
+        state, takes the dominion, credits rewards and progress, grants the army unit,
+        bumps player stats and logs the event; every step is gated on the oracle flip
+        succeeding.
+        """
+        catalog = catalog_cache.current
+        oracle = catalog.oracle_by_id(oracle_id)
+        
+        if oracle is None:
+            await GameService._raise_defeat_error(db, game_id, player_id, oracle_id)
+        
+        game_states = GameState.__table__
+        oracle_states = OracleState.__table__
+        dominion_states = DominionState.__table__
+        player_armies = PlayerArmy.__table__
+        players = Player.__table__
+        now = func.now()
+        
+        # Mark as defeated (only for the owner's game, only once)
+        defeated = (
+            update(oracle_states)
+            .where(
+                oracle_states.c.game_state_id == game_id,
+                oracle_states.c.oracle_id == oracle_id,
+                oracle_states.c.is_defeated.is_not(True),
+                exists().where(game_states.c.id == game_id, game_states.c.player_id == player_id)
             )
+            .values(
+                is_defeated=True,
+                defeated_at=now,
+                is_hostile=False,
+                version=oracle_states.c.version + 1
+            )
+            .returning(oracle_states.c.id)
+            .cte("defeated_oracle")
         )
-        dominion = result.scalar_one_or_none()
-        if dominion:
-            dominion.is_controlled = True
-            dominion.conquered_at = datetime.utcnow()
         
-        # Award rewards
-        rewards = {
-            "army_unit": oracle.army_unit_reward,
-            "weapon": oracle.weapon_reward,
-            "special_ability": oracle.special_ability,
-            "insight_tokens": 2,
-            "gold": 500
+        # Award insight tokens, gold and weapon; advance progress
+        defeated_count = game_states.c.oracles_defeated + 1
+        completes = defeated_count >= 13
+        game_values = {
+            "insight_tokens": game_states.c.insight_tokens + 2,
+            "gold": game_states.c.gold + 500,
+            "oracles_defeated": defeated_count,
+            "current_stage": defeated_count + 1,
+            "is_completed": case((completes, True), else_=game_states.c.is_completed),
+            "completed_at": case((completes, now), else_=game_states.c.completed_at),
+            "version": game_states.c.version + 1,
         }
+        if oracle.weapon_reward:
+            game_values["weapons"] = jsonb_append_unique(game_states.c.weapons, oracle.weapon_reward)
+        
+        rewarded = (
+            update(game_states)
+            .where(game_states.c.id == game_id, exists(select(defeated.c.id)))
+            .values(**game_values)
+            .returning(
+                game_states.c.oracles_defeated,
+                game_states.c.current_stage,
+                game_states.c.is_completed,
+                game_states.c.version,
+                now.label("defeated_at")
+            )
+            .cte("rewarded_game")
+        )
         
-        # Add weapon to inventory
-        if oracle.weapon_reward and oracle.weapon_reward not in game_state.weapons:
-            game_state.weapons.append(oracle.weapon_reward)
+        # Update dominion
+        controlled = (
+            update(dominion_states)
+            .where(
+                dominion_states.c.game_state_id == game_id,
+                dominion_states.c.oracle_name == oracle.name,
+                exists(select(rewarded.c.version))
+            )
+            .values(is_controlled=True, conquered_at=now)
+            .returning(dominion_states.c.id)
+            .cte("controlled_dominion")
+        )
         
-        # Add insight tokens and gold
-        game_state.insight_tokens += 2
-        game_state.gold += 500
+        # Update player stats
+        credited = (
+            update(players)
+            .where(players.c.id == player_id, rewarded.c.version.is_not(None))
+            .values(
+                oracles_defeated=players.c.oracles_defeated + 1,
+                games_won=players.c.games_won + case((rewarded.c.oracles_defeated >= 13, 1), else_=0)
+            )
+            .returning(players.c.id)
+            .cte("credited_player")
+        )
+        side_effects = [controlled, credited]
         
         # Add army unit
-        if oracle.army_unit_reward:
-            result = await db.execute(
-                select(ArmyUnit).where(ArmyUnit.name == oracle.army_unit_reward)
-            )
-            army_unit = result.scalar_one_or_none()
-            
-            if army_unit:
-                player_army = PlayerArmy(
-                    game_state_id=game_state.id,
-                    army_unit_id=army_unit.id,
-                    quantity=5,
-                    total_health=army_unit.health * 5,
-                    morale=1.0,
-                    experience_level=1,
-                    is_deployed=False
+        army_unit = catalog.unit_by_name(oracle.army_unit_reward) if oracle.army_unit_reward else None
+        if army_unit:
+            side_effects.append(
+                insert(player_armies)
+                .from_select(
+                    ["game_state_id", "army_unit_id", "quantity", "total_health",
+                     "morale", "experience_level", "is_deployed"],
+                    select(
+                        literal(game_id),
+                        literal(army_unit.id),
+                        literal(5),
+                        literal(army_unit.health * 5),
+                        literal(1.0),
+                        literal(1),
+                        literal(False)
+                    ).select_from(rewarded)
                 )
-                db.add(player_army)
+                .returning(player_armies.c.id)
+                .cte("granted_army")
+            )
         
-        # Update game progress
-        game_state.oracles_defeated += 1
-        game_state.current_stage = game_state.oracles_defeated + 1
+        # Log the event against the new version (payload completed with the defeat time)
+        game_events = GameEvent.__table__
+        payload = bindparam(None, {
+            "oracle_id": oracle_id,
+            "oracle_name": oracle.name,
+            "weapon": oracle.weapon_reward,
+            "army_unit_id": army_unit.id if army_unit else None,
+            "unit_health": army_unit.health if army_unit else None,
+        }, type_=JSONB).op("||")(func.jsonb_build_object(literal("at"), rewarded.c.defeated_at))
+        logged = (
+            insert(game_events)
+            .from_select(
+                ["game_state_id", "version", "event_type", "payload"],
+                select(
+                    literal(game_id),
+                    rewarded.c.version,
+                    literal(EventType.ORACLE_DEFEATED),
+                    payload
+                ).select_from(rewarded)
+            )
+            .returning(game_events.c.event_type, game_events.c.payload)
+            .cte("logged_event")
+        )
         
-        # Update player stats
         result = await db.execute(
-            select(Player).where(Player.id == player_id)
+            select(
+                rewarded.c.oracles_defeated,
+                rewarded.c.current_stage,
+                rewarded.c.is_completed,
+                rewarded.c.version,
+                logged.c.event_type,
+                logged.c.payload
+            ).select_from(rewarded.join(logged, true())).add_cte(*side_effects)
         )
-        player = result.scalar_one_or_none()
-        if player:
-            player.oracles_defeated += 1
+        progress = result.one_or_none()
         
-        # Check if game is completed (all 13 oracles defeated)
-        if game_state.oracles_defeated >= 13:
-            game_state.is_completed = True
-            game_state.completed_at = datetime.utcnow()
-            if player:
-                player.games_won += 1
+        if progress is None:
+            await db.rollback()
+            await GameService._raise_defeat_error(db, game_id, player_id, oracle_id)
         
         await db.commit()
+        await game_state_cache.set_version(game_id, progress.version)
+        GameEventService.record_history(game_id, progress.version, (progress.event_type, progress.payload))
+        GameEventService.schedule_snapshot(game_id, progress.version)
+        phase_prefetcher.discard(game_id, oracle.name)
+        
+        # Award rewards
+        rewards = {
+            "army_unit": oracle.army_unit_reward,
+            "weapon": oracle.weapon_reward,
+            "special_ability": oracle.special_ability,
+            "insight_tokens": 2,
+            "gold": 500
+        }
         
         return {
             "message": f"Oracle {oracle.name} has been defeated!",
             "rewards": rewards,
             "progress": {
-                "oracles_defeated": game_state.oracles_defeated,
-                "current_stage": game_state.current_stage,
-                "game_completed": game_state.is_completed
+                "oracles_defeated": progress.oracles_defeated,
+                "current_stage": progress.current_stage,
+                "game_completed": progress.is_completed
             }
         }
     
+    @staticmethod
+    async def _raise_defeat_error(
+        db: AsyncSession,
+        game_id: int,
+        player_id: int,
+        oracle_id: int
+    ):
+        """
+        Explain why defeat_oracle changed nothing (off the hot path).
+        STEP: Same checks and errors as the step-by-step version: game, oracle, already defeated.
+        """
+        result = await db.execute(
+            select(GameState.id).where(GameState.id == game_id, GameState.player_id == player_id)
+        )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Game not found"
+            )
+        
+        result = await db.execute(
+            select(OracleState.is_defeated).where(
+                OracleState.game_state_id == game_id,
+                OracleState.oracle_id == oracle_id
+            )
+        )
+        is_defeated = result.one_or_none()
+        
+        if catalog_cache.current.oracle_by_id(oracle_id) is None or is_defeated is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Oracle not found"
+            )
+        
+        if is_defeated[0]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Oracle already defeated"
+            )
+        
+        raise ConcurrencyConflict(f"Game {game_id} changed while defeating oracle {oracle_id}")
+    
     @staticmethod
     async def use_insight_token(
         db: AsyncSession,
@@ -382,7 +958,12 @@ class GameService:
             )
         
         game_state.insight_tokens -= 1
-        await db.commit()
+        await GameService.commit_game_mutation(
+            db,
+            game_id,
+            game_state,
+            event=(EventType.INSIGHT_USED, {})
+        )
         
         # Return placeholder - actual LLM call handled by agent orchestrator
         return {
@@ -402,24 +983,24 @@ class GameService:
         Get player's complete inventory.
         STEP: Returns weapons, items, potions, armies, and resources.
         """
-        game_state = await GameService.get_game_state(db, game_id, player_id)
+        snapshot = await GameService.get_game_snapshot(db, game_id, player_id)
         
         return {
-            "weapons": game_state.weapons,
-            "special_items": game_state.special_items,
-            "potions": game_state.potions,
-            "gold": game_state.gold,
-            "insight_tokens": game_state.insight_tokens,
-            "healing_draughts": game_state.healing_draughts,
+            "weapons": snapshot["weapons"],
+            "special_items": snapshot["special_items"],
+            "potions": snapshot["potions"],
+            "gold": snapshot["gold"],
+            "insight_tokens": snapshot["insight_tokens"],
+            "healing_draughts": snapshot["healing_draughts"],
             "armies": [
                 {
-                    "unit_name": army.unit_type.name,
-                    "quantity": army.quantity,
-                    "total_health": army.total_health,
-                    "morale": army.morale,
-                    "experience_level": army.experience_level,
-                    "is_deployed": army.is_deployed
+                    "unit_name": army["unit_name"],
+                    "quantity": army["quantity"],
+                    "total_health": army["total_health"],
+                    "morale": army["morale"],
+                    "experience_level": army["experience_level"],
+                    "is_deployed": army["is_deployed"]
                 }
-                for army in game_state.player_armies
+                for army in snapshot["player_armies"]
             ]
         }
@@ -0,0 +1,226 @@
+"""
+backend/app/services/puzzle_bank_service.py
+STEP: Persistent Puzzle Bank
+Generated puzzles are banked per (oracle, puzzle type, difficulty) under a dense
+slot index and deduplicated by a hash of their normalized text. Each player keeps
+one bitmap of served slots per bucket, so the next unseen puzzle is found by
+index instead of being generated again.
+"""
+from typing import Any, Dict, Mapping, Optional, Tuple
+import hashlib
+import json
+
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.puzzle_bank import PuzzleBankEntry, PuzzleSeen
+from app.puzzles.verifier import normalize_answer, ANSWER_KEYS
+from app.utils.metrics import PUZZLE_BANK_REQUESTS
+from app.utils.validators import schema_registry
+
+# Puzzle keys whose (normalized) text identifies a puzzle, besides its answers
+TEXT_KEYS = ("description", "riddle", "riddle_text", "scenario", "question")
+
+# Bank bucket: (oracle_id, puzzle_type, difficulty)
+Bucket = Tuple[int, str, int]
+
+
+def content_hash(puzzle: Mapping[str, Any]) -> bytes:
+    """
+    16-byte blake2b of a puzzle's normalized text and answers.
+    STEP: Case, punctuation, filler words and number spelling do not change the
+    hash; puzzles without any text keys hash their canonical JSON instead.
+    """
+    parts = [
+        f"{key}={normalize_answer(str(puzzle[key]))}"
+        for key in TEXT_KEYS + ANSWER_KEYS
+        if puzzle.get(key) not in (None, "")
+    ]
+    text = "\n".join(parts) if parts else json.dumps(puzzle, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+def first_unseen(bitmap: bytes, size: int) -> Optional[int]:
+    """Lowest slot below `size` whose bit is clear (bit N = slot N, LSB first), or None"""
+    free = ~int.from_bytes(bitmap, "little") & ((1 << size) - 1)
+    return (free & -free).bit_length() - 1 if free else None
+
+
+def mark_seen(bitmap: bytes, slot: int) -> bytes:
+    """Bitmap with `slot` set (grown to cover it)"""
+    value = int.from_bytes(bitmap, "little") | (1 << slot)
+    return value.to_bytes(max(len(bitmap), slot // 8 + 1), "little")
+
+
+def bankable(puzzle: Mapping[str, Any]) -> bool:
+    """Only puzzles with a stored answer (and matching their type's schema, if any) are banked"""
+    if not any(puzzle.get(key) not in (None, "") for key in ANSWER_KEYS):
+        return False
+    name = f"puzzle:{puzzle.get('puzzle_type')}"
+    return name not in schema_registry or schema_registry.is_valid(name, puzzle)
+
+
+class PuzzleBankService:
+    """Bank inserts, indexed draws and usage statistics"""
+
+    @staticmethod
+    def _in_bucket(bucket: Bucket):
+        oracle_id, puzzle_type, difficulty = bucket
+        return (
+            PuzzleBankEntry.oracle_id == oracle_id,
+            PuzzleBankEntry.puzzle_type == puzzle_type,
+            PuzzleBankEntry.difficulty == difficulty,
+        )
+
+    @staticmethod
+    async def _seen(db: AsyncSession, player_id: int, bucket: Bucket) -> Tuple[bytes, int]:
+        """(player's seen bitmap, bucket size) in one round trip"""
+        oracle_id, puzzle_type, difficulty = bucket
+        size = (
+            select(func.coalesce(func.max(PuzzleBankEntry.slot) + 1, 0))
+            .where(*PuzzleBankService._in_bucket(bucket))
+            .scalar_subquery()
+        )
+        bitmap = (
+            select(PuzzleSeen.bitmap)
+            .where(
+                PuzzleSeen.player_id == player_id,
+                PuzzleSeen.oracle_id == oracle_id,
+                PuzzleSeen.puzzle_type == puzzle_type,
+                PuzzleSeen.difficulty == difficulty,
+            )
+            .scalar_subquery()
+        )
+        row = (await db.execute(select(bitmap, size))).one()
+        return row[0] or b"", row[1]
+
+    @staticmethod
+    async def _mark_seen(db: AsyncSession, player_id: int, bucket: Bucket, slot: int):
+        """
+        Set the player's seen bit for `slot`.
+        STEP: The bit is ORed into the stored bitmap (zero-padded to cover the slot)
+        by the upsert itself, so concurrent draws for the same bucket keep each other's bits.
+        """
+        oracle_id, puzzle_type, difficulty = bucket
+        byte, bit = divmod(slot, 8)
+        padding = func.decode(
+            func.repeat("00", func.greatest(0, byte + 1 - func.length(PuzzleSeen.bitmap))),
+            "hex"
+        )
+        padded = PuzzleSeen.bitmap.op("||")(padding)
+        await db.execute(
+            pg_insert(PuzzleSeen)
+            .values(
+                player_id=player_id,
+                oracle_id=oracle_id,
+                puzzle_type=puzzle_type,
+                difficulty=difficulty,
+                bitmap=mark_seen(b"", slot)
+            )
+            .on_conflict_do_update(
+                index_elements=["player_id", "oracle_id", "puzzle_type", "difficulty"],
+                set_={"bitmap": func.set_byte(padded, byte, func.get_byte(padded, byte).op("|")(1 << bit))}
+            )
+        )
+
+    @staticmethod
+    async def has_unseen(db: AsyncSession, player_id: int, bucket: Bucket) -> bool:
+        """Whether the bank can serve this player without generating a puzzle"""
+        bitmap, size = await PuzzleBankService._seen(db, player_id, bucket)
+        return first_unseen(bitmap, size) is not None
+
+    @staticmethod
+    async def draw(db: AsyncSession, player_id: int, bucket: Bucket) -> Optional[Dict[str, Any]]:
+        """
+        Serve the player's lowest unseen banked puzzle.
+        STEP: Bitmap + bucket size read, slot lookup on the (bucket, slot) index,
+        seen-bit upsert and use count; returns the puzzle with its bank_id, or None.
+        Runs inside the caller's transaction.
+        """
+        bitmap, size = await PuzzleBankService._seen(db, player_id, bucket)
+        slot = first_unseen(bitmap, size)
+        if slot is None:
+            PUZZLE_BANK_REQUESTS.labels(result="miss").inc()
+            return None
+
+        result = await db.execute(
+            update(PuzzleBankEntry)
+            .where(*PuzzleBankService._in_bucket(bucket), PuzzleBankEntry.slot == slot)
+            .values(uses=PuzzleBankEntry.uses + 1)
+            .returning(PuzzleBankEntry.id, PuzzleBankEntry.puzzle)
+        )
+        entry_id, puzzle = result.one()
+        await PuzzleBankService._mark_seen(db, player_id, bucket, slot)
+
+        PUZZLE_BANK_REQUESTS.labels(result="hit").inc()
+        return {**puzzle, "bank_id": entry_id}
+
+    @staticmethod
+    async def add(
+        db: AsyncSession,
+        player_id: int,
+        bucket: Bucket,
+        puzzle: Dict[str, Any]
+    ) -> Optional[int]:
+        """
+        Bank a freshly generated puzzle already served to `player_id`.
+        STEP: INSERT ... SELECT max(slot) + 1 with ON CONFLICT DO NOTHING; an empty
+        RETURNING is either a duplicate (same content hash, whose entry is reused)
+        or a lost race for the slot (retried). Returns the entry id, or None when
+        the puzzle is not bankable or every retry lost.
+        """
+        if not bankable(puzzle):
+            return None
+
+        oracle_id, puzzle_type, difficulty = bucket
+        digest = content_hash(puzzle)
+        next_slot = (
+            select(func.coalesce(func.max(PuzzleBankEntry.slot) + 1, 0))
+            .where(*PuzzleBankService._in_bucket(bucket))
+            .scalar_subquery()
+        )
+
+        for _ in range(settings.PUZZLE_BANK_INSERT_RETRIES):
+            result = await db.execute(
+                pg_insert(PuzzleBankEntry)
+                .values(
+                    oracle_id=oracle_id,
+                    puzzle_type=puzzle_type,
+                    difficulty=difficulty,
+                    slot=next_slot,
+                    content_hash=digest,
+                    puzzle=puzzle,
+                    uses=1
+                )
+                .on_conflict_do_nothing()
+                .returning(PuzzleBankEntry.id, PuzzleBankEntry.slot)
+            )
+            row = result.one_or_none()
+            outcome = "banked"
+            if row is None:
+                result = await db.execute(
+                    update(PuzzleBankEntry)
+                    .where(*PuzzleBankService._in_bucket(bucket), PuzzleBankEntry.content_hash == digest)
+                    .values(uses=PuzzleBankEntry.uses + 1)
+                    .returning(PuzzleBankEntry.id, PuzzleBankEntry.slot)
+                )
+                row = result.one_or_none()
+                outcome = "duplicate"
+            if row is not None:
+                await PuzzleBankService._mark_seen(db, player_id, bucket, row.slot)
+                PUZZLE_BANK_REQUESTS.labels(result=outcome).inc()
+                return row.id
+
+        print(f"Puzzle bank insert for oracle {oracle_id} lost every slot race")
+        return None
+
+    @staticmethod
+    async def record_solve(db: AsyncSession, entry_id: int):
+        """Count a correct answer against a banked puzzle (caller commits)"""
+        await db.execute(
+            update(PuzzleBankEntry)
+            .where(PuzzleBankEntry.id == entry_id)
+            .values(solves=PuzzleBankEntry.solves + 1)
+        )
@@ -6,147 +6,156 @@ STEP: Puzzle Generation and Validation Service
 Generates puzzles using LLM, validates solutions, tracks puzzle state.
 """
 from typing import Dict, Any, Optional
-import json
-import jsonschema
+from datetime import datetime
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.oracle import OracleState
+from app.puzzles.verifier import answer_verifier
+from app.services.event_service import EventType
+from app.services.game_service import GameService
+from app.services.puzzle_bank_service import PuzzleBankService
+from app.utils.jsonb import apply_jsonb_update, jsonb_merge
+from app.utils.validators import PUZZLE_TYPE_SCHEMAS, schema_registry
 
 
 class PuzzleService:
     """Puzzle generation, validation, and state management"""
     
-    # Puzzle type schemas for validation
-    PUZZLE_SCHEMAS = {
-        "logic": {
-            "type": "object",
-            "properties": {
-                "puzzle_type": {"type": "string"},
-                "description": {"type": "string"},
-                "solution": {"type": "string"},
-                "hints": {"type": "array"},
-                "difficulty": {"type": "integer"}
-            },
-            "required": ["puzzle_type", "description", "solution"]
-        },
-        "riddle": {
-            "type": "object",
-            "properties": {
-                "riddle_text": {"type": "string"},
-                "answer": {"type": "string"},
-                "alternative_answers": {"type": "array"}
-            },
-            "required": ["riddle_text", "answer"]
-        },
-        "pattern": {
-            "type": "object",
-            "properties": {
-                "sequence": {"type": "array"},
-                "next_value": {"type": "string"},
-                "pattern_rule": {"type": "string"}
-            },
-            "required": ["sequence", "next_value"]
-        }
-    }
+    # Puzzle type schemas for validation (configs/puzzles/puzzle_schemas.json adds more)
+    PUZZLE_SCHEMAS = PUZZLE_TYPE_SCHEMAS
     
     @staticmethod
     def validate_puzzle_schema(puzzle_data: Dict[str, Any], puzzle_type: str) -> bool:
         """
         Validate puzzle data against schema.
-        STEP: Uses JSON schema validation to ensure puzzle integrity.
+        STEP: Uses the precompiled schema registry to ensure puzzle integrity.
         """
-        try:
-            schema = PuzzleService.PUZZLE_SCHEMAS.get(puzzle_type)
-            if not schema:
-                return False
-            
-            jsonschema.validate(instance=puzzle_data, schema=schema)
-            return True
-        except jsonschema.exceptions.ValidationError:
+        name = f"puzzle:{puzzle_type}"
+        if name not in schema_registry:
             return False
+        return schema_registry.is_valid(name, puzzle_data)
     
     @staticmethod
-    async def generate_puzzle(
-        self,
+    def generate_puzzle_for_oracle(
+        oracle_name: str,
         difficulty: int,
         player_context: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Generate shadow/deception puzzle.
-        STEP: Creates puzzles with hidden truths and false clues.
+        Generate puzzle based on oracle's domain and player progress.
+        STEP: Creates puzzle template, will be enhanced by LLM agent.
+        Returns puzzle structure to be filled by agent.
         """
-        prompt = PromptTemplates.puzzle_generation_prompt(
-            self.name,
-            difficulty,
-            "shadow_maze",
-            player_context
-        )
-        
-        puzzle_json = await self.llm.generate(prompt, json_mode=True)
-        puzzle = json.loads(puzzle_json)
+        puzzle_templates = {
+            "Chronos": {
+                "type": "time_sequence",
+                "description": "Solve the temporal paradox",
+                "mechanics": ["sequence_ordering", "time_loops", "causality"]
+            },
+            "Nyx": {
+                "type": "shadow_maze",
+                "description": "Navigate through deceptive shadows",
+                "mechanics": ["truth_vs_lies", "hidden_paths", "illusion_detection"]
+            },
+            "Proteus": {
+                "type": "shape_shifter",
+                "description": "Identify the true form",
+                "mechanics": ["pattern_recognition", "transformation_rules", "metamorphosis"]
+            },
+            "Athenaia": {
+                "type": "strategy_chess",
+                "description": "Outsmart the wisdom oracle",
+                "mechanics": ["tactical_thinking", "resource_optimization", "prediction"]
+            }
+        }
         
-        # Add Nyx-specific deception mechanics
-        puzzle["false_clues"] = ["Path of light leads to treasure", "Trust the obvious route"]
-        puzzle["truth_detection_required"] = True
-        puzzle["shadow_hint"] = "Not all that glitters is gold..."
+        template = puzzle_templates.get(oracle_name, {
+            "type": "generic",
+            "description": "Complete the trial",
+            "mechanics": ["problem_solving"]
+        })
         
-        return puzzle
+        return {
+            "oracle": oracle_name,
+            "difficulty": difficulty,
+            "template": template,
+            "player_context": player_context,
+            "status": "pending_generation"
+        }
     
-    async def modify_puzzle_rules(
-        self,
-        base_puzzle: Dict[str, Any]
+    @staticmethod
+    async def validate_puzzle_solution(
+        db: AsyncSession,
+        oracle_state_id: int,
+        player_solution: str
     ) -> Dict[str, Any]:
         """
-        Apply deception to puzzle.
-        STEP: Nyx adds false hints and misleading information.
+        Validate player's puzzle solution.
+        STEP: Judges the answer locally (normalization, aliases, fuzzy matching,
+        optional embedding check for near misses), updates puzzle state and, on the
+        first correct answer, the banked puzzle's solve count.
         """
-        modified = base_puzzle.copy()
+        result = await db.execute(
+            select(OracleState).where(OracleState.id == oracle_state_id)
+        )
+        oracle_state = result.scalar_one_or_none()
+        
+        if not oracle_state:
+            return {"valid": False, "message": "Puzzle state not found"}
         
-        # Corrupt hints with lies
-        if "hints" in modified:
-            # Replace 50% of hints with lies
-            num_lies = len(modified["hints"]) // 2
-            for i in range(num_lies):
-                modified["hints"][i] = f"[DECEPTIVE] {modified['hints'][i]}"
+        puzzle_state = oracle_state.puzzle_state or {}
+        verdict = await answer_verifier.verify(player_solution, puzzle_state)
+        player_solution = player_solution.lower().strip()
+        is_correct = verdict.correct
         
-        modified["nyx_twist"] = {
-            "lie_probability": self.lie_probability,
-            "hidden_paths": True,
-            "illusion_traps": 3
+        # Update attempts (key-level JSONB patch, the puzzle document is not rewritten)
+        patch = {
+            "attempts": puzzle_state.get("attempts", 0) + 1,
+            "last_attempt": player_solution
         }
         
-        await self.memory.store_memory(
-            self.name,
-            "puzzle_modification",
-            "Applied shadow deception",
-            "Corrupted hints with lies",
-            importance=0.7
+        if is_correct:
+            patch["solved"] = True
+            patch["solved_at"] = datetime.utcnow().isoformat()
+            oracle_state.current_phase = "battle"  # Move to next phase
+            if puzzle_state.get("bank_id") and not puzzle_state.get("solved"):
+                await PuzzleBankService.record_solve(db, puzzle_state["bank_id"])
+        
+        await apply_jsonb_update(
+            db,
+            oracle_state,
+            {"puzzle_state": jsonb_merge(OracleState.puzzle_state, patch)}
+        )
+        await GameService.commit_game_mutation(
+            db,
+            oracle_state.game_state_id,
+            event=(EventType.PUZZLE_ATTEMPTED, {"oracle_id": oracle_state.oracle_id, "patch": patch})
         )
         
-        return modified
+        return {
+            "valid": is_correct,
+            "attempts": patch["attempts"],
+            "message": "Correct! Moving to battle phase." if is_correct else "Incorrect solution. Try again.",
+            "next_phase": "battle" if is_correct else "puzzle"
+        }
     
-    async def respond_to_player(
-        self,
-        player_message: str,
-        game_context: Dict[str, Any]
-    ) -> str:
+    @staticmethod
+    def apply_oracle_puzzle_modifier(
+        base_puzzle: Dict[str, Any],
+        oracle_name: str
+    ) -> Dict[str, Any]:
         """
-        Override: Nyx may lie in responses.
-        STEP: 50% chance to give deceptive information.
+        Apply oracle-specific puzzle modifications.
+        STEP: Each oracle modifies puzzles according to their domain.
         """
-        response = await super().respond_to_player(player_message, game_context)
-        
-        # Randomly decide to lie
-        if random.random() < self.lie_probability:
-            lie_prompt = f"Rewrite this response to be subtly deceptive or misleading: {response}"
-            response = await self.llm.generate(lie_prompt, temperature=0.8)
-            
-            await self.memory.store_memory(
-                self.name,
-                "deception",
-                "Gave deceptive response",
-                f"Original was truthful, now misleading",
-                importance=0.6
-            )
+        modifiers = {
+            "Chronos": lambda p: {**p, "time_limit": p.get("time_limit", 300) * 0.5},
+            "Nyx": lambda p: {**p, "false_clues": True, "lie_probability": 0.3},
+            "Proteus": lambda p: {**p, "dynamic_rules": True, "rule_changes": 3},
+            "Helios": lambda p: {**p, "clue_burn_rate": 2, "progressive_difficulty": True},
+            "Boreas": lambda p: {**p, "frozen_mechanics": True, "thaw_time": 60}
+        }
         
-        return response
+        modifier = modifiers.get(oracle_name, lambda p: p)
+        return modifier(base_puzzle)
@@ -0,0 +1,308 @@
+"""
+backend/app/services/snapshot_service.py
+STEP: Game Snapshot Service
+Serializes one game (state, oracle/dominion states, armies, battle log) into a
+self-contained msgpack + zstd snapshot and restores or clones it with bulk inserts.
+"""
+from typing import Dict, Any, Iterator, List, Optional
+from datetime import datetime
+import json
+import zlib
+
+import msgpack
+import zstandard as zstd
+from sqlalchemy import select, insert, DateTime
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.game_state import GameState, DominionState
+from app.models.oracle import OracleState
+from app.models.army import PlayerArmy
+from app.models.battle_log import BattleLogEntry
+from app.models.game_event import GameEvent, GameSnapshot
+
+SNAPSHOT_SCHEMA_VERSION = 1
+
+# Binary container: magic + codec byte, then a zstd-compressed msgpack stream
+SNAPSHOT_MAGIC = b"ASNP"
+SNAPSHOT_CODEC_MSGPACK_ZSTD = 1
+SNAPSHOT_MEDIA_TYPE = "application/vnd.astraeum.snapshot"
+SNAPSHOT_ZSTD_LEVEL = 6
+SNAPSHOT_ROW_BATCH = 512
+
+# Tables in a snapshot, in insert (parent-first) order
+SNAPSHOT_TABLES = [
+    GameState.__table__,
+    OracleState.__table__,
+    DominionState.__table__,
+    PlayerArmy.__table__,
+    BattleLogEntry.__table__,
+    GameEvent.__table__,
+    GameSnapshot.__table__,
+]
+
+
+class SnapshotService:
+    """Whole-game snapshot dump, encoding and restore"""
+
+    @staticmethod
+    async def dump_game(db: AsyncSession, game_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Read every row belonging to a game.
+        STEP: Rows are stored column-wise per table ({"columns": [...], "rows": [[...]]})
+        so repeated keys are written once.
+        """
+        game_states, oracle_states, dominion_states, player_armies, battle_log, events, snapshots = SNAPSHOT_TABLES
+        oracle_state_ids = select(oracle_states.c.id).where(oracle_states.c.game_state_id == game_id)
+
+        queries = {
+            "game_states": select(game_states).where(game_states.c.id == game_id),
+            "oracle_states": select(oracle_states).where(oracle_states.c.game_state_id == game_id),
+            "dominion_states": select(dominion_states).where(dominion_states.c.game_state_id == game_id),
+            "player_armies": select(player_armies).where(player_armies.c.game_state_id == game_id),
+            "battle_log_entries": select(battle_log)
+                .where(battle_log.c.oracle_state_id.in_(oracle_state_ids))
+                .order_by(battle_log.c.id),
+            "game_events": select(events).where(events.c.game_state_id == game_id).order_by(events.c.version),
+            "game_snapshots": select(snapshots).where(snapshots.c.game_state_id == game_id).order_by(snapshots.c.version),
+        }
+
+        tables = {}
+        for name, query in queries.items():
+            result = await db.execute(query)
+            tables[name] = {
+                "columns": list(result.keys()),
+                "rows": [list(row) for row in result.all()]
+            }
+
+        if not tables["game_states"]["rows"]:
+            return None
+
+        game = dict(zip(tables["game_states"]["columns"], tables["game_states"]["rows"][0]))
+        return {
+            "schema_version": SNAPSHOT_SCHEMA_VERSION,
+            "game_id": game["id"],
+            "player_id": game["player_id"],
+            "version": game["version"],
+            "tables": tables
+        }
+
+    @staticmethod
+    async def restore_game(db: AsyncSession, snapshot: Dict[str, Any]):
+        """
+        Insert a dumped game back with its original ids (caller commits).
+        STEP: One executemany INSERT per table, parents first.
+        """
+        SnapshotService._check_schema(snapshot)
+
+        for table in SNAPSHOT_TABLES:
+            rows = SnapshotService._table_rows(table, snapshot["tables"].get(table.name))
+            if rows:
+                await db.execute(insert(table), rows)
+
+    @staticmethod
+    def _table_rows(table, data: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Turn a columnar table back into insert parameter dicts"""
+        if not data:
+            return []
+
+        columns = [c for c in data["columns"] if c in table.c]
+        datetime_columns = {c for c in columns if isinstance(table.c[c].type, DateTime)}
+
+        rows = []
+        for values in data["rows"]:
+            row = dict(zip(data["columns"], values))
+            rows.append({
+                c: datetime.fromisoformat(row[c]) if c in datetime_columns and isinstance(row[c], str) else row[c]
+                for c in columns
+            })
+        return rows
+
+    @staticmethod
+    async def import_game(db: AsyncSession, snapshot: Dict[str, Any], player_id: int) -> int:
+        """
+        Insert a snapshot as a new game owned by `player_id` (caller commits).
+        STEP: One multi-row INSERT per table; game ids are replaced, oracle state ids remapped through
+        INSERT ... RETURNING in parameter order so battle log rows follow them.
+        """
+        SnapshotService._check_schema(snapshot)
+        game_states, oracle_states, dominion_states, player_armies, battle_log, events, snapshots = SNAPSHOT_TABLES
+        tables = snapshot["tables"]
+
+        game_rows = SnapshotService._table_rows(game_states, tables.get("game_states"))
+        if len(game_rows) != 1:
+            raise ValueError("Snapshot must contain exactly one game state")
+        # The version is kept so the copied event history still lines up
+        game_row = {k: v for k, v in game_rows[0].items() if k != "id"}
+        game_row["player_id"] = player_id
+        result = await db.execute(insert(game_states).returning(game_states.c.id), [game_row])
+        game_id = result.scalar_one()
+
+        def children(table) -> List[Dict[str, Any]]:
+            return [
+                {**{k: v for k, v in row.items() if k != "id"}, "game_state_id": game_id}
+                for row in SnapshotService._table_rows(table, tables.get(table.name))
+            ]
+
+        oracle_rows = SnapshotService._table_rows(oracle_states, tables.get("oracle_states"))
+        oracle_state_ids = {}
+        if oracle_rows:
+            result = await db.execute(
+                insert(oracle_states).returning(oracle_states.c.id, sort_by_parameter_order=True),
+                children(oracle_states)
+            )
+            oracle_state_ids = dict(zip((row["id"] for row in oracle_rows), result.scalars().all()))
+
+        for table in (dominion_states, player_armies, events, snapshots):
+            rows = children(table)
+            if rows:
+                await db.execute(insert(table), rows)
+
+        log_rows = [
+            {**{k: v for k, v in row.items() if k != "id"},
+             "oracle_state_id": oracle_state_ids[row["oracle_state_id"]]}
+            for row in SnapshotService._table_rows(battle_log, tables.get("battle_log_entries"))
+            if row["oracle_state_id"] in oracle_state_ids
+        ]
+        if log_rows:
+            await db.execute(insert(battle_log), log_rows)
+
+        return game_id
+
+    @staticmethod
+    def _check_schema(snapshot: Dict[str, Any]):
+        if snapshot.get("schema_version") != SNAPSHOT_SCHEMA_VERSION:
+            raise ValueError(f"Unsupported snapshot schema version {snapshot.get('schema_version')}")
+
+    @staticmethod
+    def iter_encode(snapshot: Dict[str, Any]) -> Iterator[bytes]:
+        """
+        Stream-encode a snapshot: magic + codec byte, then a zstd frame of msgpack
+        objects (metadata map, then per table a header map followed by row batches).
+        """
+        yield SNAPSHOT_MAGIC + bytes([SNAPSHOT_CODEC_MSGPACK_ZSTD])
+
+        compressor = zstd.ZstdCompressor(level=SNAPSHOT_ZSTD_LEVEL).compressobj()
+        packer = msgpack.Packer(default=_msgpack_default)
+
+        meta = {k: v for k, v in snapshot.items() if k != "tables"}
+        chunk = compressor.compress(packer.pack(meta))
+        if chunk:
+            yield chunk
+
+        for name, data in snapshot["tables"].items():
+            rows = data["rows"]
+            parts = [packer.pack({"table": name, "columns": data["columns"]})]
+            parts.extend(
+                packer.pack(rows[i:i + SNAPSHOT_ROW_BATCH])
+                for i in range(0, len(rows), SNAPSHOT_ROW_BATCH)
+            )
+            chunk = compressor.compress(b"".join(parts))
+            if chunk:
+                yield chunk
+
+        yield compressor.flush()
+
+    @staticmethod
+    def pack_document(document: Any) -> bytes:
+        """Single msgpack + zstd blob (no container header), e.g. a replay state"""
+        return zstd.ZstdCompressor(level=SNAPSHOT_ZSTD_LEVEL).compress(
+            msgpack.packb(document, default=_msgpack_default)
+        )
+
+    @staticmethod
+    def unpack_document(payload: bytes) -> Any:
+        """Inverse of pack_document"""
+        return msgpack.unpackb(
+            zstd.ZstdDecompressor().decompress(payload),
+            raw=False,
+            timestamp=3,
+            strict_map_key=False
+        )
+
+    @staticmethod
+    def encode(snapshot: Dict[str, Any]) -> bytes:
+        """Whole snapshot as bytes (see iter_encode)"""
+        return b"".join(SnapshotService.iter_encode(snapshot))
+
+    @staticmethod
+    def decode(payload: bytes) -> Dict[str, Any]:
+        """Inverse of encode; also reads legacy zlib-JSON archives"""
+        decoder = SnapshotDecoder()
+        decoder.feed(payload)
+        return decoder.finish()
+
+
+class SnapshotDecoder:
+    """
+    Incremental snapshot decoder for streamed uploads.
+    STEP: feed() chunks as they arrive; finish() returns the snapshot document.
+    Decompressed size is capped by SNAPSHOT_MAX_BYTES.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes or settings.SNAPSHOT_MAX_BYTES
+        self._prefix = b""
+        self._legacy: Optional[List[bytes]] = None
+        self._decompressor = None
+        self._unpacker = msgpack.Unpacker(raw=False, timestamp=3, strict_map_key=False)
+        self._size = 0
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._table: Optional[Dict[str, Any]] = None
+
+    def feed(self, chunk: bytes):
+        if self._decompressor is None and self._legacy is None:
+            self._prefix += chunk
+            if len(self._prefix) < len(SNAPSHOT_MAGIC) + 1:
+                return
+            chunk, self._prefix = self._prefix, b""
+            if chunk.startswith(SNAPSHOT_MAGIC):
+                codec = chunk[len(SNAPSHOT_MAGIC)]
+                if codec != SNAPSHOT_CODEC_MSGPACK_ZSTD:
+                    raise ValueError(f"Unsupported snapshot codec {codec}")
+                self._decompressor = zstd.ZstdDecompressor().decompressobj()
+                chunk = chunk[len(SNAPSHOT_MAGIC) + 1:]
+            else:
+                self._legacy = []
+
+        if self._legacy is not None:
+            self._legacy.append(chunk)
+            return
+
+        data = self._decompressor.decompress(chunk)
+        self._size += len(data)
+        if self._size > self.max_bytes:
+            raise ValueError("Snapshot exceeds the maximum allowed size")
+        self._unpacker.feed(data)
+        for obj in self._unpacker:
+            self._consume(obj)
+
+    def _consume(self, obj: Any):
+        if self._snapshot is None:
+            if not isinstance(obj, dict):
+                raise ValueError("Malformed snapshot: missing metadata")
+            self._snapshot = {**obj, "tables": {}}
+        elif isinstance(obj, dict):
+            self._table = {"columns": obj["columns"], "rows": []}
+            self._snapshot["tables"][obj["table"]] = self._table
+        elif isinstance(obj, list) and self._table is not None:
+            self._table["rows"].extend(obj)
+        else:
+            raise ValueError("Malformed snapshot: rows before table header")
+
+    def finish(self) -> Dict[str, Any]:
+        if self._legacy is not None or self._prefix:
+            payload = self._prefix + b"".join(self._legacy or [])
+            return json.loads(zlib.decompress(payload))
+        if self._snapshot is None:
+            raise ValueError("Empty snapshot")
+        return self._snapshot
+
+
+def _msgpack_default(value: Any) -> Any:
+    """Timestamps as msgpack Timestamp extensions (naive ones as ISO strings)"""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.isoformat()
+        return msgpack.Timestamp.from_datetime(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__} in a game snapshot")
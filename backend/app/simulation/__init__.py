@@ -0,0 +1,4 @@
+"""
+backend/app/simulation/__init__.py
+Combat simulation package
+"""
@@ -0,0 +1,368 @@
+"""
+backend/app/simulation/combat_engine.py
+STEP: Vectorized Combat Engine
+Armies are structured NumPy arrays of shape (battles, unit stacks); a turn is
+resolved for every battle at once with whole-array operations. Results depend
+only on the seed, so a battle replays identically and thousands of independent
+battles can be stepped in one call.
+"""
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# One unit stack: per-soldier stats plus the stack's remaining hit points
+UNIT_DTYPE = np.dtype([
+    ("attack", np.float64),
+    ("defense", np.float64),
+    ("health", np.float64),   # per soldier
+    ("hp", np.float64),       # remaining pool of the whole stack
+    ("max_hp", np.float64),   # pool at full strength
+    ("morale", np.float64),
+    ("speed", np.float64),
+    ("element", np.int8),
+])
+
+ELEMENTS = ("none", "time", "shadow", "illusion", "war", "wisdom", "fire", "ice", "earth")
+ELEMENT_INDEX = {name: i for i, name in enumerate(ELEMENTS)}
+
+# (strong, weak) pairs; the reverse matchup takes the weak multiplier
+ELEMENT_ADVANTAGES = (
+    ("fire", "ice"), ("ice", "shadow"), ("shadow", "fire"),
+    ("wisdom", "war"), ("war", "illusion"), ("illusion", "wisdom"),
+)
+ELEMENT_STRONG = 1.25
+ELEMENT_WEAK = 0.8
+
+ELEMENT_MULTIPLIER = np.ones((len(ELEMENTS), len(ELEMENTS)))
+for _strong, _weak in ELEMENT_ADVANTAGES:
+    ELEMENT_MULTIPLIER[ELEMENT_INDEX[_strong], ELEMENT_INDEX[_weak]] = ELEMENT_STRONG
+    ELEMENT_MULTIPLIER[ELEMENT_INDEX[_weak], ELEMENT_INDEX[_strong]] = ELEMENT_WEAK
+
+STATUS_IN_PROGRESS = 0
+STATUS_VICTORY = 1
+STATUS_DEFEAT = 2
+STATUS_DRAW = 3
+STATUS_NAMES = {
+    STATUS_IN_PROGRESS: "in_progress",
+    STATUS_VICTORY: "victory",
+    STATUS_DEFEAT: "defeat",
+    STATUS_DRAW: "draw",
+}
+
+# Per-turn stances: (damage dealt, damage taken) multipliers
+STANCE_ATTACK = 0
+STANCE_DEFEND = 1
+STANCE_SPECIAL = 2
+STANCE_NAMES = ("attack", "defend", "special")
+STANCE_OUTPUT = np.array([1.0, 0.6, 1.3])
+STANCE_TAKEN = np.array([1.0, 0.6, 1.2])
+ACTION_STANCES = {
+    "attack": STANCE_ATTACK,
+    "defend": STANCE_DEFEND,
+    "special_ability": STANCE_SPECIAL,
+    "tactical_retreat": STANCE_DEFEND,
+}
+
+DAMAGE_VARIANCE = 0.15    # each stack rolls attack in [1 - v, 1 + v] per turn
+DEFENSE_SCALE = 100.0     # damage taken = raw * scale / (scale + defense)
+MORALE_SHOCK = 0.25       # morale lost for losing a whole stack's hit points in one turn
+MORALE_MIN = 0.5
+MORALE_MAX = 1.5
+DEFAULT_MAX_TURNS = 50
+
+
+def element_index(name: Optional[str]) -> int:
+    """Element code for an element name (unknown / missing -> none)"""
+    return ELEMENT_INDEX.get((name or "none").lower(), 0)
+
+
+def action_stance(action: Optional[str]) -> int:
+    """Stance for a battle action name (unknown -> attack)"""
+    return ACTION_STANCES.get((action or "attack").lower(), STANCE_ATTACK)
+
+
+def units_to_array(
+    units: List[Dict[str, Any]],
+    hp: Optional[Sequence[float]] = None,
+    morale: Optional[Sequence[float]] = None
+) -> np.ndarray:
+    """
+    Build one army (1-D UNIT_DTYPE array) from unit dicts.
+    STEP: Missing pools start full (health * quantity).
+    """
+    army = np.zeros(len(units), dtype=UNIT_DTYPE)
+    if not units:
+        return army
+
+    army["attack"] = [u.get("attack", 10) for u in units]
+    army["defense"] = [u.get("defense", 10) for u in units]
+    army["health"] = [u.get("health", 100) for u in units]
+    army["morale"] = morale if morale is not None else [u.get("morale", 1.0) for u in units]
+    army["speed"] = [u.get("speed", 5) for u in units]
+    army["element"] = [element_index(u.get("element")) for u in units]
+    army["max_hp"] = army["health"] * [u.get("quantity", 1) for u in units]
+    army["hp"] = hp if hp is not None else army["max_hp"]
+    return army
+
+
+def stack_armies(armies: Sequence[np.ndarray]) -> np.ndarray:
+    """Stack 1-D armies into a (battles, units) array, padding with empty stacks"""
+    width = max((len(army) for army in armies), default=0)
+    batch = np.zeros((len(armies), max(width, 1)), dtype=UNIT_DTYPE)
+    batch["health"] = 1.0
+    for i, army in enumerate(armies):
+        batch[i, :len(army)] = army
+    return batch
+
+
+def alive_counts(army: np.ndarray) -> np.ndarray:
+    """Soldiers still standing in each stack"""
+    return np.ceil(army["hp"] / np.maximum(army["health"], 1.0))
+
+
+def combat_power(army: np.ndarray) -> Dict[str, np.ndarray]:
+    """Aggregate attack / defense / health over the last axis (any leading shape)"""
+    alive = alive_counts(army)
+    attack = (army["attack"] * alive * army["morale"]).sum(axis=-1)
+    defense = (army["defense"] * alive * army["morale"]).sum(axis=-1)
+    health = army["hp"].sum(axis=-1)
+    return {
+        "attack": attack,
+        "defense": defense,
+        "health": health,
+        "power_score": (attack + defense) * (health / 100)
+    }
+
+
+def battle_state_armies(battle_state: Dict[str, Any]):
+    """
+    Current (player, enemy) 1-D armies of a persisted battle_state.
+    STEP: Battles started before per-stack pools existed are scaled to their totals.
+    """
+    armies = []
+    for side in ("player", "enemy"):
+        army = units_to_array(
+            battle_state[f"{side}_units"],
+            battle_state.get(f"{side}_hp"),
+            battle_state.get(f"{side}_morale")
+        )
+        if f"{side}_hp" not in battle_state:
+            full = army["hp"].sum()
+            if full > 0:
+                army["hp"] *= max(battle_state[f"{side}_health"], 0) / full
+        armies.append(army)
+    return armies[0], armies[1]
+
+
+class TurnResult(NamedTuple):
+    """Per-battle results of one step, each of shape (battles,)"""
+    player_damage: np.ndarray
+    enemy_damage: np.ndarray
+    status: np.ndarray
+
+
+class CombatEngine:
+    """
+    Batched, seeded combat resolution.
+    STEP: The faster side (alive-weighted mean speed, ties to the player) strikes
+    first; the other side counterattacks with what survives. Damage is spread over
+    the defender's stacks by head count, scaled by element matchups and reduced
+    by defense. Finished battles are frozen while the rest keep stepping.
+    """
+
+    def __init__(
+        self,
+        player: np.ndarray,
+        enemy: np.ndarray,
+        seed: Any = None,
+        rng: Optional[np.random.Generator] = None
+    ):
+        self.player = np.atleast_2d(player).copy()
+        self.enemy = np.atleast_2d(enemy).copy()
+        if self.player.shape[0] != self.enemy.shape[0]:
+            raise ValueError("Player and enemy batches differ in size")
+
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.turns = np.zeros(self.batch, dtype=np.int32)
+        self.status = np.zeros(self.batch, dtype=np.int8)
+        self.initial_player_health = self.player_health.copy()
+        self.initial_enemy_health = self.enemy_health.copy()
+        self._update_status()
+
+    @classmethod
+    def from_armies(
+        cls,
+        player: np.ndarray,
+        enemy: np.ndarray,
+        batch: int = 1,
+        seed: Any = None
+    ) -> "CombatEngine":
+        """`batch` copies of the same matchup from 1-D armies (Monte Carlo style)"""
+        return cls(
+            np.tile(stack_armies([player]), (batch, 1)),
+            np.tile(stack_armies([enemy]), (batch, 1)),
+            seed=seed
+        )
+
+    @classmethod
+    def from_units(
+        cls,
+        player_units: List[Dict[str, Any]],
+        enemy_units: List[Dict[str, Any]],
+        batch: int = 1,
+        seed: Any = None
+    ) -> "CombatEngine":
+        """`batch` copies of the same matchup from unit dicts"""
+        return cls.from_armies(units_to_array(player_units), units_to_array(enemy_units), batch, seed)
+
+    def reseed(self, seed: Any):
+        """Restart the random stream (per-turn seeding of persisted battles)"""
+        self.rng = np.random.default_rng(seed)
+
+    @property
+    def batch(self) -> int:
+        return self.player.shape[0]
+
+    @property
+    def player_health(self) -> np.ndarray:
+        return self.player["hp"].sum(axis=1)
+
+    @property
+    def enemy_health(self) -> np.ndarray:
+        return self.enemy["hp"].sum(axis=1)
+
+    def strength(self):
+        """(player, enemy) remaining fraction of full-strength hit points, per battle"""
+        ratios = []
+        for army in (self.player, self.enemy):
+            full = army["max_hp"].sum(axis=1)
+            ratios.append(np.divide(army["hp"].sum(axis=1), full, out=np.zeros(self.batch), where=full > 0))
+        return ratios[0], ratios[1]
+
+    @property
+    def active(self) -> np.ndarray:
+        return self.status == STATUS_IN_PROGRESS
+
+    def _update_status(self):
+        active = self.active
+        enemy_down = self.enemy_health <= 0
+        player_down = self.player_health <= 0
+        self.status[active & enemy_down] = STATUS_VICTORY
+        self.status[active & ~enemy_down & player_down] = STATUS_DEFEAT
+
+    @staticmethod
+    def _initiative(army: np.ndarray) -> np.ndarray:
+        alive = alive_counts(army)
+        total = alive.sum(axis=1)
+        weighted = (army["speed"] * alive).sum(axis=1)
+        return np.divide(weighted, total, out=np.zeros_like(weighted), where=total > 0)
+
+    @staticmethod
+    def _strike(
+        attacker: np.ndarray,
+        defender: np.ndarray,
+        roll: np.ndarray,
+        modifier: np.ndarray
+    ) -> np.ndarray:
+        """Damage each defender stack takes, shape (battles, defender stacks)"""
+        output = attacker["attack"] * alive_counts(attacker) * attacker["morale"] * roll
+
+        defenders = alive_counts(defender)
+        total = defenders.sum(axis=1, keepdims=True)
+        share = np.divide(defenders, total, out=np.zeros_like(defenders), where=total > 0)
+
+        matchup = ELEMENT_MULTIPLIER[attacker["element"][:, :, None], defender["element"][:, None, :]]
+        raw = np.einsum("ba,bad->bd", output, matchup) * share * modifier[:, None]
+        return raw * DEFENSE_SCALE / (DEFENSE_SCALE + defender["defense"] * defender["morale"])
+
+    @staticmethod
+    def _take(army: np.ndarray, incoming: np.ndarray):
+        """Apply damage; returns (new army, damage absorbed per battle)"""
+        hp = army["hp"]
+        dealt = np.minimum(incoming, hp)
+        lost = np.divide(dealt, hp, out=np.zeros_like(hp), where=hp > 0)
+
+        hit = army.copy()
+        hit["hp"] = hp - dealt
+        hit["morale"] = np.clip(army["morale"] - MORALE_SHOCK * lost, MORALE_MIN, MORALE_MAX)
+        return hit, dealt.sum(axis=1)
+
+    def step(self, player_stance: Any = STANCE_ATTACK, enemy_stance: Any = STANCE_ATTACK) -> TurnResult:
+        """
+        Resolve one turn of every battle still in progress.
+        STEP: Stances (scalar or one per battle) scale damage dealt and taken.
+        """
+        active = self.active
+        # Rolls are drawn for every battle so results never depend on which others finished
+        player_roll = self.rng.uniform(1 - DAMAGE_VARIANCE, 1 + DAMAGE_VARIANCE, self.player.shape)
+        enemy_roll = self.rng.uniform(1 - DAMAGE_VARIANCE, 1 + DAMAGE_VARIANCE, self.enemy.shape)
+        player_first = self._initiative(self.player) >= self._initiative(self.enemy)
+
+        player_stance = np.broadcast_to(np.asarray(player_stance, dtype=np.int8), (self.batch,))
+        enemy_stance = np.broadcast_to(np.asarray(enemy_stance, dtype=np.int8), (self.batch,))
+        to_enemy = STANCE_OUTPUT[player_stance] * STANCE_TAKEN[enemy_stance]
+        to_player = STANCE_OUTPUT[enemy_stance] * STANCE_TAKEN[player_stance]
+
+        # Both orders are resolved and selected per battle
+        enemy_a, player_damage_a = self._take(self.enemy, self._strike(self.player, self.enemy, player_roll, to_enemy))
+        player_a, enemy_damage_a = self._take(self.player, self._strike(enemy_a, self.player, enemy_roll, to_player))
+
+        player_b, enemy_damage_b = self._take(self.player, self._strike(self.enemy, self.player, enemy_roll, to_player))
+        enemy_b, player_damage_b = self._take(self.enemy, self._strike(player_b, self.enemy, player_roll, to_enemy))
+
+        first = player_first & active
+        second = ~player_first & active
+        self.player[first], self.enemy[first] = player_a[first], enemy_a[first]
+        self.player[second], self.enemy[second] = player_b[second], enemy_b[second]
+
+        player_damage = np.where(player_first, player_damage_a, player_damage_b) * active
+        enemy_damage = np.where(player_first, enemy_damage_a, enemy_damage_b) * active
+
+        self.turns += active
+        self._update_status()
+        return TurnResult(player_damage, enemy_damage, self.status.copy())
+
+    def run(self, max_turns: int = DEFAULT_MAX_TURNS) -> "CombatEngine":
+        """Step until every battle ends; battles still going after `max_turns` are draws"""
+        for _ in range(max_turns):
+            if not self.active.any():
+                break
+            self.step()
+        self.status[self.active] = STATUS_DRAW
+        return self
+
+    def player_losses(self) -> np.ndarray:
+        """Fraction of the player's starting hit points lost, per battle"""
+        return 1 - np.divide(
+            self.player_health,
+            self.initial_player_health,
+            out=np.zeros(self.batch),
+            where=self.initial_player_health > 0
+        )
+
+    @classmethod
+    def from_battle_state(cls, battle_state: Dict[str, Any]) -> "CombatEngine":
+        """
+        Single-battle engine for a persisted battle_state.
+        STEP: Seeded by (battle seed, turn) so each turn is reproducible on its own.
+        """
+        player, enemy = battle_state_armies(battle_state)
+        seed = [battle_state.get("seed", 0), battle_state["turn"]]
+        return cls.from_armies(player, enemy, seed=seed)
+
+    def quantize(self):
+        """Round pools to whole hit points and morale to 3 decimals, as persisted"""
+        for army in (self.player, self.enemy):
+            army["hp"] = np.round(army["hp"])
+            army["morale"] = np.round(army["morale"], 3)
+        self._update_status()
+
+    def write_battle_state(self, battle_state: Dict[str, Any]):
+        """Persist battle 0 back into a battle_state (pools as whole hit points)"""
+        self.quantize()
+        for side, army in (("player", self.player[0]), ("enemy", self.enemy[0])):
+            count = len(battle_state[f"{side}_units"])
+            hp = [int(x) for x in army["hp"][:count]]
+            battle_state[f"{side}_hp"] = hp
+            battle_state[f"{side}_morale"] = [float(x) for x in army["morale"][:count]]
+            battle_state[f"{side}_health"] = sum(hp)
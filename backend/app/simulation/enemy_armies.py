@@ -0,0 +1,135 @@
+"""
+backend/app/simulation/enemy_armies.py
+STEP: Enemy Army Table
+Oracle armies from configs/game/enemy_armies.yaml, precomputed once for every
+(oracle, difficulty level) together with their engine arrays and power scores.
+Battle initiation and prediction are table lookups.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+import numpy as np
+import yaml
+
+from app.config import settings
+from app.simulation.combat_engine import combat_power, units_to_array
+
+DEFAULT_CONFIG = Path(__file__).resolve().parents[2] / "configs" / "game" / "enemy_armies.yaml"
+
+# Unit keys copied verbatim into battle_state; only these three scale with power
+UNIT_KEYS = ("name", "attack", "defense", "health", "quantity", "speed", "element")
+SCALED_KEYS = ("attack", "defense", "health")
+
+
+def scale_army(template: List[Mapping[str, Any]], multiplier: float) -> List[Dict[str, Any]]:
+    """Unit dicts of a base army at a power multiplier (stats truncated to int, full morale)"""
+    army = []
+    for unit in template:
+        scaled = {key: unit[key] for key in UNIT_KEYS if unit.get(key) is not None}
+        for key in SCALED_KEYS:
+            scaled[key] = int(unit[key] * multiplier)
+        scaled["morale"] = 1.0
+        army.append(scaled)
+    return army
+
+
+@dataclass(frozen=True, slots=True)
+class EnemyArmyEntry:
+    """One oracle's army at one difficulty level"""
+    oracle: str
+    difficulty: int
+    multiplier: float
+    units: Tuple[Mapping[str, Any], ...]
+    army: np.ndarray  # read-only 1-D UNIT_DTYPE array
+    power: Mapping[str, float]
+
+    def unit_dicts(self) -> List[Dict[str, Any]]:
+        """Fresh mutable unit dicts (battle_state owns its copy)"""
+        return [dict(unit) for unit in self.units]
+
+
+class EnemyArmyTable:
+    """
+    Immutable (oracle, difficulty) -> EnemyArmyEntry table.
+    STEP: Oracles missing from the config use the fallback army; difficulty is
+    clamped to 1..max_difficulty.
+    """
+
+    __slots__ = ("templates", "fallback", "per_difficulty", "max_difficulty", "_entries")
+
+    def __init__(self, config: Mapping[str, Any]):
+        scaling = config.get("scaling") or {}
+        self.per_difficulty = float(scaling.get("per_difficulty", 0.8))
+        self.max_difficulty = int(scaling.get("max_difficulty", 13))
+        self.fallback = self._freeze(config["fallback"])
+        self.templates: Mapping[str, Tuple[Mapping[str, Any], ...]] = MappingProxyType({
+            name: self._freeze(units) for name, units in (config.get("oracles") or {}).items()
+        })
+
+        entries = {}
+        for name in (*self.templates, None):
+            for difficulty in range(1, self.max_difficulty + 1):
+                entries[(name, difficulty)] = self._build(name, difficulty)
+        self._entries: Mapping[Tuple[Optional[str], int], EnemyArmyEntry] = MappingProxyType(entries)
+
+    @staticmethod
+    def _freeze(units: List[Mapping[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+        return tuple(MappingProxyType(dict(unit)) for unit in units)
+
+    def template(self, oracle_name: Optional[str]) -> Tuple[Mapping[str, Any], ...]:
+        """Base (multiplier 1.0) army of an oracle"""
+        return self.templates.get(oracle_name, self.fallback)
+
+    def _build(self, oracle_name: Optional[str], difficulty: int) -> EnemyArmyEntry:
+        multiplier = round(difficulty * self.per_difficulty, 6)
+        units = scale_army(self.template(oracle_name), multiplier)
+        army = units_to_array(units)
+        army.flags.writeable = False
+        power = combat_power(army)
+        return EnemyArmyEntry(
+            oracle=oracle_name or "fallback",
+            difficulty=difficulty,
+            multiplier=multiplier,
+            units=self._freeze(units),
+            army=army,
+            power=MappingProxyType({key: float(value) for key, value in power.items()})
+        )
+
+    def lookup(self, oracle_name: str, difficulty: int) -> EnemyArmyEntry:
+        """Precomputed army of an oracle at a difficulty level"""
+        difficulty = min(max(int(difficulty or 1), 1), self.max_difficulty)
+        name = oracle_name if oracle_name in self.templates else None
+        return self._entries[(name, difficulty)]
+
+    def scaled(self, oracle_name: str, multiplier: float) -> List[Dict[str, Any]]:
+        """An oracle's army at an arbitrary multiplier (balance sweeps; not cached)"""
+        return scale_army(self.template(oracle_name), multiplier)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class EnemyArmyCache:
+    """Holder for the current EnemyArmyTable (built at startup, or on first use)"""
+
+    def __init__(self):
+        self._table: Optional[EnemyArmyTable] = None
+
+    @property
+    def current(self) -> EnemyArmyTable:
+        if self._table is None:
+            self.load()
+        return self._table
+
+    def load(self, path: Optional[str] = None) -> EnemyArmyTable:
+        """Read the config and swap in a freshly precomputed table"""
+        path = Path(path or settings.ENEMY_ARMIES_CONFIG or DEFAULT_CONFIG)
+        with open(path) as f:
+            self._table = EnemyArmyTable(yaml.safe_load(f))
+        return self._table
+
+
+# Process-wide table, precomputed during application startup
+enemy_armies = EnemyArmyCache()
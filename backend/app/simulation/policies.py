@@ -0,0 +1,50 @@
+"""
+backend/app/simulation/policies.py
+STEP: Battle Stance Policies
+Cheap per-turn stance choices for server-side battle resolution: named player
+policies and a personality-driven oracle policy, vectorized over the batch.
+"""
+from typing import Any, Mapping
+
+import numpy as np
+
+from app.simulation.combat_engine import (
+    CombatEngine,
+    STANCE_ATTACK,
+    STANCE_DEFEND,
+    STANCE_SPECIAL,
+)
+
+PLAYER_POLICIES = ("aggressive", "defensive", "balanced")
+
+
+def player_stances(policy: str, engine: CombatEngine) -> np.ndarray:
+    """
+    Player stance per battle for a named policy.
+    STEP: aggressive goes all in, defensive always guards, balanced guards
+    only while it is losing the health race.
+    """
+    if policy == "aggressive":
+        return np.full(engine.batch, STANCE_SPECIAL, dtype=np.int8)
+    if policy == "defensive":
+        return np.full(engine.batch, STANCE_DEFEND, dtype=np.int8)
+    if policy == "balanced":
+        player, enemy = engine.strength()
+        return np.where(player >= enemy, STANCE_ATTACK, STANCE_DEFEND).astype(np.int8)
+    raise ValueError(f"Unknown battle policy '{policy}'")
+
+
+def oracle_stances(personality: Mapping[str, Any], engine: CombatEngine) -> np.ndarray:
+    """
+    Oracle stance per battle from its personality.
+    STEP: Aggression (0-10) sets how far behind the oracle fights on before it
+    guards; very aggressive oracles press their advantage with special attacks.
+    """
+    aggression = float(personality.get("aggression", 5))
+    player, enemy = engine.strength()
+
+    stances = np.full(engine.batch, STANCE_ATTACK, dtype=np.int8)
+    stances[enemy + (aggression - 5) * 0.05 < player] = STANCE_DEFEND
+    if aggression >= 8:
+        stances[enemy >= player] = STANCE_SPECIAL
+    return stances
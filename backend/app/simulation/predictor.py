@@ -0,0 +1,123 @@
+"""
+backend/app/simulation/predictor.py
+STEP: Monte Carlo Battle Predictor
+Runs thousands of seeded battles of one matchup as a single batch of the combat
+engine and summarizes win probability, battle length and player losses. Results
+are cached per army-composition hash.
+"""
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+import hashlib
+import threading
+
+import numpy as np
+
+from app.config import settings
+from app.simulation.combat_engine import (
+    CombatEngine,
+    battle_state_armies,
+    DEFAULT_MAX_TURNS,
+    STATUS_VICTORY,
+    STATUS_DEFEAT,
+    STATUS_DRAW,
+)
+from app.utils.metrics import BATTLE_PREDICTIONS
+
+# Player-loss histogram bucket edges (fraction of starting hit points lost)
+LOSS_BUCKETS = np.linspace(0.0, 1.0, 11)
+
+
+class BattlePredictor:
+    """
+    Matchup evaluation with an in-process LRU.
+    STEP: The composition hash covers both armies' stats and pools, so a cached
+    result is exact; the batch seed is derived from it, so a recomputed result
+    is identical to the cached one.
+    """
+
+    def __init__(self, max_entries: int = None):
+        self.max_entries = max_entries or settings.BATTLE_PREDICTION_CACHE_SIZE
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # predict() runs in asyncio.to_thread workers; the LRU is shared between them
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def composition_hash(player: np.ndarray, enemy: np.ndarray, simulations: int, max_turns: int) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(player.tobytes())
+        digest.update(b"|")
+        digest.update(enemy.tobytes())
+        digest.update(f"|{simulations}|{max_turns}".encode())
+        return digest.hexdigest()
+
+    def predict(
+        self,
+        player: np.ndarray,
+        enemy: np.ndarray,
+        simulations: Optional[int] = None,
+        max_turns: int = DEFAULT_MAX_TURNS
+    ) -> Dict[str, Any]:
+        """
+        Predict a matchup of two 1-D armies (CPU-bound; call from a worker thread).
+        STEP: One engine batch of `simulations` battles, run to completion.
+        """
+        simulations = min(
+            simulations or settings.BATTLE_PREDICTION_SIMULATIONS,
+            settings.BATTLE_PREDICTION_MAX_SIMULATIONS
+        )
+        key = self.composition_hash(player, enemy, simulations, max_turns)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            BATTLE_PREDICTIONS.labels(cache="hit").inc()
+            return cached
+
+        # Simulated outside the lock (a racing miss computes the same seeded result)
+        engine = CombatEngine.from_armies(player, enemy, simulations, seed=int(key[:16], 16))
+        prediction = {"composition_hash": key, **summarize(engine.run(max_turns))}
+
+        with self._lock:
+            self._cache[key] = prediction
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        BATTLE_PREDICTIONS.labels(cache="miss").inc()
+        return prediction
+
+    def predict_battle_state(
+        self,
+        battle_state: Dict[str, Any],
+        simulations: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Outlook of a battle in progress, from its current pools"""
+        player, enemy = battle_state_armies(battle_state)
+        return self.predict(player, enemy, simulations)
+
+
+def summarize(engine: CombatEngine) -> Dict[str, Any]:
+    """Aggregate a finished batch into outcome probabilities and distributions"""
+    status = engine.status
+    losses = engine.player_losses()
+    histogram, _ = np.histogram(losses, bins=LOSS_BUCKETS)
+    p10, p50, p90 = np.percentile(losses, [10, 50, 90])
+
+    return {
+        "simulations": engine.batch,
+        "win_probability": round(float((status == STATUS_VICTORY).mean()), 4),
+        "loss_probability": round(float((status == STATUS_DEFEAT).mean()), 4),
+        "draw_probability": round(float((status == STATUS_DRAW).mean()), 4),
+        "expected_turns": round(float(engine.turns.mean()), 2),
+        "turns_p90": int(np.percentile(engine.turns, 90)),
+        "player_losses": {
+            "mean": round(float(losses.mean()), 4),
+            "p10": round(float(p10), 4),
+            "p50": round(float(p50), 4),
+            "p90": round(float(p90), 4),
+            "histogram": [round(float(n) / engine.batch, 4) for n in histogram],
+        },
+    }
+
+
+battle_predictor = BattlePredictor()
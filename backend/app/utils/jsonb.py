@@ -0,0 +1,105 @@
+"""
+backend/app/utils/jsonb.py
+STEP: JSONB Partial Updates
+SQL expression builders for targeted JSONB mutations (`||`, `jsonb_set`) and a helper
+that applies them as a single UPDATE ... RETURNING, so large documents are never
+read-modified-written from Python.
+"""
+from typing import Any, Dict, Sequence
+
+from sqlalchemy import update, bindparam, case, func, literal
+from sqlalchemy.dialects.postgresql import JSONB, ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import object_mapper
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.types import Text
+
+from app.database import ConcurrencyConflict
+
+
+def _jsonb(value: Any) -> ColumnElement:
+    """Bind a Python value as a JSONB parameter"""
+    return bindparam(None, value, type_=JSONB)
+
+
+def _path(path: Sequence[str]) -> ColumnElement:
+    """Bind a key path as a text[] parameter"""
+    return literal(list(path), ARRAY(Text))
+
+
+def _object(column) -> ColumnElement:
+    return func.coalesce(column, literal("{}").cast(JSONB))
+
+
+def _array(column) -> ColumnElement:
+    return func.coalesce(column, literal("[]").cast(JSONB))
+
+
+def jsonb_append(column, *values: Any) -> ColumnElement:
+    """`column || '[values]'` — append to a top-level JSONB array"""
+    return _array(column).op("||")(_jsonb(list(values)))
+
+
+def jsonb_append_unique(column, value: Any) -> ColumnElement:
+    """Append `value` to a JSONB array unless it is already contained"""
+    target = _array(column)
+    return case(
+        (target.op("@>")(_jsonb([value])), target),
+        else_=target.op("||")(_jsonb([value]))
+    )
+
+
+def jsonb_merge(column, patch: Dict[str, Any]) -> ColumnElement:
+    """`column || '{patch}'` — shallow key update of a JSONB object"""
+    return _object(column).op("||")(_jsonb(patch))
+
+
+def jsonb_set_path(column, path: Sequence[str], value: Any) -> ColumnElement:
+    """`jsonb_set(column, '{path}', value)` — replace one nested key"""
+    return func.jsonb_set(_object(column), _path(path), _jsonb(value), True)
+
+
+def jsonb_append_at(column, path: Sequence[str], *values: Any) -> ColumnElement:
+    """Append to a JSONB array nested at `path` (created if missing)"""
+    document = _object(column)
+    current = func.coalesce(document.op("#>")(_path(path)), literal("[]").cast(JSONB))
+    return func.jsonb_set(document, _path(path), current.op("||")(_jsonb(list(values))), True)
+
+
+async def apply_jsonb_update(
+    db: AsyncSession,
+    instance: Any,
+    values: Dict[str, ColumnElement]
+) -> Dict[str, Any]:
+    """
+    Apply JSONB expressions to one loaded row with a single UPDATE ... RETURNING.
+    STEP: Guards on the instance's version column (when mapped), bumps it when the
+    ORM generates versions, and writes the returned values back as committed state
+    so a later flush neither re-sends the documents nor trips the version check.
+    """
+    mapper = object_mapper(instance)
+    model = mapper.class_
+    pk = mapper.primary_key[0]
+    stmt = update(model).where(pk == getattr(instance, pk.key))
+    returning = [getattr(model, key) for key in values]
+
+    version_col = mapper.version_id_col
+    if version_col is not None:
+        version_key = mapper.get_property_by_column(version_col).key
+        stmt = stmt.where(version_col == getattr(instance, version_key))
+        if mapper.version_id_generator is not False:
+            values = {**values, version_key: version_col + 1}
+            returning.append(version_col)
+
+    result = await db.execute(
+        stmt.values(**values).returning(*returning).execution_options(synchronize_session=False)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise ConcurrencyConflict(f"{model.__tablename__} row changed concurrently")
+
+    updated = dict(row._mapping)
+    for key, value in updated.items():
+        set_committed_value(instance, key, value)
+    return updated
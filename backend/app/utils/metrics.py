@@ -0,0 +1,120 @@
+"""
+backend/app/utils/metrics.py
+STEP: Custom Prometheus Metrics
+Application-level counters and histograms exposed next to the HTTP instrumentator metrics.
+"""
+from prometheus_client import Counter, Histogram
+
+# Phase prefetching (hit rate = hits / (hits + misses))
+PREFETCH_HITS = Counter(
+    "astraeum_prefetch_hits_total",
+    "Phase lookups served from a prefetched result",
+    ["kind"]
+)
+PREFETCH_MISSES = Counter(
+    "astraeum_prefetch_misses_total",
+    "Phase lookups with no usable prefetched result",
+    ["kind"]
+)
+PREFETCH_WASTED = Counter(
+    "astraeum_prefetch_wasted_total",
+    "Prefetched results that expired or were discarded unused",
+    ["kind"]
+)
+
+# Game state snapshot cache (tier = local | redis | database)
+GAME_STATE_CACHE_READS = Counter(
+    "astraeum_game_state_cache_reads_total",
+    "Game state snapshot reads by the tier that served them",
+    ["tier"]
+)
+
+# Optimistic concurrency control
+CONCURRENCY_CONFLICTS = Counter(
+    "astraeum_concurrency_conflicts_total",
+    "Version conflicts detected on game or oracle state writes",
+    ["operation"]
+)
+CONCURRENCY_RETRIES_EXHAUSTED = Counter(
+    "astraeum_concurrency_retries_exhausted_total",
+    "Mutations abandoned with HTTP 409 after bounded retries",
+    ["operation"]
+)
+
+# Read replica routing (reason = lag | stale_version | probe_failed)
+REPLICA_FALLBACKS = Counter(
+    "astraeum_replica_fallbacks_total",
+    "Reads sent to the primary instead of the replica",
+    ["reason"]
+)
+
+# Cold archival of completed / idle games
+GAMES_ARCHIVED = Counter(
+    "astraeum_games_archived_total",
+    "Games moved from Postgres to object storage"
+)
+GAMES_RESTORED = Counter(
+    "astraeum_games_restored_total",
+    "Archived games restored into Postgres on reopen"
+)
+GAME_RESTORE_SECONDS = Histogram(
+    "astraeum_game_restore_seconds",
+    "Time to restore an archived game (download, decode, insert, commit)",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+# Monte Carlo battle prediction (cache = hit | miss)
+BATTLE_PREDICTIONS = Counter(
+    "astraeum_battle_predictions_total",
+    "Battle outcome predictions by composition-cache result",
+    ["cache"]
+)
+
+# Live battle sessions (reason = end | turns | interval | auto_resolve | fallback)
+BATTLE_SESSION_FLUSHES = Counter(
+    "astraeum_battle_session_flushes_total",
+    "Battle sessions written from Redis to Postgres",
+    ["reason"]
+)
+BATTLE_SESSION_RECOVERIES = Counter(
+    "astraeum_battle_session_recoveries_total",
+    "Battle sessions rebuilt from the last Postgres checkpoint"
+)
+BATTLE_SESSION_WRITE_SECONDS = Histogram(
+    "astraeum_battle_session_write_seconds",
+    "Per-turn Lua update of a battle session in Redis",
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05)
+)
+
+# Recent state history rings (kind = game | battle, result = hit | miss)
+STATE_HISTORY_READS = Counter(
+    "astraeum_state_history_reads_total",
+    "Rewind lookups served from the in-process version rings",
+    ["kind", "result"]
+)
+
+# Procedural puzzles (result = hit | miss for flavor text)
+PUZZLES_GENERATED = Counter(
+    "astraeum_puzzles_generated_total",
+    "Puzzles built by the procedural generators",
+    ["puzzle_type"]
+)
+PUZZLE_FLAVOR_READS = Counter(
+    "astraeum_puzzle_flavor_reads_total",
+    "Puzzle flavor text lookups by cache result",
+    ["result"]
+)
+
+# Puzzle answer verification (method = exact | alias | token_sequence | token_set | edit_distance | embedding | rejected)
+PUZZLE_ANSWER_VERDICTS = Counter(
+    "astraeum_puzzle_answer_verdicts_total",
+    "Puzzle answers judged locally, by deciding method",
+    ["method"]
+)
+
+# Puzzle bank (result = hit | miss | banked | duplicate)
+PUZZLE_BANK_REQUESTS = Counter(
+    "astraeum_puzzle_bank_requests_total",
+    "Puzzle bank draws and inserts by outcome",
+    ["result"]
+)
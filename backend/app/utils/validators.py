@@ -3,10 +3,19 @@
 """
 backend/app/utils/validators.py
 STEP: JSON Schema Validators
-Validates data structures for puzzles, game state, agent outputs.
+Validates data structures for puzzles, game state, agent outputs. Every schema
+(the code schemas below plus configs/puzzles/puzzle_schemas.json) is compiled
+once into a cached validator; simple schemas also get a plain-Python fast path.
 """
-import jsonschema
-from typing import Dict, Any
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional
+import json
+
+from jsonschema.validators import validator_for
+
+from app.config import settings
+
+DEFAULT_PUZZLE_SCHEMAS = Path(__file__).resolve().parents[2] / "configs" / "puzzles" / "puzzle_schemas.json"
 
 PUZZLE_SCHEMA = {
     "type": "object",
@@ -29,23 +38,177 @@ AGENT_ACTION_SCHEMA = {
     "required": ["action_type"]
 }
 
+# Puzzle type schemas (more types are loaded from configs/puzzles/puzzle_schemas.json)
+PUZZLE_TYPE_SCHEMAS = {
+    "logic": {
+        "type": "object",
+        "properties": {
+            "puzzle_type": {"type": "string"},
+            "description": {"type": "string"},
+            "solution": {"type": "string"},
+            "hints": {"type": "array"},
+            "difficulty": {"type": "integer"}
+        },
+        "required": ["puzzle_type", "description", "solution"]
+    },
+    "riddle": {
+        "type": "object",
+        "properties": {
+            "riddle_text": {"type": "string"},
+            "answer": {"type": "string"},
+            "alternative_answers": {"type": "array"}
+        },
+        "required": ["riddle_text", "answer"]
+    },
+    "pattern": {
+        "type": "object",
+        "properties": {
+            "sequence": {"type": "array"},
+            "next_value": {"type": "string"},
+            "pattern_rule": {"type": "string"}
+        },
+        "required": ["sequence", "next_value"]
+    }
+}
+
+# JSON types as the jsonschema default type checker defines them
+TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "integer": lambda value: (isinstance(value, int) and not isinstance(value, bool))
+                             or (isinstance(value, float) and value.is_integer()),
+}
+
+# Keywords the fast path understands; schemas using anything else go through jsonschema
+FAST_KEYWORDS = frozenset({"type", "properties", "required", "minimum", "maximum"})
+
+
+def compile_fast_check(schema: Mapping[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """
+    Plain-Python boolean check equivalent to a schema, or None when the schema
+    uses keywords outside FAST_KEYWORDS.
+    """
+    if not isinstance(schema, Mapping) or not set(schema) <= FAST_KEYWORDS:
+        return None
+    if "type" in schema and not isinstance(schema["type"], str):
+        return None
+
+    type_check = TYPE_CHECKS.get(schema["type"]) if "type" in schema else None
+    if "type" in schema and type_check is None:
+        return None
+    properties = []
+    for key, subschema in (schema.get("properties") or {}).items():
+        check = compile_fast_check(subschema)
+        if check is None:
+            return None
+        properties.append((key, check))
+    required = tuple(schema.get("required") or ())
+    minimum, maximum = schema.get("minimum"), schema.get("maximum")
+    is_number = TYPE_CHECKS["number"]
+
+    def check(instance: Any) -> bool:
+        if type_check is not None and not type_check(instance):
+            return False
+        if isinstance(instance, dict):
+            for key in required:
+                if key not in instance:
+                    return False
+            for key, property_check in properties:
+                if key in instance and not property_check(instance[key]):
+                    return False
+        elif minimum is not None or maximum is not None:
+            if is_number(instance):
+                if minimum is not None and instance < minimum:
+                    return False
+                if maximum is not None and instance > maximum:
+                    return False
+        return True
+
+    return check
+
+
+class SchemaRegistry:
+    """
+    Named schemas compiled once.
+    STEP: `is_valid` is the fast boolean path (compiled plain-Python check, else the
+    cached jsonschema validator); `errors` lists every violation with its path on
+    request.
+    """
+
+    def __init__(self):
+        self._validators: Dict[str, Any] = {}
+        self._fast: Dict[str, Callable[[Any], bool]] = {}
+        self._loaded = False
+
+    def register(self, name: str, schema: Mapping[str, Any]):
+        """Check and compile one schema (raises jsonschema.SchemaError on a bad schema)"""
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        validator = cls(schema)
+        self._validators[name] = validator
+        self._fast[name] = compile_fast_check(schema) or validator.is_valid
+
+    def load(self, path: Optional[str] = None) -> "SchemaRegistry":
+        """Compile the code schemas and the puzzle schema file (puzzle types as `puzzle:<type>`)"""
+        self.register("puzzle", PUZZLE_SCHEMA)
+        self.register("agent_action", AGENT_ACTION_SCHEMA)
+        for puzzle_type, schema in PUZZLE_TYPE_SCHEMAS.items():
+            self.register(f"puzzle:{puzzle_type}", schema)
+
+        path = Path(path or settings.PUZZLE_SCHEMAS_CONFIG or DEFAULT_PUZZLE_SCHEMAS)
+        with open(path) as f:
+            for puzzle_type, schema in json.load(f).items():
+                self.register(f"puzzle:{puzzle_type}", schema)
+        self._loaded = True
+        return self
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+
+    def __contains__(self, name: str) -> bool:
+        self._ensure_loaded()
+        return name in self._validators
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._validators)
+
+    def is_valid(self, name: str, instance: Any) -> bool:
+        """Whether an instance satisfies a named schema (KeyError for unknown names)"""
+        self._ensure_loaded()
+        return self._fast[name](instance)
+
+    def errors(self, name: str, instance: Any) -> List[Dict[str, str]]:
+        """Every violation of a named schema as {"path", "message"}, in document order"""
+        self._ensure_loaded()
+        found = sorted(self._validators[name].iter_errors(instance), key=lambda e: list(map(str, e.absolute_path)))
+        return [
+            {"path": "/" + "/".join(map(str, error.absolute_path)), "message": error.message}
+            for error in found
+        ]
+
+
 def validate_puzzle(puzzle_data: Dict[str, Any]) -> bool:
     """Validate puzzle data against schema"""
-    try:
-        jsonschema.validate(instance=puzzle_data, schema=PUZZLE_SCHEMA)
+    if schema_registry.is_valid("puzzle", puzzle_data):
         return True
-    except jsonschema.exceptions.ValidationError as e:
-        print(f"Puzzle validation error: {e}")
-        return False
+    error = schema_registry.errors("puzzle", puzzle_data)[0]
+    print(f"Puzzle validation error at {error['path']}: {error['message']}")
+    return False
 
 def validate_agent_action(action_data: Dict[str, Any]) -> bool:
     """Validate agent action against schema"""
-    try:
-        jsonschema.validate(instance=action_data, schema=AGENT_ACTION_SCHEMA)
-        return True
-    except jsonschema.exceptions.ValidationError:
-        return False
+    return schema_registry.is_valid("agent_action", action_data)
 
 def sanitize_player_input(input_str: str) -> str:
     """Sanitize player input to prevent injection"""
-    return input_str.strip()[:500]
\ No newline at end of file
+    return input_str.strip()[:500]
+
+
+# Process-wide registry, compiled during application startup (or on first use)
+schema_registry = SchemaRegistry()
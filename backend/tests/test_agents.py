@@ -32,3 +32,58 @@ async def test_nyx_deception():
     puzzle = {"hints": ["hint1", "hint2", "hint3"]}
     modified = await agent.modify_puzzle_rules(puzzle)
     assert "nyx_twist" in modified
+
+@pytest.mark.asyncio
+async def test_chronos_rewind_only_claims_applied_rewinds():
+    """Temporal Rewind reports an undo only after the rewind callable applied it"""
+    agent = ChronosAgent("Chronos", "Time", {}, LLMAdapter(), VectorMemory())
+    
+    async def rewind(steps):
+        assert steps == 1
+        return 9
+    
+    async def failed(steps):
+        raise ValueError("history gone")
+    
+    applied = await agent.special_ability_rewind({"version": 8}, rewind=rewind)
+    assert applied["rewound"] and applied["version"] == 9
+    assert "undone" in applied["message"]
+    
+    for result in (
+        await agent.special_ability_rewind({"version": 8}),
+        await agent.special_ability_rewind({"version": 8}, rewind=failed),
+    ):
+        assert not result["rewound"] and "undone" not in result["message"]
+
+def test_memory_reranking_prefers_recent_important():
+    """Test ranked retrieval blends similarity, importance and recency"""
+    from datetime import datetime, timezone
+    now = datetime(2024, 1, 10, tzinfo=timezone.utc)
+    candidates = [
+        {"content": "old", "importance": 0.3, "timestamp": "2023-06-01T00:00:00Z",
+         "_additional": {"score": "0.9"}},
+        {"content": "fresh", "importance": 0.9, "timestamp": "2024-01-09T12:00:00Z",
+         "_additional": {"score": "0.8"}},
+    ]
+    ranked = VectorMemory.rank_memories(candidates, limit=1, now=now)
+    assert [m["content"] for m in ranked] == ["fresh"]
+    assert "_additional" not in ranked[0]
+
+def test_tactical_policy_follows_personality():
+    """Local search is bounded, picks a legal action, and honor rules out retreats"""
+    from app.agents.tactical_policy import TacticalPolicy
+    
+    battle_state = {
+        "turn": 3, "seed": 5,
+        "player_units": [{"quantity": 10, "attack": 10, "defense": 10, "health": 100, "speed": 5}],
+        "enemy_units": [{"quantity": 8, "attack": 15, "defense": 10, "health": 80, "speed": 7}],
+        "player_health": 1000, "enemy_health": 150,
+    }
+    reckless = TacticalPolicy({"aggression": 9, "cunning": 3, "honor": 1}, budget_ms=50, rollouts=16)
+    evaluation = reckless.evaluate(battle_state)
+    assert len(evaluation["values"]) == 3
+    assert 16 * 9 <= evaluation["rollouts"]
+    assert reckless.decide(battle_state) in ("attack", "defend", "special_ability", "tactical_retreat")
+    
+    honorable = TacticalPolicy({"aggression": 2, "cunning": 9, "honor": 10}, budget_ms=50, rollouts=16)
+    assert honorable.decide(battle_state) != "tactical_retreat"
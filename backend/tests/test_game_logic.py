@@ -17,6 +17,59 @@ async def test_game_creation(db_session):
     assert game_state.insight_tokens == 1
     assert len(game_state.weapons) == 1
 
+@pytest.mark.asyncio
+async def test_batch_game_creation_keeps_order_and_fans_out(db_session):
+    """Bulk creation returns games in player order, each with its child rows"""
+    from fastapi import HTTPException
+    from sqlalchemy import select, func
+    from app.cache.catalog import catalog_cache
+    from app.models.player import Player
+    from app.models.game_state import DominionState
+    from app.models.oracle import OracleState
+    from app.models.army import PlayerArmy
+    
+    catalog = await catalog_cache.load(db_session)
+    players = [
+        Player(username=f"batch{i}", email=f"batch{i}@example.com", hashed_password="x")
+        for i in range(2)
+    ]
+    db_session.add_all(players)
+    await db_session.commit()
+    order = [players[1].id, players[0].id, players[1].id]
+    
+    game_states = await GameService.create_new_games(db_session, order)
+    assert [game_state.player_id for game_state in game_states] == order
+    assert len({game_state.id for game_state in game_states}) == 3
+    
+    game_ids = [game_state.id for game_state in game_states]
+    for model, expected in (
+        (OracleState, len(catalog.oracles)),
+        (DominionState, len(GameService.DOMINIONS)),
+        (PlayerArmy, 1 if catalog.unit_by_name("Novice Soldiers") else 0),
+    ):
+        counts = dict((await db_session.execute(
+            select(model.game_state_id, func.count())
+            .where(model.game_state_id.in_(game_ids))
+            .group_by(model.game_state_id)
+        )).all())
+        assert [counts.get(game_id, 0) for game_id in game_ids] == [expected] * 3
+    
+    with pytest.raises(HTTPException) as error:
+        await GameService.create_new_games(db_session, [players[0].id, -1])
+    assert error.value.status_code == 422
+
+@pytest.mark.asyncio
+async def test_battle_endpoints_only_serve_the_game_owner(db_session):
+    """Other players' games look missing to battle reads and actions"""
+    from fastapi import HTTPException
+    
+    game_state = await GameService.create_new_game(db_session, player_id=1)
+    await GameService.ensure_game_owner(db_session, game_state.id, 1)
+    for game_id, player_id in ((game_state.id, 2), (-1, 1)):
+        with pytest.raises(HTTPException) as error:
+            await GameService.ensure_game_owner(db_session, game_id, player_id)
+        assert error.value.status_code == 404
+
 @pytest.mark.asyncio
 async def test_combat_calculation():
     """Test combat power calculation"""
@@ -24,3 +77,464 @@ async def test_combat_calculation():
     power = CombatService.calculate_combat_power(units)
     assert power["attack"] == 100
     assert power["health"] == 1000
+
+def test_catalog_indexes():
+    """Test static catalog lookups by id and name"""
+    from app.cache.catalog import GameCatalog, ArmyUnitEntry
+    unit = ArmyUnitEntry(
+        id=7, name="Novice Soldiers", unit_type="infantry", origin_oracle=None,
+        attack=10, defense=10, health=100, speed=5, special_abilities=(),
+        element_affinity=None, recruitment_cost=0, rarity="common"
+    )
+    catalog = GameCatalog((), (unit,))
+    assert catalog.unit_by_id(7) is catalog.unit_by_name("Novice Soldiers")
+    assert catalog.oracle_by_name("Chronos") is None
+
+def test_game_state_cache_lru_eviction():
+    """Test the in-process snapshot tier evicts least recently used versions"""
+    from app.cache.game_state_cache import GameStateCache
+    cache = GameStateCache(max_entries=2, ttl_seconds=60)
+    cache._remember((1, 1), {"id": 1, "version": 1})
+    cache._remember((2, 1), {"id": 2, "version": 1})
+    cache._remember((1, 2), {"id": 1, "version": 2})
+    assert list(cache._local) == [(2, 1), (1, 2)]
+
+@pytest.mark.asyncio
+async def test_retry_on_conflict_retries_then_succeeds():
+    """Test conflicting mutations are rolled back and retried"""
+    from app.database import ConcurrencyConflict, retry_on_conflict
+
+    class FakeSession:
+        rollbacks = 0
+
+        async def rollback(self):
+            self.rollbacks += 1
+
+    db = FakeSession()
+    attempts = []
+
+    async def operation():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConcurrencyConflict("stale")
+        return "ok"
+
+    result = await retry_on_conflict(db, operation, "test", max_attempts=3, base_delay=0)
+    assert result == "ok"
+    assert db.rollbacks == 2
+
+def test_jsonb_append_at_compiles_to_jsonb_set():
+    """Nested appends are a single jsonb_set, not a document rewrite"""
+    from sqlalchemy.dialects import postgresql
+    from app.models.game_state import GameState
+    from app.utils.jsonb import jsonb_append_at
+    
+    expr = jsonb_append_at(GameState.world_state, ["rule_changes"], {"rule": "x"})
+    sql = str(expr.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("jsonb_set(coalesce(game_states.world_state")
+    assert "#>" in sql and "||" in sql
+
+@pytest.mark.asyncio
+async def test_defeat_oracle_is_single_statement(db_session):
+    """Defeating an oracle must stay one round trip (plus commit)"""
+    from sqlalchemy import event
+    from app.cache.catalog import catalog_cache
+    
+    catalog = await catalog_cache.load(db_session)
+    if not catalog.oracles:
+        pytest.skip("catalog not seeded")
+    game_state = await GameService.create_new_game(db_session, player_id=1)
+    
+    statements = []
+    engine = db_session.get_bind()
+    
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        result = await GameService.defeat_oracle(
+            db_session, game_state.id, 1, catalog.oracles[0].id
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    
+    assert len(statements) == 1
+    assert result["progress"]["oracles_defeated"] == 1
+    assert result["rewards"]["gold"] == 500
+
+def test_snapshot_encode_roundtrip_restores_datetimes():
+    """Archived snapshots decode back to insertable rows"""
+    from datetime import datetime, timezone
+    from app.models.game_state import GameState
+    from app.services.snapshot_service import SnapshotService
+    
+    saved_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    snapshot = {
+        "schema_version": 1,
+        "tables": {
+            "game_states": {
+                "columns": ["id", "player_id", "world_state", "last_save"],
+                "rows": [[7, 1, {"rule_changes": [1, 2]}, saved_at]]
+            }
+        }
+    }
+    decoded = SnapshotService.decode(SnapshotService.encode(snapshot))
+    rows = SnapshotService._table_rows(GameState.__table__, decoded["tables"]["game_states"])
+    assert rows == [{"id": 7, "player_id": 1, "world_state": {"rule_changes": [1, 2]}, "last_save": saved_at}]
+
+def test_snapshot_decoder_accepts_small_chunks():
+    """Streamed uploads decode identically to a one-shot decode"""
+    from app.services.snapshot_service import SnapshotService, SnapshotDecoder
+    
+    snapshot = {
+        "schema_version": 1,
+        "game_id": 3,
+        "tables": {"battle_log_entries": {"columns": ["id", "value"], "rows": [[i, i % 7] for i in range(2000)]}}
+    }
+    payload = SnapshotService.encode(snapshot)
+    decoder = SnapshotDecoder()
+    for i in range(0, len(payload), 64):
+        decoder.feed(payload[i:i + 64])
+    assert decoder.finish() == snapshot
+
+def test_event_replay_rebuilds_state_and_rejects_gaps():
+    """Replaying the log over a snapshot reproduces the mutations"""
+    from app.services.event_service import GameEventService, GameProjector, EventType
+    
+    state = GameProjector.build_state(
+        1,
+        {"id": 9, "player_id": 1, "version": 1, "gold": 1000, "insight_tokens": 3,
+         "oracles_defeated": 0, "current_stage": 1, "weapons": [], "is_completed": False},
+        [{"id": 40, "game_state_id": 9, "oracle_id": 1, "is_defeated": False, "is_hostile": True,
+          "battle_state": {"turn": 1, "player_health": 500, "enemy_health": 100, "status": "in_progress"}}],
+        [{"id": 70, "game_state_id": 9, "oracle_name": "Chronos", "is_controlled": False}],
+        []
+    )
+    GameEventService.replay(state, [
+        (2, EventType.BATTLE_TURN, {"oracle_id": 1, "player_damage": 120, "enemy_damage": 0}),
+        (3, EventType.ORACLE_DEFEATED, {"oracle_id": 1, "oracle_name": "Chronos", "weapon": "Hourglass",
+                                        "army_unit_id": 5, "unit_health": 100, "at": "2026-01-01T00:00:00"}),
+    ])
+    
+    assert state["version"] == 3
+    assert state["oracles"][1]["battle_state"]["status"] == "victory"
+    assert state["oracles"][1]["is_defeated"] is True
+    assert state["dominions"]["Chronos"]["is_controlled"] is True
+    assert state["game"]["gold"] == 1500
+    assert state["game"]["weapons"] == ["Hourglass"]
+    assert state["armies"][0]["total_health"] == 500
+    
+    with pytest.raises(ValueError):
+        GameEventService.replay(state, [(5, EventType.INSIGHT_USED, {})])
+
+def test_combat_engine_batches_are_seeded_and_independent():
+    """Same seed, same battles; each batch row matches a lone battle on its own"""
+    from app.simulation.combat_engine import CombatEngine, STATUS_IN_PROGRESS
+    
+    player = [{"quantity": 10, "attack": 10, "defense": 10, "health": 100, "speed": 5}]
+    enemy = [{"quantity": 8, "attack": 12, "defense": 8, "health": 64, "speed": 7, "element": "time"}]
+    
+    first = CombatEngine.from_units(player, enemy, batch=64, seed=3).run()
+    second = CombatEngine.from_units(player, enemy, batch=64, seed=3).run()
+    assert (first.status == second.status).all()
+    assert (first.turns == second.turns).all()
+    assert (first.status != STATUS_IN_PROGRESS).all()
+    
+    # Finished battles are frozen while others keep stepping
+    engine = CombatEngine.from_units(player, enemy, batch=2, seed=3)
+    engine.status[1] = 1
+    engine.step()
+    assert engine.turns.tolist() == [1, 0]
+    assert engine.player_health[1] == 1000
+
+def test_battle_predictor_caches_by_composition():
+    """Identical matchups are served from the cache; a stronger army wins more"""
+    from app.simulation.combat_engine import units_to_array
+    from app.simulation.predictor import BattlePredictor
+    
+    predictor = BattlePredictor(max_entries=4)
+    enemy = units_to_array([{"quantity": 8, "attack": 12, "defense": 8, "health": 64, "speed": 7}])
+    small = units_to_array([{"quantity": 5, "attack": 10, "defense": 10, "health": 100}])
+    large = units_to_array([{"quantity": 30, "attack": 10, "defense": 10, "health": 100}])
+    
+    first = predictor.predict(small, enemy, simulations=500)
+    assert predictor.predict(small.copy(), enemy.copy(), simulations=500) is first
+    assert predictor.predict(large, enemy, simulations=500)["win_probability"] > first["win_probability"]
+    assert abs(sum(first["player_losses"]["histogram"]) - 1.0) < 1e-6
+
+def test_auto_resolve_summary_condenses_turns():
+    """Long auto-resolved battles are summarized in a bounded number of lines"""
+    from app.config import settings
+    
+    damage = [(turn, 100, 50) for turn in range(1, 31)]
+    lines = CombatService.summarize_turns(damage, "victory")
+    assert len(lines) <= settings.AUTO_RESOLVE_SUMMARY_LINES + 1
+    assert lines[0].startswith("Turns 1-")
+    assert lines[-1] == "Victory! Enemy defeated!"
+    assert sum(int(line.split("dealt ")[1].split(" ")[0]) for line in lines[:-1]) == 3000
+
+@pytest.mark.asyncio
+async def test_battle_session_checkpoint_schedule():
+    """Sessions flush every BATTLE_CHECKPOINT_TURNS turns and at the end of the battle"""
+    import time
+    from app.config import settings
+    from app.cache.battle_sessions import BattleSession, battle_sessions
+    
+    state = {"battle_no": 1, "turn": 1, "status": "in_progress"}
+    session = BattleSession(1, 1, 1, state, checkpoint_turn=1, checkpoint_at=time.time(),
+                            log=[], flushed=0, stored=False)
+    assert battle_sessions.flush_reason(session) is None
+    
+    # Detached sessions (Redis unreachable) track turns in memory but report them unstored
+    turn = settings.BATTLE_CHECKPOINT_TURNS + 1
+    stored = await battle_sessions.record_turn(session, 1, {**state, "turn": turn}, "AD", [(1, 1, 40)])
+    assert stored is False
+    assert session.pending == [(1, 1, 40)] and session.stances == "AD"
+    assert battle_sessions.flush_reason(session) == "turns"
+    
+    await battle_sessions.checkpoint(session)
+    assert session.pending == [] and session.checkpoint_turn == turn
+    session.battle_state = {**session.battle_state, "status": "victory"}
+    assert battle_sessions.flush_reason(session) == "end"
+
+def test_enemy_army_table_covers_every_oracle():
+    """Every oracle has its own precomputed, read-only army at every difficulty"""
+    from pathlib import Path
+    import yaml
+    from app.simulation.enemy_armies import enemy_armies
+    
+    table = enemy_armies.current
+    agents = Path(__file__).resolve().parents[1] / "configs" / "agents"
+    names = [yaml.safe_load(path.read_text())["name"] for path in agents.glob("*.yaml")]
+    assert len(names) == 13 and set(names) <= set(table.templates)
+    
+    chronos = table.lookup("Chronos", 3)
+    assert chronos.multiplier == pytest.approx(2.4)
+    assert chronos.units[0]["attack"] == int(15 * 2.4)
+    assert chronos.power["power_score"] > table.lookup("Chronos", 1).power["power_score"]
+    assert not chronos.army.flags.writeable
+    
+    # Callers get their own copies; out-of-range difficulty is clamped
+    chronos.unit_dicts()[0]["attack"] = 0
+    assert chronos.units[0]["attack"] == int(15 * 2.4)
+    assert table.lookup("Chronos", 99) is table.lookup("Chronos", table.max_difficulty)
+    assert table.lookup("Nobody", 2).oracle == "fallback"
+
+def test_state_history_rings_share_and_rewind():
+    """Recent versions rewind in O(1), truncate on rewind and share unchanged parts"""
+    from app.cache.state_history import StateHistory, copy_on_write
+    
+    history = StateHistory("game", depth=4, max_keys=2)
+    state = {"game": {"turn": 1}, "oracles": {1: {"hp": 5}, 2: {"hp": 7}}, "dominions": {}, "armies": []}
+    history.push(1, 1, state)
+    for version in range(2, 7):
+        state = copy_on_write(state, oracle_id=1)
+        state["oracles"][1]["hp"] = version
+        history.push(1, version, state)
+    
+    ring = history.head(1)
+    assert ring.head_version == 6 and ring.size == 4
+    assert history.at(1, 5)["oracles"][1]["hp"] == 5
+    assert history.at(1, 2) is None  # fell out of the capped ring
+    assert history.at(1, 4)["oracles"][2] is history.at(1, 6)["oracles"][2]
+    
+    # Rewinding to version 4 drops 5 and 6; a gap restarts the ring
+    history.push(1, 4, {**history.at(1, 4), "rewound": True})
+    assert ring.head_version == 4 and history.at(1, 5) is None and ring.back(1) is not None
+    history.push(1, 9, state)
+    assert ring.size == 1 and history.at(1, 3) is None
+    
+    history.push(2, 1, state)
+    history.push(3, 1, state)
+    assert history.head(1) is None  # least recently used key evicted
+
+def test_procedural_puzzles_are_seeded_and_solvable():
+    """Structured puzzles regenerate from their seed and their solutions hold"""
+    from app.puzzles.generators import generate_puzzle, PUZZLE_GENERATORS, MOVES
+    
+    for puzzle_type in PUZZLE_GENERATORS:
+        for difficulty in (1, 7, 13):
+            puzzle = generate_puzzle(puzzle_type, difficulty, seed=difficulty)
+            assert puzzle == generate_puzzle(puzzle_type, difficulty, seed=difficulty)
+            assert puzzle["solution"] and puzzle["difficulty"] == difficulty
+    
+    maze = generate_puzzle("shadow_maze", 9, seed=5)
+    layout, r, c = maze["maze_layout"], 1, 1
+    for move in maze["solution"]:
+        dr, dc = MOVES[move]
+        assert layout[r + dr][c + dc] != "#"
+        r, c = r + 2 * dr, c + 2 * dc
+    assert layout[r][c] == "E" and maze["false_paths"]
+    
+    board = generate_puzzle("strategic_positioning", 10, seed=5)
+    cells = board["solution"].split()
+    size = int(board["board_size"].split("x")[0])
+    assert len({cell[0] for cell in cells}) == len(cells) == size
+    assert not set(cells) & set(board["constraints"][1]["cells"])
+    assert {piece["cell"] for piece in board["pieces"]} <= set(cells)
+    
+    pattern = generate_puzzle("pattern", 4, seed=5)
+    assert pattern["solution"] == pattern["next_value"]
+
+def test_schema_registry_compiles_code_and_file_schemas():
+    """Schemas compile once; the fast path and error paths agree with jsonschema"""
+    from app.utils.validators import SchemaRegistry, compile_fast_check
+    
+    registry = SchemaRegistry().load()
+    assert "puzzle:shadow_maze" in registry and "puzzle:riddle" in registry and "agent_action" in registry
+    
+    puzzle = {"puzzle_type": "logic", "description": "d", "solution": "s", "difficulty": 3}
+    assert registry.is_valid("puzzle", puzzle)
+    assert not registry.is_valid("puzzle", {**puzzle, "difficulty": 14})
+    assert not registry.is_valid("puzzle", {**puzzle, "difficulty": True})
+    assert registry.errors("puzzle", puzzle) == []
+    errors = registry.errors("puzzle", {"puzzle_type": 7, "description": "d"})
+    assert [error["path"] for error in errors] == ["/", "/puzzle_type"]
+    
+    # Keywords outside the fast subset fall back to the cached validator
+    assert compile_fast_check({"type": "string", "enum": ["a"]}) is None
+    registry.register("choice", {"type": "string", "enum": ["a"]})
+    assert registry.is_valid("choice", "a") and not registry.is_valid("choice", "b")
+
+def test_answer_verifier_normalizes_and_tolerates_typos():
+    """Free-form answers match through aliases and typos; structured ones stay exact"""
+    from app.puzzles.verifier import answer_verifier, normalize_answer
+    
+    assert normalize_answer("The Twenty-One Crowns!") == "21 crowns"
+    assert normalize_answer("one hundred and five") == "105"
+    assert normalize_answer("09:45") == normalize_answer("9:45")
+    
+    riddle = {"riddle_text": "...", "answer": "A candle", "alternative_answers": ["wax's flame"]}
+    assert answer_verifier.judge("CANDLE!", riddle).method == "exact"
+    assert answer_verifier.judge("the wax's flame", riddle).method == "alias"
+    assert not answer_verifier.judge("cnadle", riddle).correct  # two edits
+    assert answer_verifier.judge("candl", riddle).method == "edit_distance"
+    assert not answer_verifier.judge("a shadow", riddle).correct
+    
+    # Word order carries the choice; only list answers are bags of words
+    dilemma = {"scenario": "...", "just_solution": "Spare the village and punish the general"}
+    assert answer_verifier.judge("spare the village and then punish the general", dilemma).method == "token_sequence"
+    assert not answer_verifier.judge("punish the village and spare the general", dilemma).correct
+    assert not answer_verifier.judge("punish the general and spare the village", dilemma).correct
+    elements = {"riddle_text": "...", "answer": ["fire", "ice"]}
+    assert answer_verifier.judge("ice, fire", elements).method == "token_set"
+    
+    # Short answers get no typo allowance: one edit is another word
+    for guess, answer in [("hire", "fire"), ("map", "man"), ("men", "man"), ("tide", "time"), ("ecko", "echo")]:
+        assert not answer_verifier.judge(guess, {"answer": answer}).correct
+    
+    pattern = {"puzzle_type": "pattern", "solution": "26", "next_value": "26"}
+    assert answer_verifier.judge("twenty six", pattern).correct
+    assert not answer_verifier.judge("28", pattern).correct
+    maze = {"puzzle_type": "shadow_maze", "solution": "RRDDLR"}
+    assert not answer_verifier.judge("RRDDLL", maze).correct
+    assert answer_verifier.judge("R, R, D, D, L, R", maze).method == "exact"
+    assert answer_verifier.judge("right right down down left right", maze).correct
+    
+    # Signs survive normalization: negative answers need the minus
+    assert normalize_answer("-7") == "-7" and normalize_answer("twenty-one") == "21"
+    falling = {"puzzle_type": "pattern", "solution": "-7", "next_value": "-7"}
+    assert answer_verifier.judge("-7", falling).correct
+    assert not answer_verifier.judge("7", falling).correct
+
+def test_puzzle_bank_bitmap_and_content_hash():
+    """Seen bitmaps find the lowest unseen slot; cosmetic rewording keeps the content hash"""
+    from app.services.puzzle_bank_service import content_hash, first_unseen, mark_seen, bankable
+    
+    seen = b""
+    for slot in (0, 1, 2, 5, 9):
+        seen = mark_seen(seen, slot)
+    assert len(seen) == 2
+    assert first_unseen(seen, 10) == 3
+    assert first_unseen(seen, 3) is None
+    assert first_unseen(b"", 0) is None
+    assert first_unseen(b"\xff" * 125, 1001) == 1000
+    
+    riddle = {"puzzle_type": "riddle", "riddle_text": "What has Twenty-One eyes?", "answer": "A die"}
+    reworded = {"puzzle_type": "riddle", "riddle_text": "what has 21 eyes", "answer": "die", "hint": "roll"}
+    assert content_hash(riddle) == content_hash(reworded)
+    assert len(content_hash(riddle)) == 16
+    assert content_hash(riddle) != content_hash({**riddle, "answer": "A spider"})
+    
+    assert bankable(riddle)
+    assert not bankable({"puzzle_type": "riddle", "riddle_text": "No answer stored"})
+
+@pytest.mark.asyncio
+async def test_puzzle_solve_counts_against_the_bank_entry(db_session):
+    """The first correct answer to a banked puzzle bumps its solve count, once"""
+    from sqlalchemy import select
+    from app.cache.catalog import catalog_cache
+    from app.models.oracle import OracleState
+    from app.models.puzzle_bank import PuzzleBankEntry
+    from app.services.puzzle_bank_service import PuzzleBankService
+    from app.services.puzzle_service import PuzzleService
+    
+    await catalog_cache.load(db_session)
+    game_state = await GameService.create_new_game(db_session, player_id=1)
+    oracle_state = (await db_session.execute(
+        select(OracleState).where(OracleState.game_state_id == game_state.id).limit(1)
+    )).scalar_one()
+    bucket = (oracle_state.oracle_id, "riddle", 1)
+    puzzle = {"puzzle_type": "riddle", "riddle_text": "What has a neck but no head?", "answer": "A bottle"}
+    bank_id = await PuzzleBankService.add(db_session, 1, bucket, puzzle)
+    oracle_state.puzzle_state = {**puzzle, "bank_id": bank_id, "attempts": 0}
+    oracle_state.current_phase = "puzzle"
+    await db_session.commit()
+    
+    async def solves():
+        return (await db_session.execute(
+            select(PuzzleBankEntry.uses, PuzzleBankEntry.solves).where(PuzzleBankEntry.id == bank_id)
+        )).one()
+    
+    assert not (await PuzzleService.validate_puzzle_solution(db_session, oracle_state.id, "a shirt"))["valid"]
+    assert tuple(await solves()) == (1, 0)
+    assert (await PuzzleService.validate_puzzle_solution(db_session, oracle_state.id, "bottle"))["valid"]
+    assert tuple(await solves()) == (1, 1)
+    await PuzzleService.validate_puzzle_solution(db_session, oracle_state.id, "bottle")
+    assert tuple(await solves()) == (1, 1)
+
+@pytest.mark.asyncio
+async def test_puzzle_start_without_agent_serves_a_procedural_puzzle(db_session):
+    """Oracles without a registered agent get a fallback procedural puzzle, not a 503"""
+    from sqlalchemy import select, func
+    from app.cache.catalog import catalog_cache
+    from app.cache.prefetch import phase_prefetcher
+    from app.config import settings
+    from app.models.puzzle_bank import PuzzleBankEntry
+    
+    catalog = await catalog_cache.load(db_session)
+    oracle = catalog.oracle_by_name("Helios") or catalog.oracles[0]
+    assert phase_prefetcher.agent(oracle.name) is None
+    assert GameService._puzzle_bucket(oracle) is None
+    game_state = await GameService.create_new_game(db_session, player_id=1)
+    
+    result = await GameService.start_oracle_puzzle(db_session, game_state.id, 1, oracle.id)
+    assert result["phase"] == "puzzle"
+    assert result["puzzle"]["puzzle_type"] == settings.PUZZLE_FALLBACK_TYPE
+    assert "solution" not in result["puzzle"]
+    banked = (await db_session.execute(
+        select(func.count()).select_from(PuzzleBankEntry).where(PuzzleBankEntry.oracle_id == oracle.id)
+    )).scalar_one()
+    assert banked == 0
+    
+    # Served again until solved
+    again = await GameService.start_oracle_puzzle(db_session, game_state.id, 1, oracle.id)
+    assert again["puzzle"] == result["puzzle"]
+
+def test_public_puzzle_view_hides_answers_of_every_type():
+    """Served puzzles carry no answer, seed or rule; hints unlock one per failed attempt"""
+    import json
+    from app.puzzles.generators import generate_puzzle, PUZZLE_GENERATORS
+    from app.puzzles.verifier import public_puzzle, ANSWER_KEYS, ALIAS_KEYS, SECRET_KEYS
+    
+    for puzzle_type in PUZZLE_GENERATORS:
+        for difficulty in (1, 7, 13):
+            puzzle = {**generate_puzzle(puzzle_type, difficulty, seed=difficulty), "attempts": 0}
+            view = public_puzzle(puzzle)
+            assert not set(view) & set(ANSWER_KEYS + ALIAS_KEYS + SECRET_KEYS), puzzle_type
+            assert view.get("hints", []) == []
+            assert puzzle["solution"] not in view.values()
+            if puzzle_type in ("shadow_maze", "strategic_positioning"):
+                assert puzzle["solution"] not in json.dumps(view), puzzle_type
+            assert public_puzzle({**puzzle, "attempts": 2})["hints"] == puzzle["hints"][:2]
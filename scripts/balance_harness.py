@@ -0,0 +1,260 @@
+"""
+scripts/balance_harness.py
+STEP: Combat Balance Harness
+Sweeps player army compositions built from configs/game/army_units.yaml against
+every oracle's enemy army (configs/game/enemy_armies.yaml) at every stage and
+over a grid of enemy power multipliers, on a process pool across all cores.
+Writes per-cell results and win-rate matrices (CSV, plus Parquet when
+pandas + pyarrow are installed),
+suggests enemy_strength curve values that hit a target win-rate curve, and
+reports throughput in battles/sec.
+
+A stage-s player is modelled as the starting Novice Soldiers plus s-1 reward
+stacks of 5 (every multiset of the reward units, sampled down to
+--max-compositions). Both sides use the plain attack stance.
+
+Usage: python scripts/balance_harness.py [--simulations 200] [--workers 8]
+       [--multipliers 0.4,0.8,1.2,1.6,2.4,3.2] [--target 1:0.9,13:0.55] [--out balance_results]
+"""
+import argparse
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+# Add parent directory to path
+BACKEND = Path(__file__).parent.parent / 'backend'
+sys.path.insert(0, str(BACKEND))
+
+from app.simulation.combat_engine import (
+    CombatEngine,
+    units_to_array,
+    stack_armies,
+    STATUS_VICTORY,
+    STATUS_DRAW,
+)
+from app.simulation.enemy_armies import enemy_armies
+
+STAGES = range(1, 14)
+CORE_UNIT = "Novice Soldiers"
+CORE_QUANTITY = 10
+REWARD_QUANTITY = 5
+DEFAULT_MULTIPLIERS = "0.4,0.6,0.8,1.0,1.3,1.6,2.0,2.5,3.2,4.0,5.0,6.5,8.0"
+
+
+def load_units(path: Path) -> list:
+    """Combat unit dicts from army_units.yaml"""
+    with open(path) as f:
+        units = yaml.safe_load(f)["units"]
+    return [
+        {
+            "name": unit["name"],
+            "attack": unit["stats"]["attack"],
+            "defense": unit["stats"]["defense"],
+            "health": unit["stats"]["health"],
+            "speed": unit["stats"].get("speed", 5),
+            "element": unit.get("element"),
+            "morale": 1.0,
+        }
+        for unit in units
+    ]
+
+
+def load_oracles(directory: Path) -> list:
+    """Oracle names from the agent configs"""
+    names = []
+    for path in sorted(directory.glob("*.yaml")):
+        with open(path) as f:
+            names.append(yaml.safe_load(f)["name"])
+    return names
+
+
+def load_curve(path: Path) -> dict:
+    with open(path) as f:
+        return yaml.safe_load(f)["difficulty_curves"]["enemy_strength"]
+
+
+def parse_target(spec: str):
+    """'1:0.9,13:0.55' -> win-rate target per stage (linear in between)"""
+    points = sorted((int(k), float(v)) for k, v in (item.split(":") for item in spec.split(",")))
+    stages, rates = zip(*points)
+    return {stage: float(np.interp(stage, stages, rates)) for stage in STAGES}
+
+
+def compositions(units: list, stage: int, limit: int, rng: random.Random) -> list:
+    """(label, unit dicts) for a stage-`stage` player"""
+    core = next(u for u in units if u["name"] == CORE_UNIT)
+    rewards = [u for u in units if u["name"] != CORE_UNIT]
+
+    result = []
+    for combo in itertools.combinations_with_replacement(range(len(rewards)), stage - 1):
+        counts = Counter(combo)
+        army = [{**core, "quantity": CORE_QUANTITY}] + [
+            {**rewards[i], "quantity": REWARD_QUANTITY * n} for i, n in sorted(counts.items())
+        ]
+        label = "+".join(f"{rewards[i]['name']}x{REWARD_QUANTITY * n}" for i, n in sorted(counts.items()))
+        result.append((label or "core", army))
+
+    if len(result) > limit:
+        result = rng.sample(result, limit)
+    return result
+
+
+def simulate_cell(task: tuple) -> list:
+    """
+    One composition vs every oracle at one multiplier, as a single engine batch.
+    STEP: Battles are laid out oracle-major: (oracle, simulation).
+    """
+    stage, label, player_units, oracles, multiplier, simulations, seed = task
+
+    table = enemy_armies.current
+    enemies = [units_to_array(table.scaled(name, multiplier)) for name in oracles]
+    player = np.repeat(stack_armies([units_to_array(player_units)]), len(oracles) * simulations, axis=0)
+    enemy = np.repeat(stack_armies(enemies), simulations, axis=0)
+
+    engine = CombatEngine(player, enemy, seed=seed).run()
+    status = engine.status.reshape(len(oracles), simulations)
+    turns = engine.turns.reshape(len(oracles), simulations)
+    losses = engine.player_losses().reshape(len(oracles), simulations)
+
+    return [
+        {
+            "stage": stage,
+            "composition": label,
+            "oracle": name,
+            "multiplier": multiplier,
+            "battles": simulations,
+            "win_rate": round(float((status[i] == STATUS_VICTORY).mean()), 4),
+            "draw_rate": round(float((status[i] == STATUS_DRAW).mean()), 4),
+            "mean_turns": round(float(turns[i].mean()), 2),
+            "mean_player_losses": round(float(losses[i].mean()), 4),
+        }
+        for i, name in enumerate(oracles)
+    ]
+
+
+def suggest_curve(rows: list, target: dict) -> dict:
+    """
+    Multiplier per stage whose mean win rate (over compositions and oracles)
+    matches the target, interpolated in log-multiplier between grid points.
+    """
+    suggestion = {}
+    for stage in STAGES:
+        by_multiplier = {}
+        for row in rows:
+            if row["stage"] == stage:
+                by_multiplier.setdefault(row["multiplier"], []).append(row["win_rate"])
+        multipliers = sorted(by_multiplier)
+        # Win rate falls as the multiplier grows (smooth out sampling noise);
+        # np.interp wants increasing x, so both axes are reversed
+        rates = np.minimum.accumulate([float(np.mean(by_multiplier[m])) for m in multipliers])
+        value = np.interp(target[stage], rates[::-1], np.log(multipliers)[::-1])
+        clamped = not (min(rates) <= target[stage] <= max(rates))
+        suggestion[stage] = {"multiplier": round(float(np.exp(value)), 3), "clamped": clamped}
+    return suggestion
+
+
+def write_csv(path: Path, rows: list):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_outputs(out: Path, rows: list, oracles: list, suggestion: dict, curve: dict, target: dict):
+    out.mkdir(parents=True, exist_ok=True)
+    write_csv(out / "cells.csv", rows)
+
+    # (stage, multiplier) x oracle matrix of mean win rates over compositions
+    cells = {}
+    for row in rows:
+        cells.setdefault((row["stage"], row["multiplier"]), {}).setdefault(row["oracle"], []).append(row["win_rate"])
+    matrix = [
+        {"stage": stage, "multiplier": multiplier,
+         **{name: round(float(np.mean(by_oracle.get(name, [np.nan]))), 4) for name in oracles}}
+        for (stage, multiplier), by_oracle in sorted(cells.items())
+    ]
+    write_csv(out / "win_rate_matrix.csv", matrix)
+
+    try:
+        import pandas as pd
+        pd.DataFrame(rows).to_parquet(out / "cells.parquet", index=False)
+        pd.DataFrame(matrix).to_parquet(out / "win_rate_matrix.parquet", index=False)
+    except ImportError:
+        print("pandas/pyarrow not installed; Parquet output skipped")
+
+    with open(out / "suggested_curve.yaml", "w") as f:
+        yaml.safe_dump({
+            "enemy_strength": {stage: s["multiplier"] for stage, s in suggestion.items()},
+            "target_win_rate": {stage: round(rate, 3) for stage, rate in target.items()},
+            "current_enemy_strength": curve,
+        }, f, sort_keys=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--simulations", type=int, default=200, help="battles per (composition, oracle, multiplier)")
+    parser.add_argument("--multipliers", default=DEFAULT_MULTIPLIERS, help="enemy power multiplier grid")
+    parser.add_argument("--target", default="1:0.9,13:0.55", help="target win rate per stage")
+    parser.add_argument("--max-compositions", type=int, default=40, help="compositions sampled per stage")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", default="balance_results", help="output directory")
+    args = parser.parse_args()
+
+    configs = BACKEND / "configs"
+    units = load_units(configs / "game" / "army_units.yaml")
+    oracles = load_oracles(configs / "agents")
+    curve = load_curve(configs / "puzzles" / "difficulty_curves.yaml")
+    target = parse_target(args.target)
+    multipliers = [float(m) for m in args.multipliers.split(",")]
+
+    rng = random.Random(args.seed)
+    tasks = []
+    for stage in STAGES:
+        for label, army in compositions(units, stage, args.max_compositions, rng):
+            for multiplier in multipliers:
+                seed = zlib.crc32(f"{args.seed}:{stage}:{label}:{multiplier}".encode())
+                tasks.append((stage, label, army, oracles, multiplier, args.simulations, seed))
+
+    total = len(tasks) * len(oracles) * args.simulations
+    print(f"=== {len(tasks)} cells x {len(oracles)} oracles x {args.simulations} battles "
+          f"= {total:,} battles on {args.workers} workers ===")
+
+    rows = []
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(simulate_cell, task) for task in tasks]
+        for done, future in enumerate(as_completed(futures), 1):
+            rows.extend(future.result())
+            if done % max(1, len(futures) // 10) == 0:
+                elapsed = time.perf_counter() - started
+                print(f"{done}/{len(futures)} cells  {done * len(oracles) * args.simulations / elapsed:,.0f} battles/s")
+    elapsed = time.perf_counter() - started
+
+    rows.sort(key=lambda r: (r["stage"], r["composition"], r["oracle"], r["multiplier"]))
+    suggestion = suggest_curve(rows, target)
+    write_outputs(Path(args.out), rows, oracles, suggestion, curve, target)
+
+    print(f"\n{total:,} battles in {elapsed:.1f} s: {total / elapsed:,.0f} battles/s "
+          f"({total / elapsed / args.workers:,.0f} per worker)")
+    print("\nstage  target  suggested enemy_strength  (current curve)")
+    for stage in STAGES:
+        s = suggestion[stage]
+        note = "  (outside swept range)" if s["clamped"] else ""
+        current = curve.get(stage, "")
+        print(f"{stage:>5}  {target[stage]:6.2f}  {s['multiplier']:>24.3f}  {current!s:>15}{note}")
+    print(f"\nResults written to {args.out}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+scripts/bench_event_replay.py
+STEP: Event Replay Benchmark
+Measures how fast a game's state is rebuilt from its event log: reducer
+throughput, snapshot pack/unpack cost, and reconstruction from genesis versus
+from the nearest periodic snapshot (EVENT_SNAPSHOT_INTERVAL).
+
+By default a synthetic game history is generated (no database needed);
+pass --game-id to time GameEventService.reconstruct on a real game instead.
+
+Usage: python scripts/bench_event_replay.py [--events 5000] [--interval 50] [--game-id 12]
+"""
+import argparse
+import asyncio
+import copy
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from app.services.event_service import GameEventService, GameProjector, EventType
+from app.services.snapshot_service import SnapshotService
+
+ORACLE_NAMES = ["Chronos", "Nyx", "Proteus", "Aresion", "Athenaia", "Helios", "Boreas",
+                "Gaia", "Thalassa", "Erebus", "Astraea", "Morpheus", "Typhon"]
+
+
+def genesis_state() -> dict:
+    """Replay state of a freshly created game"""
+    return GameProjector.build_state(
+        1,
+        {"gold": 1000, "insight_tokens": 3, "oracles_defeated": 0, "current_stage": 1,
+         "weapons": ["Mortal Spear"], "potions": [], "world_state": {"alliances": [], "rule_changes": []},
+         "is_completed": False, "current_oracle_id": None, "last_save": None},
+        [{"oracle_id": i + 1, "is_defeated": False, "is_hostile": True, "current_phase": "locked",
+          "puzzle_state": {}, "battle_state": {}, "interactions_count": 0}
+         for i in range(len(ORACLE_NAMES))],
+        [{"oracle_name": name, "is_controlled": False} for name in ORACLE_NAMES],
+        [{"army_unit_id": 1, "quantity": 10, "total_health": 1000, "morale": 1.0}]
+    )
+
+
+def synthetic_events(count: int) -> list:
+    """A plausible mix of challenges, puzzles, battles, rule changes and saves"""
+    rng = random.Random(11)
+    events = []
+    version = 1
+    oracle_id = 0
+
+    def add(event_type, payload):
+        nonlocal version
+        version += 1
+        events.append((version, event_type, payload))
+
+    while len(events) < count:
+        oracle_id = oracle_id % len(ORACLE_NAMES) + 1
+        at = f"2026-01-01T00:{len(events) % 60:02d}:00+00:00"
+        add(EventType.ORACLE_CHALLENGED, {"oracle_id": oracle_id, "at": at})
+        for attempt in range(rng.randint(1, 3)):
+            add(EventType.PUZZLE_ATTEMPTED, {"oracle_id": oracle_id,
+                                             "patch": {"attempts": attempt + 1, "last_attempt": "guess"}})
+        add(EventType.BATTLE_STARTED, {"oracle_id": oracle_id, "battle_state": {
+            "battle_no": 1, "turn": 1, "player_health": 5000, "enemy_health": 600, "status": "in_progress"}})
+        for _ in range(rng.randint(3, 8)):
+            add(EventType.BATTLE_TURN, {"oracle_id": oracle_id, "player_damage": rng.randint(50, 150),
+                                        "enemy_damage": rng.randint(40, 120)})
+        add(EventType.RULE_CHANGED, {"rule_change": {"oracle": ORACLE_NAMES[oracle_id - 1],
+                                                     "rule": f"rule_{len(events)}", "turn": len(events)}})
+        add(EventType.GAME_SAVED, {"at": at})
+    return events[:count]
+
+
+def timed(fn, repeat: int) -> float:
+    """Best-of-`repeat` wall time in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_synthetic(event_count: int, interval: int, repeat: int):
+    genesis = genesis_state()
+    events = synthetic_events(event_count)
+
+    def from_genesis():
+        return GameEventService.replay(copy.deepcopy(genesis), events)
+
+    final = from_genesis()
+
+    # Nearest snapshot: the last multiple of `interval` before the head
+    snapshot_version = (final["version"] // interval) * interval
+    snapshot_state = GameEventService.replay(
+        copy.deepcopy(genesis), [e for e in events if e[0] <= snapshot_version]
+    )
+    snapshot_blob = SnapshotService.pack_document(snapshot_state)
+    tail = [e for e in events if e[0] > snapshot_version]
+
+    def from_snapshot():
+        return GameEventService.replay(SnapshotService.unpack_document(snapshot_blob), tail)
+
+    replay_all = timed(from_genesis, repeat)
+    pack = timed(lambda: SnapshotService.pack_document(final), repeat)
+    unpack = timed(lambda: SnapshotService.unpack_document(snapshot_blob), repeat)
+    nearest = timed(from_snapshot, repeat)
+
+    print(f"=== {event_count} events, snapshot every {interval} versions ===")
+    print(f"reducers     : {event_count / replay_all:12,.0f} events/s")
+    print(f"from genesis : {replay_all * 1000:9.2f} ms")
+    print(f"from snapshot: {nearest * 1000:9.2f} ms  ({len(tail)} tail events)")
+    print(f"snapshot     : {len(snapshot_blob) / 1024:9.1f} KiB  "
+          f"pack {pack * 1000:.2f} ms  unpack {unpack * 1000:.2f} ms")
+
+
+async def run_database(game_id: int, repeat: int):
+    from app.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        best = float("inf")
+        state = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            state = await GameEventService.reconstruct(db, game_id)
+            best = min(best, time.perf_counter() - started)
+            await db.rollback()
+
+    if state is None:
+        print(f"Game {game_id} has no event history")
+        return
+    print(f"game {game_id} @ version {state['version']}: reconstruct {best * 1000:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--events", type=int, default=5000, help="synthetic events to replay")
+    parser.add_argument("--interval", type=int, default=50, help="snapshot interval (versions)")
+    parser.add_argument("--repeat", type=int, default=5, help="best-of repetitions")
+    parser.add_argument("--game-id", type=int, help="reconstruct a real game instead")
+    args = parser.parse_args()
+
+    if args.game_id is not None:
+        asyncio.run(run_database(args.game_id, args.repeat))
+    else:
+        run_synthetic(args.events, args.interval, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+scripts/bench_game_snapshots.py
+STEP: Game Snapshot Format Benchmark
+Compares the msgpack + zstd snapshot codec against plain JSON and zlib-compressed
+JSON for size, encode time and decode time.
+
+By default a synthetic long-running game is generated (no database needed);
+pass --game-id to benchmark a real game instead.
+
+Usage: python scripts/bench_game_snapshots.py [--game-id 12] [--battles 200] [--repeat 20]
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from app.services.snapshot_service import SnapshotService, SNAPSHOT_SCHEMA_VERSION
+
+
+def synthetic_snapshot(battles: int) -> dict:
+    """A 13-oracle game with a long rule_changes list and `battles` battles of log"""
+    rng = random.Random(7)
+    now = datetime.now(timezone.utc)
+    oracle_names = ["Chronos", "Nyx", "Proteus", "Aresion", "Athenaia", "Helios", "Boreas",
+                    "Gaia", "Thalassa", "Erebus", "Astraea", "Morpheus", "Typhon"]
+
+    game = {
+        "id": 1, "player_id": 1, "current_stage": 9, "oracles_defeated": 8,
+        "gold": 4200, "insight_tokens": 5, "healing_draughts": 2,
+        "weapons": ["Mortal Spear", "Temporal Dagger", "Shadow Blade"],
+        "special_items": [], "potions": ["Basic Healing Draught"] * 3,
+        "is_active": True, "is_completed": False, "difficulty_level": "normal",
+        "world_state": {
+            "alliances": [],
+            "rule_changes": [
+                {"oracle": rng.choice(oracle_names), "rule": f"rule_{i}", "turn": i,
+                 "effect": {"modifier": rng.randint(-3, 3), "target": "army_speed"}}
+                for i in range(battles * 5)
+            ]
+        },
+        "active_events": [], "version": 120,
+        "created_at": now - timedelta(days=20), "last_save": now,
+    }
+    oracle_states = [
+        {"id": 100 + i, "game_state_id": 1, "oracle_id": i + 1, "is_defeated": i < 8,
+         "is_hostile": i >= 8, "current_phase": "battle",
+         "puzzle_state": {"attempts": rng.randint(1, 6), "solved": i < 8},
+         "battle_state": {"status": "victory", "turn": 12, "battle_no": 3},
+         "diplomatic_stance": 0.0, "version": 14, "defeated_at": now}
+        for i, name in enumerate(oracle_names)
+    ]
+    dominions = [
+        {"id": 200 + i, "game_state_id": 1, "name": f"{name} Domain", "oracle_name": name,
+         "is_controlled": i < 8, "is_accessible": True, "explored_areas": [], "hidden_secrets": []}
+        for i, name in enumerate(oracle_names)
+    ]
+    armies = [
+        {"id": 300 + i, "game_state_id": 1, "army_unit_id": i + 1, "quantity": 5 + i,
+         "total_health": 500 + i * 50, "morale": 1.0, "experience_level": 1, "is_deployed": False}
+        for i in range(10)
+    ]
+    battle_log = [
+        {"id": n, "oracle_state_id": 100 + rng.randrange(13), "battle_no": n // 40 + 1,
+         "turn": (n % 40) // 2 + 1, "event": 1 + n % 2, "value": rng.randint(5, 120)}
+        for n in range(battles * 40)
+    ]
+
+    def columnar(rows):
+        columns = list(rows[0])
+        return {"columns": columns, "rows": [[row[c] for c in columns] for row in rows]}
+
+    return {
+        "schema_version": SNAPSHOT_SCHEMA_VERSION, "game_id": 1, "player_id": 1, "version": 120,
+        "tables": {
+            "game_states": columnar([game]),
+            "oracle_states": columnar(oracle_states),
+            "dominion_states": columnar(dominions),
+            "player_armies": columnar(armies),
+            "battle_log_entries": columnar(battle_log),
+        }
+    }
+
+
+async def load_snapshot(game_id: int) -> dict:
+    from app.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        snapshot = await SnapshotService.dump_game(db, game_id)
+    if snapshot is None:
+        sys.exit(f"Game {game_id} not found")
+    return snapshot
+
+
+def json_dump(snapshot: dict) -> bytes:
+    return json.dumps(snapshot, default=str).encode()
+
+
+CODECS = {
+    "json": (json_dump, json.loads),
+    "json+zlib": (lambda s: zlib.compress(json_dump(s), 6), lambda b: json.loads(zlib.decompress(b))),
+    "msgpack+zstd": (SnapshotService.encode, SnapshotService.decode),
+}
+
+
+def measure(snapshot: dict, repeat: int):
+    for name, (encode, decode) in CODECS.items():
+        started = time.perf_counter()
+        for _ in range(repeat):
+            payload = encode(snapshot)
+        encode_ms = (time.perf_counter() - started) / repeat * 1000
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            decode(payload)
+        decode_ms = (time.perf_counter() - started) / repeat * 1000
+
+        print(f"{name:>13}: {len(payload) / 1024:9.1f} KiB  "
+              f"encode {encode_ms:7.2f} ms  decode {decode_ms:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark game snapshot encodings")
+    parser.add_argument("--game-id", type=int, help="benchmark a real game from the database")
+    parser.add_argument("--battles", type=int, default=200, help="battles in the synthetic game")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.game_id:
+        snapshot = asyncio.run(load_snapshot(args.game_id))
+    else:
+        snapshot = synthetic_snapshot(args.battles)
+
+    rows = sum(len(t["rows"]) for t in snapshot["tables"].values())
+    print(f"=== {rows} rows, {args.repeat} repetitions ===")
+    measure(snapshot, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
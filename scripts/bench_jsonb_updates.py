@@ -0,0 +1,127 @@
+"""
+scripts/bench_jsonb_updates.py
+STEP: JSONB Write Amplification Benchmark
+Compares appending to world_state.rule_changes by rewriting the whole document
+(the old JSON column path) against a targeted jsonb_set update, on a game whose
+rule_changes list is already large.
+
+Reports per-append latency, bytes sent to Postgres and WAL bytes generated.
+WAL numbers are cluster-wide, so run against an otherwise idle database.
+
+Usage: python scripts/bench_jsonb_updates.py [--rules 5000] [--appends 200]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from sqlalchemy import select, update, delete, text
+from app.database import AsyncSessionLocal, init_db
+from app.models.player import Player
+from app.models.game_state import GameState
+from app.services.game_service import GameService
+from app.cache.catalog import catalog_cache
+
+
+def make_rule_change(i: int) -> dict:
+    """A rule change shaped like an oracle's propose_rule_change output"""
+    return {
+        "oracle": "Proteus",
+        "rule": f"rule_{i}",
+        "effect": {"modifier": i % 7, "target": "army_speed"},
+        "turn": i
+    }
+
+
+async def wal_lsn(db) -> int:
+    result = await db.execute(text("SELECT pg_current_wal_lsn() - '0/0'::pg_lsn"))
+    return int(result.scalar_one())
+
+
+async def append_by_rewrite(db, game_id: int, rule_change: dict) -> int:
+    """Old path: read the whole document, append in Python, write it all back"""
+    result = await db.execute(select(GameState.world_state).where(GameState.id == game_id))
+    world_state = dict(result.scalar_one() or {})
+    world_state["rule_changes"] = list(world_state.get("rule_changes", [])) + [rule_change]
+    await db.execute(
+        update(GameState)
+        .where(GameState.id == game_id)
+        .values(world_state=world_state, version=GameState.version + 1)
+    )
+    await db.commit()
+    return len(json.dumps(world_state))
+
+
+async def append_by_jsonb(db, game_id: int, player_id: int, rule_change: dict) -> int:
+    """New path: GameService.record_rule_change (jsonb_set on the nested list)"""
+    await GameService.record_rule_change(db, game_id, player_id, rule_change)
+    return len(json.dumps(rule_change))
+
+
+async def run(mode: str, db, game_id: int, player_id: int, appends: int, offset: int):
+    wal_start = await wal_lsn(db)
+    sent = 0
+    started = time.perf_counter()
+    for i in range(appends):
+        rule_change = make_rule_change(offset + i)
+        if mode == "rewrite":
+            sent += await append_by_rewrite(db, game_id, rule_change)
+        else:
+            sent += await append_by_jsonb(db, game_id, player_id, rule_change)
+    elapsed = time.perf_counter() - started
+    wal_bytes = await wal_lsn(db) - wal_start
+
+    print(
+        f"{mode:>8}: {elapsed / appends * 1000:8.2f} ms/append  "
+        f"{sent / appends / 1024:9.1f} KiB sent/append  "
+        f"{wal_bytes / appends / 1024:9.1f} KiB WAL/append"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--rules", type=int, default=5000, help="pre-existing rule_changes")
+    parser.add_argument("--appends", type=int, default=200, help="appends per mode")
+    args = parser.parse_args()
+
+    await init_db()
+
+    async with AsyncSessionLocal() as db:
+        await catalog_cache.load(db)
+
+        suffix = uuid.uuid4().hex[:8]
+        player = Player(
+            username=f"bench_{suffix}",
+            email=f"bench_{suffix}@example.invalid",
+            hashed_password="!"
+        )
+        db.add(player)
+        await db.commit()
+
+        try:
+            game_state = await GameService.create_new_game(db, player.id)
+            world_state = dict(game_state.world_state or {})
+            world_state["rule_changes"] = [make_rule_change(i) for i in range(args.rules)]
+            await db.execute(
+                update(GameState).where(GameState.id == game_state.id).values(world_state=world_state)
+            )
+            await db.commit()
+            print(f"=== {args.rules} existing rule changes, {args.appends} appends per mode ===")
+
+            await run("rewrite", db, game_state.id, player.id, args.appends, args.rules)
+            db.expunge_all()
+            await run("jsonb", db, game_state.id, player.id, args.appends, args.rules + args.appends)
+        finally:
+            await db.rollback()
+            await db.execute(delete(Player).where(Player.id == player.id))
+            await db.commit()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+"""
+scripts/bench_validators.py
+STEP: Schema Validation Benchmark
+Times puzzle and agent-action validation three ways: a fresh
+jsonschema.validate per call (the old path), the registry's cached jsonschema
+validator, and the registry's compiled fast path. Also checks that the fast
+path agrees with jsonschema on valid and corrupted instances.
+
+Usage: python scripts/bench_validators.py [--instances 2000] [--repeat 5]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+import jsonschema
+
+from app.puzzles.generators import generate_puzzle, PUZZLE_GENERATORS
+from app.utils.validators import SchemaRegistry
+
+CORRUPTIONS = (
+    lambda data: data.pop(next(iter(data))),
+    lambda data: data.update(difficulty=0),
+    lambda data: data.update(solution=42),
+    lambda data: data.update(sequence="1, 2, 3"),
+    lambda data: data.update(parameters=[]),
+)
+
+
+def instances(count: int, rng: random.Random) -> list:
+    """(schema name, instance) pairs: procedural puzzles, agent actions, ~1 in 4 corrupted"""
+    types = list(PUZZLE_GENERATORS)
+    pairs = []
+    for i in range(count):
+        if i % 3 == 2:
+            data = {"action_type": rng.choice(["attack", "negotiate", "rewind"]),
+                    "target": "player", "parameters": {"strength": rng.randint(1, 9)}}
+            name = "agent_action"
+        else:
+            puzzle_type = rng.choice(types)
+            data = generate_puzzle(puzzle_type, rng.randint(1, 13), seed=i)
+            name = f"puzzle:{puzzle_type}" if i % 3 else "puzzle"
+        if rng.random() < 0.25:
+            rng.choice(CORRUPTIONS)(data)
+        pairs.append((name, data))
+    return pairs
+
+
+def timed(fn, repeat: int) -> float:
+    """Best-of-`repeat` wall time in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[2])
+    parser.add_argument("--instances", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    registry = SchemaRegistry().load()
+    print(f"Compiled {len(registry)} schemas in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    pairs = instances(args.instances, random.Random(7))
+    schemas = {name: registry._validators[name].schema for name, _ in pairs}
+
+    expected = [registry._validators[name].is_valid(data) for name, data in pairs]
+    fast = [registry.is_valid(name, data) for name, data in pairs]
+    mismatches = sum(a != b for a, b in zip(expected, fast))
+    print(f"{len(pairs)} instances, {expected.count(False)} invalid, fast-path mismatches: {mismatches}")
+
+    def per_call_validate():
+        for name, data in pairs:
+            try:
+                jsonschema.validate(instance=data, schema=schemas[name])
+            except jsonschema.exceptions.ValidationError:
+                pass
+
+    def cached_validator():
+        for name, data in pairs:
+            registry._validators[name].is_valid(data)
+
+    def fast_path():
+        for name, data in pairs:
+            registry.is_valid(name, data)
+
+    def error_paths():
+        for name, data in pairs:
+            registry.errors(name, data)
+
+    baseline = None
+    print(f"{'method':<28}{'us/instance':>12}{'speedup':>10}")
+    for label, fn in (("jsonschema.validate", per_call_validate),
+                      ("cached validator", cached_validator),
+                      ("registry fast path", fast_path),
+                      ("registry error paths", error_paths)):
+        seconds = timed(fn, args.repeat)
+        baseline = baseline or seconds
+        print(f"{label:<28}{seconds / len(pairs) * 1e6:>12.2f}{baseline / seconds:>9.1f}x")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
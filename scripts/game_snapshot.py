@@ -0,0 +1,73 @@
+"""
+scripts/game_snapshot.py
+STEP: Game Snapshot CLI
+Export a game to a msgpack + zstd snapshot file, or import one as a new game.
+
+Usage:
+    python scripts/game_snapshot.py export GAME_ID -o game.snapshot
+    python scripts/game_snapshot.py import game.snapshot --player-id 42
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
+
+from app.database import AsyncSessionLocal
+from app.services.snapshot_service import SnapshotService, SnapshotDecoder
+
+CHUNK_SIZE = 1024 * 1024
+
+
+async def export_game(game_id: int, output: Path):
+    async with AsyncSessionLocal() as db:
+        snapshot = await SnapshotService.dump_game(db, game_id)
+    
+    if snapshot is None:
+        sys.exit(f"Game {game_id} not found")
+    
+    size = 0
+    with output.open("wb") as f:
+        for chunk in SnapshotService.iter_encode(snapshot):
+            f.write(chunk)
+            size += len(chunk)
+    print(f"✓ Exported game {game_id} to {output} ({size} bytes)")
+
+
+async def import_game(path: Path, player_id: int):
+    decoder = SnapshotDecoder()
+    with path.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            decoder.feed(chunk)
+    snapshot = decoder.finish()
+    
+    async with AsyncSessionLocal() as db:
+        game_id = await SnapshotService.import_game(db, snapshot, player_id)
+        await db.commit()
+    print(f"✓ Imported {path} as game {game_id} for player {player_id}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export / import game snapshots")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    export_cmd = commands.add_parser("export", help="write a game to a snapshot file")
+    export_cmd.add_argument("game_id", type=int)
+    export_cmd.add_argument("-o", "--output", type=Path)
+    
+    import_cmd = commands.add_parser("import", help="create a new game from a snapshot file")
+    import_cmd.add_argument("path", type=Path)
+    import_cmd.add_argument("--player-id", type=int, required=True)
+    
+    args = parser.parse_args()
+    if args.command == "export":
+        output = args.output or Path(f"game-{args.game_id}.snapshot")
+        asyncio.run(export_game(args.game_id, output))
+    else:
+        asyncio.run(import_game(args.path, args.player_id))
+
+
+if __name__ == "__main__":
+    main()